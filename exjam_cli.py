@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+ExJAM Toolchain Command-Line Interface
+
+This script is the single entry point for the alumni analysis and registration tools, so
+production runs can be scripted and tuned from the command line.
+
+Examples:
+    python exjam_cli.py analyze alumni_survey.parquet --workers 4 --format svg
+    python exjam_cli.py analyze new_responses.csv --append
+    python exjam_cli.py export --credentials credentials.json --form-id FORM_ID --incremental
+    python exjam_cli.py export --credentials credentials.json --form-id FORM_A FORM_B FORM_C --concurrency 8
+    python exjam_cli.py events events.json --credentials credentials.json --output registrations --incremental
+    python exjam_cli.py report registrations --event PGC25
+    python exjam_cli.py badges registrations --layout 2x4
+    python exjam_cli.py badges participants.csv --workers 8 --batch-size 50 --cache-dir code_cache
+    python exjam_cli.py codes --count 100 --format drawing
+    python exjam_cli.py report registration_responses.parquet
+    python exjam_cli.py checkin registrations.parquet --host 0.0.0.0 --port 8765
+    python exjam_cli.py --metrics metrics.prom --profile badges.prof badges participants.csv
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'tools', 'data-collection'))
+sys.path.insert(0, os.path.join(ROOT_DIR, 'tools', 'analysis'))
+
+from instrumentation import LOG_FORMATS, METRICS, PROFILERS, configure_logging, profile
+
+# Google Forms API root (mirrors async_forms_client, which is only imported by the export command)
+FORMS_API_URL = 'https://forms.googleapis.com/v1'
+
+# Hot-path timers listed in the timing summary
+SUMMARY_TIMERS = 8
+
+
+class PhaseTimer:
+    def __init__(self, command):
+        """
+        Record wall-clock time per phase of a subcommand.
+        
+        Args:
+            command (str): Subcommand name shown in the summary
+        """
+        self.command = command
+        self.phases = []
+        self.start = time.perf_counter()
+    
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+    
+    def print_summary(self):
+        """Print the time spent in each phase and in total."""
+        total = time.perf_counter() - self.start
+        print(f"\nTiming summary ({self.command}):")
+        for name, seconds in self.phases:
+            print(f"  {name:<24} {seconds:8.2f}s")
+        print(f"  {'total':<24} {total:8.2f}s")
+        
+        hot_paths = METRICS.summary(SUMMARY_TIMERS)
+        if hot_paths:
+            print("Hot paths (calls, total, mean):")
+            for name, calls, seconds, mean in hot_paths:
+                print(f"  {name:<48} {calls:8d} {seconds:8.2f}s {mean * 1000:9.2f}ms")
+
+
+def load_participants(file_path):
+    """
+    Load participant records from a JSON list, a CSV, Parquet or Feather file, or an events dataset.
+    
+    Rows of an events dataset are mapped onto the badge fields and keep
+    their ``event_code``.
+    
+    Args:
+        file_path (str): Participants file or dataset directory
+    
+    Returns:
+        list: Participant dictionaries
+    """
+    if file_path.lower().endswith('.json'):
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    
+    from columnar_storage import read_table
+    if os.path.isdir(file_path):
+        from event_exports import participant_records, register_dataset_events
+        register_dataset_events(file_path)
+        return participant_records(read_table(file_path))
+    
+    df = read_table(file_path)
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def group_by_event(records, events=None):
+    """
+    Group records by their ``event_code``, keeping only the requested events.
+    
+    Records without an event code belong to the first requested event (or
+    the default event).
+    
+    Args:
+        records (list): Participant or registration dictionaries
+        events (list): Event codes to keep (None keeps every event)
+    
+    Returns:
+        dict: Records per event code, in first-seen order
+    """
+    from qr_payload import DEFAULT_EVENT_CODE
+    
+    default = events[0] if events else DEFAULT_EVENT_CODE
+    groups = {}
+    for record in records:
+        groups.setdefault(record.get('event_code') or default, []).append(record)
+    return {code: group for code, group in groups.items() if not events or code in events}
+
+
+def cmd_analyze(args, timer):
+    """Run the alumni analyses, charts, report and JSON results."""
+    from alumni_analysis import STATE_FILE, AlumniAnalyzer
+    
+    analyzer = AlumniAnalyzer()
+    
+    if args.append:
+        state_file = os.path.join(args.output_dir, STATE_FILE)
+        if not os.path.exists(state_file):
+            print(f"--append needs the analysis state of an earlier run ({state_file} not found); "
+                  "run analyze on the full data first", file=sys.stderr)
+            return 2
+        with timer.phase('analyze (append)'):
+            if not analyzer.append_data(args.input, state_file):
+                return 1
+    elif args.stream:
+        with timer.phase('analyze (streaming)'):
+            if not analyzer.analyze_stream(args.input, chunk_size=args.batch_size):
+                return 1
+    else:
+        with timer.phase('load'):
+            analyzer.load_data(args.input)
+        if analyzer.data is None:
+            return 1
+        with timer.phase('analyze'):
+            analyzer.run_all()
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    if not args.no_charts:
+        with timer.phase('charts'):
+            analyzer.generate_visualizations(os.path.join(args.output_dir, 'charts'), dpi=args.dpi,
+                                             chart_format=args.format, workers=args.workers)
+    
+    with timer.phase('report'):
+        analyzer.generate_report(os.path.join(args.output_dir, 'alumni_analysis_report.md'))
+        analyzer.save_results(os.path.join(args.output_dir, 'analysis_results.json'))
+    
+    return 0
+
+
+def cmd_export(args, timer):
+    """Export Google Form responses to CSV."""
+    from enhanced_registration_module import EnhancedExjamRegistrationModule
+    
+    if not args.credentials and args.api_url == FORMS_API_URL:
+        print("--credentials is required unless --api-url points to a stub server", file=sys.stderr)
+        return 2
+    
+    with timer.phase('authenticate'):
+        registration = EnhancedExjamRegistrationModule(credentials_file=args.credentials)
+    
+    if len(args.form_id) > 1:
+        if args.convert or args.explode:
+            print("--convert and --explode apply to single-form exports only", file=sys.stderr)
+            return 2
+        with timer.phase('export'):
+            exported = registration.export_forms_to_csv(args.form_id, args.output, incremental=args.incremental,
+                                                        page_size=args.batch_size, schema_cache_dir=args.cache_dir,
+                                                        concurrency=args.concurrency, base_url=args.api_url)
+        return 0 if len(exported) == len(args.form_id) else 1
+    
+    with timer.phase('export'):
+        output_file = registration.export_responses_to_csv(args.form_id[0], args.output, incremental=args.incremental,
+                                                           page_size=args.batch_size,
+                                                           schema_cache_dir=args.cache_dir)
+    
+    if output_file and args.convert:
+        from columnar_storage import REGISTRATION_CATEGORICAL_COLUMNS, convert_table
+        with timer.phase('convert'):
+            convert_table(output_file, args.convert, REGISTRATION_CATEGORICAL_COLUMNS)
+    
+    if output_file and args.explode:
+        from columnar_storage import read_table, write_table
+        from multi_select import explode_answers
+        with timer.phase('explode checkbox answers'):
+            write_table(explode_answers(read_table(output_file)), args.explode)
+    
+    return 0 if output_file else 1
+
+
+def cmd_events(args, timer):
+    """Export several events' forms concurrently into a dataset partitioned by event."""
+    from event_exports import export_events, load_events
+    
+    if not args.credentials and args.api_url == FORMS_API_URL:
+        print("--credentials is required unless --api-url points to a stub server", file=sys.stderr)
+        return 2
+    
+    events = load_events(args.config)
+    
+    credentials = None
+    if args.credentials:
+        from enhanced_registration_module import EnhancedExjamRegistrationModule
+        with timer.phase('authenticate'):
+            credentials = EnhancedExjamRegistrationModule(credentials_file=args.credentials).credentials
+    
+    with timer.phase('export and merge'):
+        results = export_events(events, args.output, credentials, incremental=args.incremental,
+                                page_size=args.batch_size, schema_cache_dir=args.cache_dir,
+                                base_url=args.api_url, concurrency=args.concurrency)
+    
+    failed = False
+    for code, result in results.items():
+        if isinstance(result, Exception):
+            print(f"Event {code}: export failed: {result}")
+            failed = True
+        elif not result:
+            print(f"Event {code}: no responses found.")
+        else:
+            print(f"Event {code}: {result} registrations")
+    print(f"Dataset written to {args.output}/")
+    
+    return 1 if failed else 0
+
+
+def cmd_badges(args, timer):
+    """Generate participant badges, one PDF each or as a multi-badge sheet (one sheet per event)."""
+    from checkin_service import assigned_ids_path, load_assigned_ids, registration_key, save_assigned_ids
+    from enhanced_registration_module import EnhancedExjamRegistrationModule
+    
+    with timer.phase('load participants'):
+        participants = load_participants(args.input)
+        assigned = load_assigned_ids(args.input)
+    print(f"Loaded {len(participants)} participants from {args.input}")
+    
+    # Participants without a registration ID keep the one assigned on an earlier run; new IDs are
+    # recorded next to the input before any badge is rendered, so check-in can resolve every badge
+    selected = [participant for group in group_by_event(participants, args.event).values() for participant in group]
+    unassigned = []
+    identified = []
+    for participant in selected:
+        if not participant.get('registration_id'):
+            key = registration_key(participant)
+            if key is None:
+                continue
+            if key in assigned:
+                participant['registration_id'] = assigned[key]
+            else:
+                unassigned.append(participant)
+        identified.append(participant)
+    unidentified = len(selected) - len(identified)
+    if unidentified:
+        print(f"Skipped {unidentified} participants without a registration ID, response ID, email or name")
+    if unassigned:
+        allocator = EnhancedExjamRegistrationModule(payload_key_file=args.key)
+        for participant, registration_id in zip(unassigned, allocator.allocate_ids(len(unassigned))):
+            participant['registration_id'] = registration_id
+        save_assigned_ids(args.input, unassigned)
+        print(f"Assigned {len(unassigned)} registration IDs (saved to {assigned_ids_path(args.input)})")
+    
+    failed = unidentified > 0
+    groups = group_by_event(identified, args.event)
+    for event_code, event_participants in groups.items():
+        registration = EnhancedExjamRegistrationModule(cache_dir=args.cache_dir, cache_size=args.cache_size,
+                                                       code_format=args.format, qr_payload_format=args.payload,
+                                                       payload_key_file=args.key, event_code=event_code,
+                                                       badge_renderer=args.renderer)
+        sheet_filename = f"badge_sheet_{event_code}.pdf" if len(groups) > 1 else "badge_sheet.pdf"
+        
+        with timer.phase(f"render badges ({event_code})" if len(groups) > 1 else 'render badges'):
+            registration.generate_bulk_badges(event_participants, workers=args.workers, chunk_size=args.batch_size,
+                                              layout=args.layout, save_code_images=args.save_code_images,
+                                              sheet_filename=sheet_filename)
+        failed = failed or bool(registration.bulk_badge_failures)
+    
+    return 1 if failed else 0
+
+
+def cmd_codes(args, timer):
+    """Generate registration QR codes and barcodes for existing or new registration IDs."""
+    from enhanced_registration_module import CODE_FILE_EXTENSIONS, EnhancedExjamRegistrationModule
+    
+    registration = EnhancedExjamRegistrationModule(cache_dir=args.cache_dir, cache_size=args.cache_size,
+                                                   qr_payload_format=args.payload, payload_key_file=args.key)
+    
+    registration_ids = list(args.ids)
+    if args.input:
+        registration_ids += [participant['registration_id'] for participant in load_participants(args.input)
+                             if participant.get('registration_id')]
+    registration_ids += registration.allocate_ids(args.count)
+    
+    if not registration_ids:
+        print("No registration IDs given. Pass IDs, --input or --count.")
+        return 1
+    
+    with timer.phase('render codes'):
+        for index, registration_id in enumerate(registration_ids, 1):
+            codes = registration.render_registration_codes(registration_id, args.form_url, args.format)
+            registration.save_registration_codes(registration_id, codes)
+            if index % args.batch_size == 0 or index == len(registration_ids):
+                print(f"Code progress: {index}/{len(registration_ids)}")
+    
+    print(f"Generated {len(registration_ids)} QR codes in {registration.qr_codes_dir}/ and "
+          f"barcodes in {registration.barcodes_dir}/ (.{CODE_FILE_EXTENSIONS[args.format]})")
+    
+    stats = registration.cache_stats()
+    if stats:
+        print(f"Code cache: {stats['hits']} hits, {stats['misses']} misses")
+    
+    return 0
+
+
+def cmd_report(args, timer):
+    """Generate the registration report from exported responses, one report per event of a dataset."""
+    from enhanced_registration_module import EnhancedExjamRegistrationModule
+    from qr_payload import DEFAULT_EVENT_CODE
+    
+    if not os.path.isdir(args.input):
+        registration = EnhancedExjamRegistrationModule(event_code=args.event[0] if args.event else DEFAULT_EVENT_CODE)
+        with timer.phase('report'):
+            output_file = registration.generate_comprehensive_report(args.input, args.output)
+        return 0 if output_file else 1
+    
+    from columnar_storage import dataset_partitions
+    from event_exports import register_dataset_events
+    
+    register_dataset_events(args.input)
+    event_codes = args.event or list(dataset_partitions(args.input))
+    stem, extension = os.path.splitext(args.output)
+    
+    failed = not event_codes
+    for event_code in event_codes:
+        registration = EnhancedExjamRegistrationModule(event_code=event_code)
+        output_file = args.output if len(event_codes) == 1 else f"{stem}_{event_code}{extension}"
+        with timer.phase(f"report ({event_code})"):
+            failed = not registration.generate_comprehensive_report(args.input, output_file) or failed
+    
+    return 1 if failed else 0
+
+
+def cmd_checkin(args, timer):
+    """Run the offline check-in service until interrupted."""
+    import asyncio
+    from checkin_service import CheckInService, RegistrationIndex, load_codec
+    
+    with timer.phase('load registrations'):
+        index = RegistrationIndex.load(args.input)
+    
+    service = CheckInService(index, args.log, load_codec(args.key))
+    with timer.phase('serve'):
+        try:
+            asyncio.run(service.serve(args.host, args.port))
+        except KeyboardInterrupt:
+            print(f"\nCheck-in service stopped after {service.scans} scans ({len(service.checked_in)} checked in)")
+    
+    return 0
+
+
+def positive_int(value):
+    """Parse a command-line count that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def build_parser():
+    """Build the argument parser with one subparser per subcommand."""
+    parser = argparse.ArgumentParser(description="ExJAM alumni analysis and registration toolchain",
+                                     formatter_class=argparse.RawDescriptionHelpFormatter,
+                                     epilog=__doc__.split('Examples:')[1])
+    parser.add_argument('--metrics', help='Write timers, counters and histograms to this file '
+                                           '(Prometheus text for .prom/.txt, JSON otherwise)')
+    parser.add_argument('--profile', help='Profile the run and save the profile to this file')
+    parser.add_argument('--profiler', choices=PROFILERS, default='cprofile',
+                        help='cProfile (pstats output) or low-overhead stack sampling (collapsed stacks)')
+    parser.add_argument('--log-level', default='INFO', help='Minimum level of progress and per-item log messages')
+    parser.add_argument('--log-format', choices=LOG_FORMATS, default='text', help='Log output format')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    analyze = subparsers.add_parser('analyze', help='Analyze alumni survey data')
+    analyze.add_argument('input', help='Alumni data file (CSV, Parquet or Feather)')
+    analyze.add_argument('--output-dir', default='output', help='Directory for charts, report and results')
+    analyze.add_argument('--workers', type=int, default=None, help='Chart rendering processes')
+    analyze.add_argument('--batch-size', type=positive_int, default=100000, help='Rows per chunk with --stream')
+    analyze.add_argument('--stream', action='store_true', help='Analyze in chunks with bounded memory')
+    analyze.add_argument('--append', action='store_true',
+                         help='Add the input rows to the analysis state saved in --output-dir by an earlier run')
+    analyze.add_argument('--format', choices=['png', 'svg', 'preview'], default='png', help='Chart format')
+    analyze.add_argument('--dpi', type=positive_int, default=300, help='Chart resolution for PNG output')
+    analyze.add_argument('--no-charts', action='store_true', help='Skip chart rendering')
+    analyze.set_defaults(handler=cmd_analyze)
+    
+    export = subparsers.add_parser('export', help='Export Google Form responses to CSV')
+    export.add_argument('--credentials', help='Google API credentials file')
+    export.add_argument('--form-id', required=True, nargs='+',
+                        help='Google Form ID; several IDs are exported concurrently, one CSV each')
+    export.add_argument('--output', default='registration_responses.csv',
+                        help='Output CSV file (suffixed with the form ID when exporting several forms)')
+    export.add_argument('--incremental', action='store_true', help='Append only responses since the last export')
+    export.add_argument('--batch-size', type=positive_int, default=5000, help='Responses requested per page')
+    export.add_argument('--cache-dir', default='form_schema_cache', help='Form schema cache directory')
+    export.add_argument('--concurrency', type=positive_int, default=8,
+                        help='API requests in flight when exporting several forms')
+    export.add_argument('--api-url', default=FORMS_API_URL,
+                        help='Forms API root for multi-form exports (e.g. a local stub server)')
+    export.add_argument('--convert', help='Also write the export as Parquet or Feather (e.g. responses.parquet)')
+    export.add_argument('--explode', help='Also write checkbox answers as a long table, one row per chosen option')
+    export.set_defaults(handler=cmd_export)
+    
+    events = subparsers.add_parser('events', help='Export several events into a dataset partitioned by event')
+    events.add_argument('config', help='JSON list of events (code, form_id, event, date, venue, ...)')
+    events.add_argument('--credentials', help='Google API credentials file')
+    events.add_argument('--output', default='registrations', help='Dataset directory')
+    events.add_argument('--incremental', action='store_true', help='Fetch only responses since the last export')
+    events.add_argument('--batch-size', type=positive_int, default=5000, help='Responses requested per page')
+    events.add_argument('--cache-dir', default='form_schema_cache', help='Form schema cache directory')
+    events.add_argument('--concurrency', type=positive_int, default=8, help='API requests in flight')
+    events.add_argument('--api-url', default=FORMS_API_URL, help='Forms API root (e.g. a local stub server)')
+    events.set_defaults(handler=cmd_events)
+    
+    badges = subparsers.add_parser('badges', help='Generate participant badges')
+    badges.add_argument('input', help='Participants file (JSON, CSV, Parquet or Feather) or events dataset')
+    badges.add_argument('--event', action='append', help='Event code (repeat to select several from a dataset)')
+    badges.add_argument('--workers', type=int, default=1, help='Worker processes (0 uses all CPUs)')
+    badges.add_argument('--batch-size', type=positive_int, default=25, help='Participants per worker chunk')
+    badges.add_argument('--layout', choices=['2x2', '2x4'], help='Write one multi-badge sheet instead')
+    badges.add_argument('--cache-dir', help='QR code and barcode cache directory')
+    badges.add_argument('--cache-size', type=int, default=10000, help='Maximum cached code images')
+    badges.add_argument('--format', choices=['png', 'drawing'], default='png', help='Code format embedded in badges')
+    badges.add_argument('--renderer', choices=['canvas', 'platypus'], default='canvas',
+                        help='Draw badges from a precomputed layout (canvas) or with platypus flowables')
+    badges.add_argument('--save-code-images', action='store_true', help='Also write the code images to disk')
+    badges.add_argument('--payload', choices=['compact', 'json'], default='compact', help='QR payload format')
+    badges.add_argument('--key', default='qr_payload.key', help='Signing key for compact QR payloads')
+    badges.set_defaults(handler=cmd_badges)
+    
+    codes = subparsers.add_parser('codes', help='Generate registration QR codes and barcodes')
+    codes.add_argument('ids', nargs='*', help='Registration IDs')
+    codes.add_argument('--input', help='Participants file with a registration_id column')
+    codes.add_argument('--count', type=int, default=0, help='Also generate codes for this many new IDs')
+    codes.add_argument('--form-url', help='Form URL embedded in JSON QR payloads')
+    codes.add_argument('--batch-size', type=positive_int, default=100, help='Codes between progress updates')
+    codes.add_argument('--cache-dir', help='QR code and barcode cache directory')
+    codes.add_argument('--cache-size', type=int, default=10000, help='Maximum cached code images')
+    codes.add_argument('--format', choices=['png', 'svg', 'drawing'], default='png', help='Code output format')
+    codes.add_argument('--payload', choices=['compact', 'json'], default='compact', help='QR payload format')
+    codes.add_argument('--key', default='qr_payload.key', help='Signing key for compact QR payloads')
+    codes.set_defaults(handler=cmd_codes)
+    
+    report = subparsers.add_parser('report', help='Generate the registration report')
+    report.add_argument('input', help='Registration responses (CSV, Parquet or Feather) or events dataset')
+    report.add_argument('--event', action='append', help='Event code (repeat to select several from a dataset)')
+    report.add_argument('--output', default='comprehensive_registration_report.md',
+                        help='Output report file (suffixed with the event code for several events)')
+    report.set_defaults(handler=cmd_report)
+    
+    checkin = subparsers.add_parser('checkin', help='Run the offline venue check-in service')
+    checkin.add_argument('input', help='Registrations file (JSON, CSV, Parquet or Feather)')
+    checkin.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    checkin.add_argument('--port', type=int, default=8765, help='TCP port')
+    checkin.add_argument('--log', default='checkins.jsonl', help='Append-only check-in log')
+    checkin.add_argument('--key', default='qr_payload.key', help='Signing key used for the badge QR codes')
+    checkin.set_defaults(handler=cmd_checkin)
+    
+    return parser
+
+
+def main():
+    """Parse the command line and run the selected subcommand."""
+    args = build_parser().parse_args()
+    rate_limit = configure_logging(args.log_level, args.log_format)
+    timer = PhaseTimer(args.command)
+    
+    try:
+        with profile(args.profile, args.profiler):
+            status = args.handler(args, timer)
+    finally:
+        for message, suppressed in rate_limit.pending().items():
+            print(f"Suppressed {suppressed} log messages like: {message}")
+        timer.print_summary()
+        if args.metrics:
+            print(f"Metrics saved to {METRICS.write(args.metrics)}")
+    
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
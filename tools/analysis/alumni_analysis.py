@@ -5,41 +5,346 @@ Exjam Alumni Data Analysis Tool
 This script provides functions for analyzing alumni survey data and generating insights.
 """
 
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import json
 import os
+import sys
+import time
+
+# pandas, numpy and matplotlib are imported by the code that uses them, so the
+# module (and any CLI built on it) starts quickly
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+from columnar_storage import iter_table_chunks, read_table, write_table
+from instrumentation import timed
+
+# Education impact rating columns (1-5 scale)
+IMPACT_COLUMNS = [
+    'technical_skills_impact',
+    'problem_solving_impact',
+    'networking_impact',
+    'industry_knowledge_impact',
+    'confidence_impact'
+]
+
+# Columns read by the analyses, charts and report
+ANALYSIS_COLUMNS = [
+    'graduation_year',
+    'program',
+    'industry',
+    'location',
+    'employment_type',
+    'jobs_since_graduation',
+    'years_in_current_role',
+    'has_leadership',
+    'connection_level',
+    'mentorship_interest',
+    'would_recommend'
+] + IMPACT_COLUMNS
+
+# Columns summarized by value counts in the analyses
+COUNTED_COLUMNS = [
+    'graduation_year',
+    'program',
+    'industry',
+    'location',
+    'employment_type',
+    'years_in_current_role',
+    'has_leadership',
+    'connection_level',
+    'mentorship_interest',
+    'would_recommend'
+]
+
+# Repetitive survey answers stored as categoricals
+CATEGORICAL_COLUMNS = [
+    'graduation_year',
+    'program',
+    'industry',
+    'location',
+    'employment_type',
+    'connection_level',
+    'mentorship_interest',
+    'would_recommend'
+]
+
+# Incremental analysis state, saved next to analysis_results.json
+STATE_FILE = 'analysis_state.json'
+
+# Version of the saved incremental state layout
+STATE_VERSION = 1
+
+# Chart output modes as (file format, dpi override, tight bounding box)
+CHART_FORMATS = {
+    'png': ('png', None, True),
+    'svg': ('svg', None, True),
+    'preview': ('png', 72, False)
+}
+
+
+def _pyplot():
+    """Import pyplot on the non-interactive Agg backend."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _plot_graduation_years(graduation_years):
+    """Draw the graduation year distribution."""
+    import pandas as pd
+    plt = _pyplot()
+    plt.figure(figsize=(12, 6))
+    pd.Series(graduation_years, dtype=float).sort_index().plot(kind='bar')
+    plt.title('Alumni Distribution by Graduation Year')
+    plt.xlabel('Graduation Year')
+    plt.ylabel('Number of Alumni')
+    plt.xticks(rotation=45)
+
+
+def _plot_industries(industries):
+    """Draw the top 10 industries."""
+    import pandas as pd
+    plt = _pyplot()
+    plt.figure(figsize=(12, 8))
+    pd.Series(industries, dtype=float).head(10).plot(kind='barh')
+    plt.title('Top 10 Industries for Exjam Alumni')
+    plt.xlabel('Number of Alumni')
+
+
+def _plot_education_impact(impact_means):
+    """Draw the average education impact ratings."""
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    impact_labels = [col.replace('_impact', '').replace('_', ' ').title() for col in impact_means]
+    
+    plt.bar(impact_labels, list(impact_means.values()))
+    plt.title('Average Impact of Exjam Education (1-5 Scale)')
+    plt.ylabel('Average Rating')
+    plt.ylim(0, 5)
+    plt.xticks(rotation=45)
+
+
+def _plot_connection_levels(connection_levels):
+    """Draw the network connection levels."""
+    import pandas as pd
+    plt = _pyplot()
+    plt.figure(figsize=(8, 6))
+    pd.Series(connection_levels, dtype=float).plot(kind='pie', autopct='%1.1f%%')
+    plt.title('Alumni Network Connection Levels')
+    plt.ylabel('')
+
+
+CHART_PLOTTERS = {
+    'graduation_year_distribution': _plot_graduation_years,
+    'industry_distribution': _plot_industries,
+    'education_impact_ratings': _plot_education_impact,
+    'connection_levels': _plot_connection_levels
+}
+
+
+def _init_chart_worker():
+    """Apply the shared plot style in a chart-rendering process."""
+    _pyplot().style.use('seaborn-v0_8')
+
+
+def _render_chart(name, aggregates, output_dir, dpi=300, chart_format='png'):
+    """
+    Render one chart from precomputed aggregates and save it.
+    
+    Module-level so it can run in a worker process; it only receives the
+    small aggregate needed for its chart, never the survey DataFrame.
+    
+    Args:
+        name (str): Chart name from CHART_PLOTTERS (also the file name)
+        aggregates: Data passed to the chart's plot function
+        output_dir (str): Directory to save the chart
+        dpi (int): Output resolution for raster formats
+        chart_format (str): One of CHART_FORMATS
+    
+    Returns:
+        tuple: (saved file path, render seconds)
+    """
+    start = time.perf_counter()
+    plt = _pyplot()
+    file_format, preview_dpi, tight = CHART_FORMATS[chart_format]
+    output_file = f'{output_dir}/{name}.{file_format}'
+    
+    CHART_PLOTTERS[name](aggregates)
+    plt.tight_layout()
+    plt.savefig(output_file, dpi=preview_dpi or dpi, format=file_format, bbox_inches='tight' if tight else None)
+    plt.close()
+    
+    return output_file, time.perf_counter() - start
+
+
+class AnalysisState:
+    def __init__(self):
+        """
+        Mergeable accumulators behind the streaming and incremental analyses.
+        
+        Holds value counts, Welford mean/variance and approximate medians,
+        all of which can be updated with new rows, merged with another state
+        and saved as JSON without keeping any survey rows.
+        """
+        from streaming_stats import RunningStats, ValueCounter
+        
+        self.total = 0
+        self.counters = {col: ValueCounter() for col in COUNTED_COLUMNS}
+        self.jobs = RunningStats()
+        self.impact_stats = {}
+        self.impact_medians = {}
+    
+    def update(self, chunk):
+        """
+        Add a chunk of survey rows.
+        
+        Args:
+            chunk (pd.DataFrame): Survey rows with any of the ANALYSIS_COLUMNS
+        """
+        from streaming_stats import ApproxQuantile, RunningStats
+        
+        self.total += len(chunk)
+        for col, counter in self.counters.items():
+            if col in chunk.columns:
+                counter.update(chunk[col])
+        if 'jobs_since_graduation' in chunk.columns:
+            self.jobs.update(chunk['jobs_since_graduation'])
+        for col in IMPACT_COLUMNS:
+            if col in chunk.columns:
+                self.impact_stats.setdefault(col, RunningStats()).update(chunk[col])
+                self.impact_medians.setdefault(col, ApproxQuantile()).update(chunk[col])
+    
+    def results(self):
+        """
+        Return the aggregates in the form taken by ``AlumniAnalyzer._store_results``.
+        
+        Returns:
+            tuple: (total, counts, avg_jobs, impact)
+        """
+        return (
+            self.total,
+            {col: counter.to_dict() for col, counter in self.counters.items()},
+            self.jobs.mean if self.jobs.count else float('nan'),
+            {col: (self.impact_stats[col].mean, self.impact_medians[col].median(), self.impact_stats[col].std)
+             for col in IMPACT_COLUMNS if col in self.impact_stats}
+        )
+    
+    def to_state(self):
+        """Return the accumulators as a JSON-serializable dict."""
+        return {
+            'version': STATE_VERSION,
+            'total': self.total,
+            'counters': {col: counter.to_state() for col, counter in self.counters.items()},
+            'jobs': self.jobs.to_state(),
+            'impact_stats': {col: stats.to_state() for col, stats in self.impact_stats.items()},
+            'impact_medians': {col: sketch.to_state() for col, sketch in self.impact_medians.items()}
+        }
+    
+    @classmethod
+    def from_state(cls, state):
+        """
+        Rebuild accumulators saved with ``to_state``.
+        
+        Args:
+            state (dict): Saved state
+        
+        Returns:
+            AnalysisState: The restored state
+        """
+        from streaming_stats import ApproxQuantile, RunningStats, ValueCounter
+        
+        if state.get('version') != STATE_VERSION:
+            raise ValueError(f"Unsupported analysis state version: {state.get('version')}")
+        
+        restored = cls()
+        restored.total = int(state['total'])
+        restored.counters.update({col: ValueCounter.from_state(counts) for col, counts in state['counters'].items()})
+        restored.jobs = RunningStats.from_state(state['jobs'])
+        restored.impact_stats = {col: RunningStats.from_state(stats) for col, stats in state['impact_stats'].items()}
+        restored.impact_medians = {col: ApproxQuantile.from_state(sketch)
+                                   for col, sketch in state['impact_medians'].items()}
+        return restored
+    
+    def save(self, state_file):
+        """
+        Write the state to a JSON file, replacing any previous state atomically.
+        
+        Args:
+            state_file (str): Output path
+        """
+        temp_file = f"{state_file}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self.to_state(), f)
+        os.replace(temp_file, state_file)
+    
+    @classmethod
+    def load(cls, state_file):
+        """
+        Read a state saved with ``save``.
+        
+        Args:
+            state_file (str): Path to the saved state
+        
+        Returns:
+            AnalysisState: The restored state
+        """
+        with open(state_file, 'r') as f:
+            return cls.from_state(json.load(f))
+
 
 class AlumniAnalyzer:
-    def __init__(self, data_file=None):
+    def __init__(self, data_file=None, state_file=None):
         """
         Initialize the AlumniAnalyzer with optional data file.
         
         Args:
-            data_file (str): Path to CSV file containing alumni data
+            data_file (str): Path to alumni data (CSV, Parquet or Feather)
+            state_file (str): Incremental analysis state to resume from, if it exists
         """
         self.data = None
         self.analysis_results = {}
+        self.state = None
+        self._analyzed_data = None
+        
+        if state_file and os.path.exists(state_file):
+            self.load_state(state_file)
         
         if data_file and os.path.exists(data_file):
             self.load_data(data_file)
     
-    def load_data(self, file_path):
+    def load_data(self, file_path, columns=ANALYSIS_COLUMNS):
         """
-        Load alumni data from CSV file.
+        Load alumni data from a CSV, Parquet or Feather file.
+        
+        Only the columns used by the analyses are read, and repetitive
+        answers are loaded as categoricals.
         
         Args:
-            file_path (str): Path to the CSV file
+            file_path (str): Path to the data file
+            columns (list): Columns to load (None loads every column)
         """
         try:
-            self.data = pd.read_csv(file_path)
+            self.data = read_table(file_path, columns, CATEGORICAL_COLUMNS)
             print(f"Data loaded successfully: {len(self.data)} records")
         except Exception as e:
             print(f"Error loading data: {e}")
     
+    def save_data(self, file_path):
+        """
+        Save the loaded alumni data, e.g. to convert a CSV survey export to Parquet.
+        
+        Args:
+            file_path (str): Output path; the extension selects Parquet, Feather or CSV
+        """
+        if self.data is None:
+            print("No data loaded. Please load data first.")
+            return
+        
+        write_table(self.data, file_path, [col for col in CATEGORICAL_COLUMNS if col in self.data.columns])
+        print(f"Data saved to {file_path}")
+    
+    @timed('analysis_seconds', method='basic_statistics')
     def basic_statistics(self):
         """
         Generate basic statistics about the alumni data.
@@ -62,6 +367,7 @@ class AlumniAnalyzer:
         self.analysis_results['basic_stats'] = stats
         return stats
     
+    @timed('analysis_seconds', method='career_analysis')
     def career_analysis(self):
         """
         Analyze career trajectories and patterns.
@@ -83,6 +389,7 @@ class AlumniAnalyzer:
         self.analysis_results['career_analysis'] = career_stats
         return career_stats
     
+    @timed('analysis_seconds', method='education_impact_analysis')
     def education_impact_analysis(self):
         """
         Analyze the impact of Exjam education on careers.
@@ -95,16 +402,8 @@ class AlumniAnalyzer:
             return {}
         
         # Calculate average ratings for different impact areas
-        impact_columns = [
-            'technical_skills_impact',
-            'problem_solving_impact', 
-            'networking_impact',
-            'industry_knowledge_impact',
-            'confidence_impact'
-        ]
-        
         impact_analysis = {}
-        for col in impact_columns:
+        for col in IMPACT_COLUMNS:
             if col in self.data.columns:
                 impact_analysis[col] = {
                     'mean': self.data[col].mean(),
@@ -115,6 +414,7 @@ class AlumniAnalyzer:
         self.analysis_results['education_impact'] = impact_analysis
         return impact_analysis
     
+    @timed('analysis_seconds', method='network_analysis')
     def network_analysis(self):
         """
         Analyze alumni network connectivity and engagement.
@@ -135,87 +435,296 @@ class AlumniAnalyzer:
         self.analysis_results['network_analysis'] = network_stats
         return network_stats
     
-    def generate_visualizations(self, output_dir='./output'):
+    @timed('analysis_seconds', method='analyze_stream')
+    def analyze_stream(self, file_path, chunk_size=100000):
         """
-        Generate visualizations for the analysis results.
+        Run the basic, career, education impact and network analyses in one streaming pass.
+        
+        The file is read in chunks of ``chunk_size`` rows and each chunk
+        updates mergeable accumulators (value counts, Welford mean/variance
+        and approximate medians), so memory stays bounded for survey files
+        larger than memory. Results are stored in ``analysis_results`` under
+        the same keys and shapes as the individual analysis methods;
+        ``self.data`` is left untouched.
         
         Args:
-            output_dir (str): Directory to save visualization files
+            file_path (str): Path to alumni data (CSV, Parquet or Feather)
+            chunk_size (int): Rows per chunk
+        
+        Returns:
+            dict: Analysis results keyed like ``analysis_results``
+        """
+        state = AnalysisState()
+        
+        try:
+            for chunk in iter_table_chunks(file_path, ANALYSIS_COLUMNS, chunk_size):
+                state.update(chunk)
+        except Exception as e:
+            print(f"Error streaming data: {e}")
+            return {}
+        
+        print(f"Data streamed successfully: {state.total} records")
+        
+        self.state = state
+        self._store_results(*state.results())
+        self._analyzed_data = None
+        
+        return self.analysis_results
+    
+    @timed('analysis_seconds', method='append_data')
+    def append_data(self, new_rows, state_file=STATE_FILE):
+        """
+        Add newly arrived survey rows to the incremental analysis state.
+        
+        Only the new rows are read: they update the saved accumulators
+        (counts, sums and median sketches), the results in
+        ``analysis_results`` are refreshed from the state and the state is
+        saved again, so the cost depends on the new rows rather than on every
+        response received so far. The state starts from ``state_file`` if it
+        exists, otherwise from the loaded data (once) or from empty.
+        
+        Medians from the state are approximate (exact for the 1-5 ratings);
+        the survey rows themselves are not kept, so ``self.data`` is not
+        extended.
+        
+        Args:
+            new_rows: DataFrame, list of row dicts, or path to a CSV, Parquet or Feather file
+            state_file (str): Path of the persisted state (None keeps the state in memory only)
+        
+        Returns:
+            dict: Analysis results keyed like ``analysis_results``
+        """
+        import pandas as pd
+        
+        try:
+            if self.state is None:
+                if state_file and os.path.exists(state_file):
+                    self.state = AnalysisState.load(state_file)
+                else:
+                    self.state = AnalysisState()
+                    if self.data is not None:
+                        self.state.update(self.data)
+            
+            if isinstance(new_rows, str):
+                for chunk in iter_table_chunks(new_rows, ANALYSIS_COLUMNS):
+                    self.state.update(chunk)
+            else:
+                self.state.update(new_rows if isinstance(new_rows, pd.DataFrame) else pd.DataFrame(new_rows))
+            
+            if state_file:
+                self.state.save(state_file)
+        except Exception as e:
+            print(f"Error appending data: {e}")
+            return {}
+        
+        self._store_results(*self.state.results())
+        # Results now come from the state, so run_all must not replace them with the loaded data's
+        self._analyzed_data = self.data
+        print(f"Data appended successfully: {self.state.total} records in total")
+        
+        return self.analysis_results
+    
+    def load_state(self, state_file=STATE_FILE):
+        """
+        Resume from a saved incremental analysis state.
+        
+        Args:
+            state_file (str): Path of the persisted state
+        
+        Returns:
+            dict: Analysis results keyed like ``analysis_results``
+        """
+        try:
+            self.state = AnalysisState.load(state_file)
+        except Exception as e:
+            print(f"Error loading analysis state: {e}")
+            return {}
+        
+        self._store_results(*self.state.results())
+        self._analyzed_data = None
+        print(f"Analysis state loaded: {self.state.total} records")
+        
+        return self.analysis_results
+    
+    @timed('analysis_seconds', method='run_all')
+    def run_all(self, force=False):
+        """
+        Compute every metric used by the four analyses, the charts and the report in one pass.
+        
+        Each counted column is scanned once with ``value_counts`` and each
+        numeric column is summarized from a single NaN-free array, instead of
+        every analysis and chart repeating its own aggregations.
+        Results are memoized in ``analysis_results`` and reused until
+        different data is loaded (or ``force`` is set).
+        
+        Args:
+            force (bool): Recompute even if results for the current data exist
+        
+        Returns:
+            dict: Analysis results keyed like ``analysis_results``
         """
         if self.data is None:
             print("No data loaded. Please load data first.")
-            return
+            return {}
+        
+        if not force and self._analyzed_data is self.data:
+            return self.analysis_results
+        
+        columns = set(self.data.columns)
+        counts = {col: self.data[col].value_counts().to_dict() for col in COUNTED_COLUMNS if col in columns}
+        
+        import numpy as np
+        import pandas as pd
+        
+        # Mean, median and std per numeric column from one array pass each
+        summary = {}
+        for col in ['jobs_since_graduation'] + IMPACT_COLUMNS:
+            if col in columns:
+                values = pd.to_numeric(self.data[col], errors='coerce').to_numpy(dtype=float)
+                values = values[~np.isnan(values)]
+                summary[col] = (
+                    values.mean() if values.size else float('nan'),
+                    np.median(values) if values.size else float('nan'),
+                    values.std(ddof=1) if values.size > 1 else float('nan')
+                )
+        
+        self._store_results(
+            len(self.data),
+            counts,
+            summary['jobs_since_graduation'][0] if 'jobs_since_graduation' in summary else float('nan'),
+            {col: summary[col] for col in IMPACT_COLUMNS if col in summary}
+        )
+        self._analyzed_data = self.data
+        
+        return self.analysis_results
+    
+    def _store_results(self, total, counts, avg_jobs, impact):
+        """
+        Store aggregates in ``analysis_results`` using the per-analysis keys and shapes.
+        
+        Args:
+            total (int): Number of alumni
+            counts (dict): Value counts per column, most common first
+            avg_jobs (float): Mean of jobs_since_graduation
+            impact (dict): (mean, median, std) per impact column
+        """
+        self.analysis_results['basic_stats'] = {
+            'total_alumni': total,
+            'graduation_years': counts.get('graduation_year', {}),
+            'programs': counts.get('program', {}),
+            'industries': counts.get('industry', {}),
+            'locations': dict(list(counts.get('location', {}).items())[:10])
+        }
+        self.analysis_results['career_analysis'] = {
+            'avg_jobs_since_graduation': avg_jobs,
+            'employment_types': counts.get('employment_type', {}),
+            'years_in_current_role': counts.get('years_in_current_role', {}),
+            'leadership_positions': counts.get('has_leadership', {})
+        }
+        self.analysis_results['education_impact'] = {
+            col: {'mean': mean, 'median': median, 'std': std}
+            for col, (mean, median, std) in impact.items()
+        }
+        self.analysis_results['network_analysis'] = {
+            'connection_levels': counts.get('connection_level', {}),
+            'mentorship_interest': counts.get('mentorship_interest', {}),
+            'recommendation_rate': counts.get('would_recommend', {})
+        }
+    
+    def _ensure_results(self):
+        """
+        Return analysis results for the charts and report, running ``run_all`` if needed.
+        
+        Loaded data goes through the memoized ``run_all``; without loaded
+        data, results from ``analyze_stream``, ``append_data`` or
+        ``load_state`` are used as they are.
+        
+        Returns:
+            dict: Analysis results, or None if there is nothing to report on
+        """
+        if self.data is not None:
+            return self.run_all()
+        
+        if all(key in self.analysis_results for key in ('basic_stats', 'education_impact', 'network_analysis')):
+            return self.analysis_results
+        
+        print("No data loaded. Please load data first.")
+        return None
+    
+    @timed('analysis_seconds', method='generate_visualizations')
+    def generate_visualizations(self, output_dir='./output', dpi=300, chart_format='png', workers=None):
+        """
+        Generate visualizations for the analysis results.
+        
+        Charts are drawn from the memoized aggregates in ``analysis_results``
+        rather than recomputed from the raw data, and are rendered in parallel
+        across a process pool with the non-interactive Agg backend.
+        
+        Args:
+            output_dir (str): Directory to save visualization files
+            dpi (int): Resolution for PNG charts
+            chart_format (str): 'png', 'svg', or 'preview' (fast low-resolution PNG)
+            workers (int): Rendering processes (defaults to one per chart, up to the CPU count;
+                1 renders in this process)
+        
+        Returns:
+            dict: Render seconds per saved chart file
+        """
+        if chart_format not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format '{chart_format}'. Use one of: {', '.join(CHART_FORMATS)}")
+        
+        results = self._ensure_results()
+        if results is None:
+            return {}
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set style for better-looking plots
-        plt.style.use('seaborn-v0_8')
-        
-        # 1. Graduation Year Distribution
-        plt.figure(figsize=(12, 6))
-        self.data['graduation_year'].value_counts().sort_index().plot(kind='bar')
-        plt.title('Alumni Distribution by Graduation Year')
-        plt.xlabel('Graduation Year')
-        plt.ylabel('Number of Alumni')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/graduation_year_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 2. Industry Distribution
-        plt.figure(figsize=(12, 8))
-        industry_counts = self.data['industry'].value_counts().head(10)
-        industry_counts.plot(kind='barh')
-        plt.title('Top 10 Industries for Exjam Alumni')
-        plt.xlabel('Number of Alumni')
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/industry_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        # 3. Education Impact Ratings
-        impact_columns = [
-            'technical_skills_impact',
-            'problem_solving_impact', 
-            'networking_impact',
-            'industry_knowledge_impact',
-            'confidence_impact'
+        charts = [
+            ('graduation_year_distribution', results['basic_stats']['graduation_years']),
+            ('industry_distribution', dict(list(results['basic_stats']['industries'].items())[:10])),
+            ('connection_levels', results['network_analysis']['connection_levels'])
         ]
         
-        available_columns = [col for col in impact_columns if col in self.data.columns]
-        
-        if available_columns:
-            plt.figure(figsize=(10, 6))
-            impact_means = [self.data[col].mean() for col in available_columns]
-            impact_labels = [col.replace('_impact', '').replace('_', ' ').title() for col in available_columns]
-            
-            plt.bar(impact_labels, impact_means)
-            plt.title('Average Impact of Exjam Education (1-5 Scale)')
-            plt.ylabel('Average Rating')
-            plt.ylim(0, 5)
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.savefig(f'{output_dir}/education_impact_ratings.png', dpi=300, bbox_inches='tight')
-            plt.close()
-        
-        # 4. Connection Levels
-        plt.figure(figsize=(8, 6))
-        self.data['connection_level'].value_counts().plot(kind='pie', autopct='%1.1f%%')
-        plt.title('Alumni Network Connection Levels')
-        plt.ylabel('')
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/connection_levels.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        
-        print(f"Visualizations saved to {output_dir}/")
+        impact_means = {col: results['education_impact'][col]['mean']
+                        for col in IMPACT_COLUMNS if col in results['education_impact']}
+        if impact_means:
+            charts.insert(2, ('education_impact_ratings', impact_means))
+        
+        names, aggregates = zip(*charts)
+        workers = workers or min(len(charts), os.cpu_count() or 1)
+        start = time.perf_counter()
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(charts)),
+                                     initializer=_init_chart_worker) as executor:
+                rendered = list(executor.map(_render_chart, names, aggregates, [output_dir] * len(charts),
+                                             [dpi] * len(charts), [chart_format] * len(charts)))
+        else:
+            _init_chart_worker()
+            rendered = [_render_chart(name, data, output_dir, dpi, chart_format) for name, data in charts]
+        
+        timings = dict(rendered)
+        for output_file, seconds in timings.items():
+            print(f"  {os.path.basename(output_file)}: {seconds:.2f}s")
+        
+        print(f"Visualizations saved to {output_dir}/ in {time.perf_counter() - start:.2f}s")
+        return timings
     
+    @timed('analysis_seconds', method='generate_report')
     def generate_report(self, output_file='alumni_analysis_report.md'):
         """
         Generate a comprehensive analysis report.
         
+        After ``append_data`` the report is built from the updated
+        incremental state.
+        
         Args:
             output_file (str): Path to save the report
         """
+        if self.data is not None:
+            self.run_all()
+        
         report = f"""# Exjam Alumni Analysis Report
 
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -294,6 +803,10 @@ Based on the analysis, the following recommendations are made:
         """
         Save analysis results to JSON file.
         
+        The incremental state is saved next to it as STATE_FILE so later
+        ``append_data`` calls can resume from it. After an in-memory
+        analysis the state is first built from the loaded data.
+        
         Args:
             output_file (str): Path to save the results
         """
@@ -301,6 +814,15 @@ Based on the analysis, the following recommendations are made:
             json.dump(self.analysis_results, f, indent=2, default=str)
         
         print(f"Analysis results saved to {output_file}")
+        
+        if self.state is None and self.data is not None:
+            self.state = AnalysisState()
+            self.state.update(self.data)
+        
+        if self.state is not None:
+            state_file = os.path.join(os.path.dirname(output_file), STATE_FILE)
+            self.state.save(state_file)
+            print(f"Analysis state saved to {state_file}")
 
 
 def main():
@@ -328,20 +850,12 @@ def main():
         'would_recommend': ['Yes, definitely', 'Yes, definitely', 'Yes, with reservations', 'Yes, definitely', 'Yes, definitely', 'Yes, definitely']
     }
     
+    import pandas as pd
     analyzer.data = pd.DataFrame(sample_data)
     
     # Run analyses
-    print("Running basic statistics...")
-    analyzer.basic_statistics()
-    
-    print("Running career analysis...")
-    analyzer.career_analysis()
-    
-    print("Running education impact analysis...")
-    analyzer.education_impact_analysis()
-    
-    print("Running network analysis...")
-    analyzer.network_analysis()
+    print("Running basic, career, education impact and network analyses...")
+    analyzer.run_all()
     
     # Generate visualizations
     print("Generating visualizations...")
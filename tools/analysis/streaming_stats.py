@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Streaming Statistics for Exjam Alumni Analysis
+
+This module provides mergeable accumulators (value counts, Welford mean/variance and an
+approximate median) that are updated chunk by chunk, so survey files larger than memory can
+be analyzed in a single pass.
+"""
+
+import math
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+def _plain(value):
+    """Convert a numpy scalar to the equivalent Python value for JSON."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class RunningStats:
+    def __init__(self):
+        """Track count, mean and variance with Welford's method."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, values):
+        """
+        Add a chunk of values, ignoring missing ones.
+        
+        The chunk's own mean and sum of squares are computed with numpy and
+        combined with the running totals (Chan et al.'s parallel form of
+        Welford's update), so the cost per chunk is a single vectorized pass.
+        
+        Args:
+            values: Series or array of numbers
+        """
+        values = pd.to_numeric(pd.Series(values), errors='coerce').dropna().to_numpy(dtype=float)
+        if values.size == 0:
+            return
+        
+        chunk = RunningStats()
+        chunk.count = values.size
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        self.merge(chunk)
+    
+    def merge(self, other):
+        """
+        Combine another accumulator into this one.
+        
+        Args:
+            other (RunningStats): Accumulator built from a different part of the data
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+    
+    def to_state(self):
+        """Return the accumulator as a JSON-serializable dict."""
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2}
+    
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild an accumulator saved with ``to_state``."""
+        stats = cls()
+        stats.count, stats.mean, stats.m2 = int(state['count']), float(state['mean']), float(state['m2'])
+        return stats
+    
+    @property
+    def variance(self):
+        """Sample variance (ddof=1, matching pandas), or NaN for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else float('nan')
+    
+    @property
+    def std(self):
+        """Sample standard deviation (ddof=1, matching pandas)."""
+        return math.sqrt(self.variance) if self.count > 1 else float('nan')
+
+
+class ValueCounter:
+    def __init__(self):
+        """Count occurrences of each value across chunks."""
+        self.counts = Counter()
+    
+    def update(self, values):
+        """
+        Add a chunk of values, ignoring missing ones.
+        
+        Args:
+            values: Series of values
+        """
+        for value, count in pd.Series(values).value_counts(sort=False).items():
+            if count:
+                self.counts[value] += int(count)
+    
+    def merge(self, other):
+        """
+        Combine another counter into this one.
+        
+        Args:
+            other (ValueCounter): Counter built from a different part of the data
+        """
+        self.counts.update(other.counts)
+    
+    def to_dict(self, top=None):
+        """
+        Return counts ordered from most to least common, like ``value_counts().to_dict()``.
+        
+        Args:
+            top (int): Keep only the most common values
+        
+        Returns:
+            dict: Count per value
+        """
+        return dict(self.counts.most_common(top))
+    
+    def to_state(self):
+        """
+        Return the counts as a JSON-serializable list of [value, count] pairs.
+        
+        Pairs are used instead of a dict so numeric and boolean values keep
+        their type (JSON object keys are always strings).
+        """
+        return [[_plain(value), count] for value, count in self.counts.items()]
+    
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a counter saved with ``to_state``."""
+        counter = cls()
+        counter.counts.update({value: int(count) for value, count in state})
+        return counter
+
+
+class ApproxQuantile:
+    def __init__(self, bin_width=0.01, max_bins=2048):
+        """
+        Approximate quantiles from a mergeable fixed-width histogram.
+        
+        Each bin keeps its count and sum, so quantiles are reported as the
+        mean of the values in the matching bin. Values on the bin grid (such
+        as 1-5 ratings) give exact results. When a sketch exceeds
+        ``max_bins`` its bins are widened (doubled), which bounds memory.
+        
+        Args:
+            bin_width (float): Initial bin width
+            max_bins (int): Maximum number of bins kept
+        """
+        self.bin_width = bin_width
+        self.max_bins = max_bins
+        self.bins = {}
+        self.count = 0
+    
+    def update(self, values):
+        """
+        Add a chunk of values, ignoring missing ones.
+        
+        Args:
+            values: Series or array of numbers
+        """
+        values = pd.to_numeric(pd.Series(values), errors='coerce').dropna().to_numpy(dtype=float)
+        if values.size == 0:
+            return
+        
+        keys = np.floor(values / self.bin_width + 1e-9).astype(np.int64)
+        unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        sums = np.bincount(inverse, weights=values)
+        
+        for key, count, total in zip(unique_keys.tolist(), counts.tolist(), sums.tolist()):
+            self._add_bin(key, count, total)
+        self.count += int(values.size)
+        self._compact()
+    
+    def to_state(self):
+        """Return the sketch as a JSON-serializable dict."""
+        return {
+            'bin_width': self.bin_width,
+            'max_bins': self.max_bins,
+            'count': self.count,
+            'bins': [[key, count, total] for key, (count, total) in self.bins.items()]
+        }
+    
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a sketch saved with ``to_state``."""
+        sketch = cls(float(state['bin_width']), int(state['max_bins']))
+        sketch.count = int(state['count'])
+        sketch.bins = {int(key): (int(count), float(total)) for key, count, total in state['bins']}
+        return sketch
+    
+    def _add_bin(self, key, count, total):
+        """Add a count and sum to one bin."""
+        bin_count, bin_total = self.bins.get(key, (0, 0.0))
+        self.bins[key] = (bin_count + count, bin_total + total)
+    
+    def _widen(self):
+        """Double the bin width, folding pairs of neighbouring bins together."""
+        self.bins = self._fold(self.bins)
+        self.bin_width *= 2
+    
+    def _compact(self):
+        """Widen the bins until the sketch fits ``max_bins``."""
+        while len(self.bins) > self.max_bins:
+            self._widen()
+    
+    def merge(self, other):
+        """
+        Combine another sketch into this one.
+        
+        Args:
+            other (ApproxQuantile): Sketch built from a different part of the data
+        """
+        if other.count == 0:
+            return
+        
+        other_bins, other_width = other.bins, other.bin_width
+        while other_width > self.bin_width * 1.5:
+            self._widen()
+        while self.bin_width > other_width * 1.5:
+            other_bins = self._fold(other_bins)
+            other_width *= 2
+        
+        for key, (count, total) in other_bins.items():
+            self._add_bin(key, count, total)
+        self.count += other.count
+        self._compact()
+    
+    @staticmethod
+    def _fold(bins):
+        """Return a copy of ``bins`` at double the bin width."""
+        folded = {}
+        for key, (count, total) in bins.items():
+            bin_count, bin_total = folded.get(key // 2, (0, 0.0))
+            folded[key // 2] = (bin_count + count, bin_total + total)
+        return folded
+    
+    def _value_at(self, rank, ordered):
+        """Return the representative value of the item at a 0-based rank."""
+        seen = 0
+        for key in ordered:
+            count, total = self.bins[key]
+            seen += count
+            if rank < seen:
+                return total / count
+        return float('nan')
+    
+    def quantile(self, q):
+        """
+        Estimate a quantile, interpolating between the two middle ranks like pandas.
+        
+        Args:
+            q (float): Quantile between 0 and 1
+        
+        Returns:
+            float: Estimated quantile, or NaN when no values were added
+        """
+        if self.count == 0:
+            return float('nan')
+        
+        ordered = sorted(self.bins)
+        position = q * (self.count - 1)
+        lower, upper = math.floor(position), math.ceil(position)
+        low_value = self._value_at(lower, ordered)
+        if upper == lower:
+            return low_value
+        high_value = self._value_at(upper, ordered)
+        return low_value + (high_value - low_value) * (position - lower)
+    
+    def median(self):
+        """Estimate the median."""
+        return self.quantile(0.5)
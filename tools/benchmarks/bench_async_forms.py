@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Forms Export Benchmark
+
+This script serves seeded synthetic registration forms from a local stub of the Google Forms API
+(with per-request latency and injected 429 and 503 errors) and exports them with the
+asynchronous client, one request at a time and then concurrently, checking that every
+response arrives exactly once despite the retries.
+"""
+
+import argparse
+import asyncio
+import collections
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from aiohttp import web
+from async_forms_client import export_forms
+from synthetic_data import iter_form_responses, registration_form
+
+
+class StubFormsApi:
+    def __init__(self, forms: int, responses: int, page_size: int, latency: float, error_rate: float,
+                 retry_after: float, seed: int):
+        """
+        Local stand-in for the Forms API endpoints used by the exporter.
+        
+        Besides the random errors, statuses queued with ``inject`` are
+        returned by the next requests, and once ``tokens`` is a set only
+        requests carrying one of its bearer tokens are served (others get 401).
+        
+        Args:
+            forms (int): Number of forms served
+            responses (int): Responses per form
+            page_size (int): Responses per page
+            latency (float): Seconds added to every request
+            error_rate (float): Share of requests answered with 429 or 503
+            retry_after (float): ``Retry-After`` seconds sent with 429 responses
+            seed (int): Random seed for the responses and the injected errors
+        """
+        self.form = registration_form()
+        self.pages = {f"form-{index}": list(iter_form_responses(responses, seed + index * 1000, page_size))
+                      for index in range(forms)}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.injected = collections.deque()
+        self.tokens = None
+        self.unauthorized = 0
+        self.pages_served = collections.Counter()
+    
+    def inject(self, *statuses: int, retry_after: float = None, form_id: str = None):
+        """
+        Answer the next requests with the given error statuses, in order.
+        
+        Args:
+            *statuses (int): HTTP statuses, e.g. 429, 500
+            retry_after (float): ``Retry-After`` seconds sent with them (None sends none)
+            form_id (str): Only fail requests for this form (None fails any request)
+        """
+        self.injected.extend((status, retry_after, form_id) for status in statuses)
+    
+    def _take_injected(self, form_id: str):
+        """Remove and return the first injected failure for a form, or None."""
+        for failure in self.injected:
+            if failure[2] in (None, form_id):
+                self.injected.remove(failure)
+                return failure
+        return None
+    
+    def issue_token(self) -> str:
+        """Issue a bearer token the stub accepts from now on (and start requiring one)."""
+        self.tokens = self.tokens or set()
+        token = f"stub-token-{len(self.tokens) + 1}"
+        self.tokens.add(token)
+        return token
+    
+    def app(self) -> web.Application:
+        """Build the aiohttp application serving the stub endpoints."""
+        app = web.Application()
+        app.router.add_get('/forms/{form_id}', self.get_form)
+        app.router.add_get('/forms/{form_id}/responses', self.list_responses)
+        return app
+    
+    async def _serve(self, request: web.Request, handler):
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.tokens is not None and request.headers.get('Authorization', '')[len('Bearer '):] not in self.tokens:
+                self.unauthorized += 1
+                return web.json_response({'error': 'invalid credentials'}, status=401)
+            failure = self._take_injected(request.match_info['form_id'])
+            if failure:
+                status, retry_after, _ = failure
+                self.errors += 1
+                headers = {'Retry-After': str(retry_after)} if retry_after is not None else {}
+                return web.json_response({'error': 'injected'}, status=status, headers=headers)
+            if self.rng.random() < self.error_rate:
+                self.errors += 1
+                if self.rng.random() < 0.5:
+                    return web.json_response({'error': 'quota exceeded'}, status=429,
+                                             headers={'Retry-After': str(self.retry_after)})
+                return web.json_response({'error': 'backend unavailable'}, status=503)
+            return handler()
+        finally:
+            self.in_flight -= 1
+    
+    async def get_form(self, request: web.Request) -> web.Response:
+        form_id = request.match_info['form_id']
+        if form_id not in self.pages:
+            return web.json_response({'error': 'not found'}, status=404)
+        if request.query.get('fields') == 'revisionId':
+            return await self._serve(request, lambda: web.json_response({'revisionId': self.form['revisionId']}))
+        return await self._serve(request, lambda: web.json_response({**self.form, 'formId': form_id}))
+    
+    async def list_responses(self, request: web.Request) -> web.Response:
+        pages = self.pages.get(request.match_info['form_id'])
+        if pages is None:
+            return web.json_response({'error': 'not found'}, status=404)
+        
+        index = int(request.query.get('pageToken', 0))
+        responses = pages[index]
+        # The exporter only sends 'timestamp > <RFC 3339>' filters; such timestamps compare as strings
+        since = request.query.get('filter', '').partition('>')[2].strip()
+        if since:
+            responses = [response for response in responses if response['lastSubmittedTime'] > since]
+        body = {'responses': responses}
+        if index + 1 < len(pages):
+            body['nextPageToken'] = str(index + 1)
+        
+        def serve_page():
+            self.pages_served[request.match_info['form_id'], index] += 1
+            return web.json_response(body)
+        return await self._serve(request, serve_page)
+
+
+def count_rows(csv_file: str) -> int:
+    """Return the number of data rows in a CSV file."""
+    with open(csv_file, newline='', encoding='utf-8') as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
+async def run(args) -> dict:
+    """Start the stub server and time the export at each concurrency level."""
+    stub = StubFormsApi(args.forms, args.responses, args.page_size, args.latency, args.error_rate,
+                        args.retry_after, args.seed)
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    
+    results = {}
+    try:
+        for concurrency in args.concurrency:
+            stub.requests = stub.errors = stub.peak_in_flight = 0
+            with tempfile.TemporaryDirectory() as work_dir:
+                exports = [(form_id, os.path.join(work_dir, f"{form_id}.csv")) for form_id in stub.pages]
+                start = time.perf_counter()
+                written = await export_forms(exports, base_url=base_url, concurrency=concurrency,
+                                             page_size=args.page_size, schema_cache_dir=None,
+                                             backoff_base=args.backoff_base,
+                                             requests_per_minute={'read': args.rate})
+                seconds = time.perf_counter() - start
+                
+                failures = {output: str(result) for output, result in written.items()
+                            if isinstance(result, Exception)}
+                rows = sum(count_rows(output) for output in written if output not in failures)
+            
+            results[f"concurrency {concurrency}"] = {
+                'seconds': round(seconds, 4),
+                'requests': stub.requests,
+                'injected_errors': stub.errors,
+                'peak_in_flight': stub.peak_in_flight,
+                'rows': rows,
+                'complete': not failures and rows == args.forms * args.responses,
+                'failures': failures
+            }
+    finally:
+        await runner.cleanup()
+    return results
+
+
+def main():
+    """Run the asynchronous Forms export benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--forms', type=int, default=6, help='Forms (events) exported')
+    parser.add_argument('--responses', type=int, default=2000, help='Responses per form')
+    parser.add_argument('--page-size', type=int, default=250, help='Responses per page')
+    parser.add_argument('--latency', type=float, default=0.05, help='Stub latency per request in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.1, help='Share of requests failing with 429/503')
+    parser.add_argument('--retry-after', type=float, default=0.2, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--backoff-base', type=float, default=0.05, help='First client backoff delay in seconds')
+    parser.add_argument('--rate', type=float, default=60000,
+                        help='Client read rate limit in requests per minute (the Forms API allows 390)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16], help='Concurrency levels compared')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic data and errors')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    print(f"Serving {args.forms} forms x {args.responses} synthetic responses from a local stub...")
+    results = asyncio.run(run(args))
+    
+    baseline = next(iter(results.values()))['seconds']
+    print(f"\n| Variant ({args.forms} forms, {args.latency * 1000:.0f} ms latency, "
+          f"{args.error_rate:.0%} errors) | Seconds | Speedup | Requests | Errors | Peak in flight | Complete |")
+    print("|---------|---------|---------|---------|---------|---------|---------|")
+    for name, stats in results.items():
+        print(f"| {name} | {stats['seconds']:.4f} | {baseline / stats['seconds']:.1f}x | {stats['requests']} | "
+              f"{stats['injected_errors']} | {stats['peak_in_flight']} | {'yes' if stats['complete'] else 'NO'} |")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'forms': args.forms, 'responses': args.responses, 'seed': args.seed, 'results': results},
+                      f, indent=2)
+        print(f"\nResults saved to {args.output}")
+    
+    return 0 if all(stats['complete'] for stats in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
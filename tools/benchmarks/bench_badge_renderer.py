@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Badge Renderer Benchmark
+
+This script compares the canvas badge renderer (a layout computed once per badge template,
+then drawn with low-level canvas operations) with the original platypus flowable layout, as
+badges per second for single-badge PDFs and for a multi-badge sheet. The canvas renderer is
+timed with the sheet's static parts stamped from a form XObject and redrawn for every badge.
+The QR codes and barcodes are rendered before timing (single badges) or served from a warmed
+code cache (sheets); embedding them costs the same with both renderers, so ``--format none``
+leaves them out to time the badge layout alone.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from enhanced_registration_module import BADGE_SHEET_LAYOUTS, EnhancedExjamRegistrationModule
+from synthetic_data import synthetic_participants
+
+
+def fastest(function, repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs of a function, in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_renderer(renderer: str, participants: list, args, work_dir: str, static_form: bool = True) -> dict:
+    """
+    Time single badges and a badge sheet with one renderer.
+    
+    Args:
+        renderer (str): 'canvas' or 'platypus'
+        participants (list): Participants with registration IDs
+        args: Parsed command line arguments
+        work_dir (str): Directory for the badges, code cache and signing key
+        static_form (bool): Stamp the canvas sheet's static parts from a form XObject
+    
+    Returns:
+        dict: Badges per second and PDF bytes per badge for each case
+    """
+    with_codes = args.format != 'none'
+    registration = EnhancedExjamRegistrationModule(cache_dir=os.path.join(work_dir, 'code_cache'),
+                                                   code_format=args.format if with_codes else 'png',
+                                                   payload_key_file=os.path.join(work_dir, 'qr_payload.key'),
+                                                   id_registry_file=os.path.join(work_dir, 'registration_ids.log'),
+                                                   badge_renderer=renderer)
+    registration.badges_dir = tempfile.mkdtemp(dir=work_dir)
+    if renderer == 'canvas':
+        registration.badge_template(args.layout).static_form = static_form
+    
+    if not with_codes:
+        # Badges of participants without a registration ID carry no codes
+        participants = [{key: value for key, value in participant.items() if key != 'registration_id'}
+                        for participant in participants]
+    singles = participants[:args.single_count]
+    codes = [registration.render_registration_codes(participant['registration_id']) if with_codes else {}
+             for participant in singles]
+    # Warm the code cache and the badge template outside the timings
+    registration.create_badge_sheet(participants, 'warmup.pdf', args.layout)
+    registration.create_participant_badge(singles[0], 'warmup_badge.pdf', codes[0])
+    
+    def single_badges():
+        for index, (participant, participant_codes) in enumerate(zip(singles, codes)):
+            registration.create_participant_badge(participant, f"badge_{index}.pdf", participant_codes)
+    
+    single_seconds = fastest(single_badges, args.repeat)
+    single_bytes = sum(os.path.getsize(os.path.join(registration.badges_dir, f"badge_{index}.pdf"))
+                       for index in range(len(singles)))
+    
+    sheet_seconds = fastest(lambda: registration.create_badge_sheet(participants, 'badge_sheet.pdf', args.layout),
+                            args.repeat)
+    sheet_bytes = os.path.getsize(os.path.join(registration.badges_dir, 'badge_sheet.pdf'))
+    
+    return {
+        'single badges': {
+            'badges': len(singles),
+            'seconds': round(single_seconds, 4),
+            'badges_per_second': round(len(singles) / single_seconds, 1),
+            'bytes_per_badge': round(single_bytes / len(singles))
+        },
+        f"{args.layout} sheet": {
+            'badges': len(participants),
+            'seconds': round(sheet_seconds, 4),
+            'badges_per_second': round(len(participants) / sheet_seconds, 1),
+            'bytes_per_badge': round(sheet_bytes / len(participants))
+        }
+    }
+
+
+def main():
+    """Run the badge renderer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1000, help='Participants on the badge sheet')
+    parser.add_argument('--single-count', type=int, default=200, help='Participants rendered as single badges')
+    parser.add_argument('--layout', choices=list(BADGE_SHEET_LAYOUTS), default='2x4', help='Badge sheet layout')
+    parser.add_argument('--format', choices=['png', 'drawing', 'none'], default='png',
+                        help="Code format embedded in badges ('none' times the layout alone)")
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (the fastest is kept)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic participants')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    participants = synthetic_participants(args.count, args.seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        registration_ids = EnhancedExjamRegistrationModule(
+            payload_key_file=os.path.join(work_dir, 'qr_payload.key'),
+            id_registry_file=os.path.join(work_dir, 'registration_ids.log')).allocate_ids(args.count)
+        for participant, registration_id in zip(participants, registration_ids):
+            participant['registration_id'] = registration_id
+        
+        # The original path first, so the speedups are relative to it
+        variants = {'platypus': ('platypus', True), 'canvas (static parts redrawn)': ('canvas', False),
+                    'canvas (static form)': ('canvas', True)}
+        for name, (renderer, static_form) in variants.items():
+            print(f"Rendering {args.count} badges with the {name} renderer...")
+            results[name] = benchmark_renderer(renderer, participants, args, work_dir, static_form)
+    
+    codes_label = 'no' if args.format == 'none' else args.format
+    print(f"\n| Renderer ({codes_label} codes) | Case | Badges | Badges/s | Speedup | Bytes/badge |")
+    print("|----------|------|--------|----------|---------|-------------|")
+    for renderer, cases in results.items():
+        for name, stats in cases.items():
+            speedup = stats['badges_per_second'] / results['platypus'][name]['badges_per_second']
+            print(f"| {renderer} | {name} | {stats['badges']} | {stats['badges_per_second']:.1f} | "
+                  f"{speedup:.1f}x | {stats['bytes_per_badge']} |")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'count': args.count, 'seed': args.seed, 'format': args.format, 'results': results},
+                      f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Check-In Service Benchmark
+
+This script measures registration lookup latency by ID, email, phone and QR payload, and the
+scan throughput of the asyncio check-in endpoint with several concurrent scanners.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from checkin_service import CheckInService, RegistrationIndex
+
+
+def make_registrations(count: int) -> list:
+    """Build synthetic registrations with unique IDs, emails and phone numbers."""
+    return [{
+        'registration_id': f"EXJAM-20251128{index:06d}-{index * 7919 % 0xFFFFFFFF:08X}",
+        'full_name': f"Participant {index}",
+        'email': f"Participant.{index}@Example.com",
+        'phone': f"+234 80{index:08d}"
+    } for index in range(count)]
+
+
+def benchmark_lookups(index: RegistrationIndex, registrations: list, lookups: int) -> dict:
+    """Time lookups for each kind of scan and return microseconds per lookup."""
+    sample = registrations[:lookups]
+    scans = {
+        'registration_id': [r['registration_id'] for r in sample],
+        'email': [r['email'].upper() for r in sample],
+        'phone': [r['phone'].replace('+234 ', '0') for r in sample],
+        'qr_payload': [json.dumps({'registration_id': r['registration_id'], 'event': 'PG Conference'}, indent=2)
+                       for r in sample]
+    }
+    
+    results = {}
+    for kind, values in scans.items():
+        start = time.perf_counter()
+        found = sum(1 for value in values if index.lookup(value) is not None)
+        elapsed = time.perf_counter() - start
+        results[kind] = {'us_per_lookup': round(elapsed * 1e6 / len(values), 2), 'found': found}
+    return results
+
+
+async def benchmark_endpoint(service: CheckInService, scans: list, scanners: int) -> dict:
+    """Send scans over the socket endpoint from concurrent scanners and measure throughput."""
+    server = await asyncio.start_server(service.handle_client, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+    
+    async def scanner(batch):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        latencies = []
+        for scan in batch:
+            start = time.perf_counter()
+            writer.write((scan + '\n').encode('utf-8'))
+            await writer.drain()
+            await reader.readline()
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+        return latencies
+    
+    start = time.perf_counter()
+    batches = [scans[i::scanners] for i in range(scanners)]
+    latencies = sorted(sum(await asyncio.gather(*(scanner(batch) for batch in batches)), []))
+    elapsed = time.perf_counter() - start
+    
+    server.close()
+    await server.wait_closed()
+    
+    return {
+        'scans': len(scans),
+        'scanners': scanners,
+        'scans_per_second': round(len(scans) / elapsed, 1),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 3),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99)] * 1000, 3)
+    }
+
+
+def main():
+    """Run the check-in benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--registrations', type=int, default=50000, help='Registrations in the index')
+    parser.add_argument('--scans', type=int, default=5000, help='Scans sent to the endpoint')
+    parser.add_argument('--scanners', type=int, default=4, help='Concurrent scanner connections')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    registrations = make_registrations(args.registrations)
+    
+    start = time.perf_counter()
+    index = RegistrationIndex(registrations)
+    build_seconds = time.perf_counter() - start
+    print(f"Indexed {len(index)} registrations in {build_seconds:.3f}s")
+    
+    lookups = benchmark_lookups(index, registrations, min(args.scans, len(registrations)))
+    
+    with tempfile.TemporaryDirectory() as log_dir:
+        service = CheckInService(index, os.path.join(log_dir, 'checkins.jsonl'))
+        scans = [r['registration_id'] for r in registrations[:args.scans]]
+        endpoint = asyncio.run(benchmark_endpoint(service, scans, args.scanners))
+        service.log.close()
+    
+    print("\n| Scan | us/lookup |")
+    print("|------|-----------|")
+    for kind, stats in lookups.items():
+        print(f"| {kind} | {stats['us_per_lookup']:.2f} |")
+    
+    print(f"\nEndpoint: {endpoint['scans_per_second']:.0f} scans/s with {endpoint['scanners']} scanners "
+          f"(p50 {endpoint['p50_ms']:.3f} ms, p99 {endpoint['p99_ms']:.3f} ms)")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'registrations': args.registrations, 'index_seconds': round(build_seconds, 4),
+                       'lookups': lookups, 'endpoint': endpoint}, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+QR Code and Barcode Rendering Benchmark
+
+This script compares render time and output size of the raster (PNG) and vector (SVG and
+ReportLab drawing) code paths of the enhanced registration module for a batch of registration IDs.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from enhanced_registration_module import EnhancedExjamRegistrationModule, CODE_OUTPUT_FORMATS
+from reportlab.graphics import renderPDF
+
+
+def output_size(code) -> int:
+    """Return the size in bytes of a rendered code (drawings are measured as a one-page PDF)."""
+    if hasattr(code, 'getvalue'):
+        return len(code.getvalue())
+    return len(renderPDF.drawToString(code))
+
+
+def benchmark_format(registration, registration_ids, output_format: str) -> dict:
+    """
+    Time QR code and barcode rendering for every registration ID in one output format.
+    
+    Args:
+        registration (EnhancedExjamRegistrationModule): Module used to render the codes
+        registration_ids (list): Registration IDs to encode
+        output_format (str): 'png', 'svg' or 'drawing'
+        
+    Returns:
+        dict: Render time and output size for QR codes and barcodes
+    """
+    results = {}
+    
+    for kind in ['qr_code', 'barcode']:
+        codes = []
+        start = time.perf_counter()
+        for registration_id in registration_ids:
+            if kind == 'qr_code':
+                codes.append(registration.render_qr_code(registration._registration_qr_data(registration_id),
+                                                         output_format=output_format))
+            else:
+                codes.append(registration.render_barcode(registration_id, "code128", output_format))
+        elapsed = time.perf_counter() - start
+        
+        # Sizes are measured outside the timed loop
+        total_bytes = sum(output_size(code) for code in codes)
+        
+        results[kind] = {
+            'seconds': round(elapsed, 4),
+            'ms_per_code': round(elapsed * 1000 / len(registration_ids), 4),
+            'avg_bytes': round(total_bytes / len(registration_ids), 1)
+        }
+    
+    return results
+
+
+def main():
+    """Run the code rendering benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=1000, help='Number of registration IDs to render')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    # No cache, so every call measures a full encode
+    registration = EnhancedExjamRegistrationModule()
+    registration_ids = [f"EXJAM-20251128{index:06d}-{index * 7919 % 0xFFFFFFFF:08X}"
+                        for index in range(args.count)]
+    
+    results = {}
+    for output_format in CODE_OUTPUT_FORMATS:
+        print(f"Rendering {args.count} codes as {output_format}...")
+        results[output_format] = benchmark_format(registration, registration_ids, output_format)
+    
+    print("\n| Format | Code | ms/code | Avg size (bytes) |")
+    print("|--------|------|---------|------------------|")
+    for output_format, kinds in results.items():
+        for kind, stats in kinds.items():
+            print(f"| {output_format} | {kind} | {stats['ms_per_code']:.3f} | {stats['avg_bytes']:.0f} |")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'count': args.count, 'results': results}, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Import-Time Startup Benchmark
+
+This script measures the import cost of the analysis and registration modules with
+``python -X importtime`` and fails when a module exceeds its startup budget or pulls in one
+of the heavy dependencies that should only load when the feature needing it is used.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Modules checked, with the directory they are imported from
+MODULES = {
+    'alumni_analysis': os.path.join(TOOLS_DIR, 'analysis'),
+    'enhanced_registration_module': os.path.join(TOOLS_DIR, 'data-collection'),
+    'columnar_storage': os.path.join(TOOLS_DIR, 'data-collection'),
+    'form_export': os.path.join(TOOLS_DIR, 'data-collection'),
+    'code_cache': os.path.join(TOOLS_DIR, 'data-collection'),
+    'registration_report': os.path.join(TOOLS_DIR, 'data-collection'),
+    'async_forms_client': os.path.join(TOOLS_DIR, 'data-collection'),
+    'checkin_service': os.path.join(TOOLS_DIR, 'data-collection'),
+    'qr_payload': os.path.join(TOOLS_DIR, 'data-collection'),
+    'registration_ids': os.path.join(TOOLS_DIR, 'data-collection'),
+    'badge_renderer': os.path.join(TOOLS_DIR, 'data-collection'),
+    'event_exports': os.path.join(TOOLS_DIR, 'data-collection'),
+    'multi_select': os.path.join(TOOLS_DIR, 'data-collection'),
+    'instrumentation': os.path.join(TOOLS_DIR, 'data-collection')
+}
+
+# Packages that must not be imported at module load
+HEAVY_PACKAGES = (
+    'pandas', 'numpy', 'matplotlib', 'seaborn', 'pyarrow', 'qrcode', 'barcode',
+    'reportlab', 'PIL', 'googleapiclient', 'google_auth_oauthlib', 'google.oauth2'
+)
+
+# Heavy packages a module may import at load time because drawing with them is all it does
+# (the module itself is only imported by the feature that needs it)
+ALLOWED_HEAVY_IMPORTS = {
+    'badge_renderer': ('reportlab', 'PIL')
+}
+
+
+def measure_import(module: str, path: str) -> dict:
+    """
+    Import a module in a fresh interpreter with ``-X importtime``.
+    
+    Args:
+        module (str): Module name
+        path (str): Directory to put on ``sys.path``
+    
+    Returns:
+        dict: Cumulative import time of the module (ms) and every module it imported
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=path, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': path}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    
+    cumulative_ms = None
+    imported = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            cumulative_ms = int(cumulative) / 1000
+    
+    return {'ms': cumulative_ms, 'imported': imported}
+
+
+def main():
+    """Run the import-time benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget-ms', type=float, default=150, help='Maximum import time per module')
+    parser.add_argument('--repeat', type=int, default=5, help='Imports per module (the fastest is kept)')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    results = {}
+    failures = []
+    
+    for module, path in MODULES.items():
+        runs = [measure_import(module, path) for _ in range(args.repeat)]
+        best_ms = min(run['ms'] for run in runs)
+        heavy = sorted({name for name in runs[0]['imported']
+                        if any(name == package or name.startswith(f"{package}.") for package in HEAVY_PACKAGES)})
+        heavy_roots = sorted({name.split('.')[0] for name in heavy})
+        
+        results[module] = {'ms': round(best_ms, 1), 'heavy_imports': heavy_roots}
+        if best_ms > args.budget_ms:
+            failures.append(f"{module} takes {best_ms:.1f} ms to import (budget {args.budget_ms:.0f} ms)")
+        unexpected = [name for name in heavy_roots if name not in ALLOWED_HEAVY_IMPORTS.get(module, ())]
+        if unexpected:
+            failures.append(f"{module} imports {', '.join(unexpected)} at load time")
+    
+    print("| Module | Import (ms) | Heavy imports |")
+    print("|--------|-------------|---------------|")
+    for module, stats in results.items():
+        print(f"| {module} | {stats['ms']:.1f} | {', '.join(stats['heavy_imports']) or '-'} |")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'budget_ms': args.budget_ms, 'results': results, 'failures': failures}, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+    
+    if failures:
+        print("\nStartup budget exceeded:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    
+    print(f"\nAll modules within the {args.budget_ms:.0f} ms startup budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Multi-Select Answer Benchmark
+
+This script generates seeded synthetic checkbox answers and compares per-option counts and
+option co-occurrence computed with pandas string splitting (``str.get_dummies`` and a matrix
+product) against the bitset encoding of ``multi_select.MultiSelectIndex``, for a small and a
+large number of options.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+import numpy as np
+import pandas as pd
+from form_export import ANSWER_SEPARATOR
+from multi_select import MultiSelectIndex
+
+
+def synthetic_answers(rows: int, options: int, max_choices: int, seed: int = 42) -> tuple:
+    """
+    Build seeded joined checkbox answers.
+    
+    Args:
+        rows (int): Number of registrations
+        options (int): Number of options on the question
+        max_choices (int): Most options chosen by one registration
+        seed (int): Random seed
+    
+    Returns:
+        tuple: Option names, and categorical joined answers as loaded from a columnar export
+    """
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Session {index}: Topic {index}" for index in range(options)], dtype=object)
+    # Popularity follows a Zipf-like curve, so a few combinations are common
+    weights = 1 / np.arange(1, options + 1)
+    weights /= weights.sum()
+    
+    # Build a pool of combinations and draw registrations from it
+    pool = []
+    for _ in range(min(rows, 20000)):
+        chosen = rng.choice(options, size=rng.integers(1, max_choices + 1), replace=False, p=weights)
+        pool.append(ANSWER_SEPARATOR.join(names[np.sort(chosen)]))
+    picks = rng.integers(0, len(pool), rows)
+    return list(names), pd.Series(np.array(pool, dtype=object)[picks]).astype('category')
+
+
+def pandas_counts(answers: pd.Series):
+    """Per-option counts and co-occurrence with a dummy-column split and a matrix product."""
+    indicator = answers.astype(object).str.get_dummies(sep=ANSWER_SEPARATOR)
+    counts = indicator.sum()
+    values = indicator.to_numpy(dtype=float)
+    co_occurrence = pd.DataFrame(values.T @ values, index=indicator.columns, columns=indicator.columns)
+    return counts[counts > 0], co_occurrence.round().astype('int64')
+
+
+def bitset_counts(options: list, answers: pd.Series):
+    """Per-option counts and co-occurrence from the bitset encoding."""
+    index = MultiSelectIndex(options)
+    bits = index.encode(answers)
+    return index.option_counts(bits), index.co_occurrence(bits)
+
+
+def timed(function, *args):
+    """Run a function and return (seconds, result)."""
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    """Run the multi-select benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000, help='Synthetic registrations')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic data')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    # (options, most choices per registration)
+    scenarios = [(8, 4), (200, 8)]
+    results = {}
+    
+    for options, max_choices in scenarios:
+        name = f"{options} options"
+        print(f"Generating {args.rows} answers with {options} options...")
+        names, answers = synthetic_answers(args.rows, options, max_choices, args.seed)
+        
+        bitset_seconds, (bit_counts, bit_matrix) = timed(bitset_counts, names, answers)
+        pandas_seconds, (pandas_option_counts, pandas_matrix) = timed(pandas_counts, answers)
+        
+        # Both methods must agree before their timings are compared
+        assert dict(bit_counts) == pandas_option_counts.to_dict()
+        labels = list(pandas_matrix.index)
+        assert (bit_matrix.loc[labels, labels].to_numpy() == pandas_matrix.to_numpy()).all()
+        
+        results[name] = {
+            'distinct_combinations': int(answers.cat.categories.size),
+            'pandas_seconds': round(pandas_seconds, 4),
+            'bitset_seconds': round(bitset_seconds, 4),
+            'speedup': round(pandas_seconds / bitset_seconds, 1)
+        }
+    
+    print(f"\n| Scenario ({args.rows} rows) | Combinations | pandas split (s) | Bitset (s) | Speedup |")
+    print("|----------|--------------|------------------|------------|---------|")
+    for name, stats in results.items():
+        print(f"| {name} | {stats['distinct_combinations']} | {stats['pandas_seconds']:.4f} | "
+              f"{stats['bitset_seconds']:.4f} | {stats['speedup']}x |")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'rows': args.rows, 'seed': args.seed, 'results': results}, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
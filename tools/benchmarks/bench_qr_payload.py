@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+QR Payload Format Benchmark
+
+This script compares the original pretty-printed JSON registration payload with the compact
+signed base45 payload: payload length, resulting QR version, render time and decode time.
+Decode time covers parsing (and, for the compact format, verifying) the scanned text; when
+pyzbar is installed the rendered images are also decoded.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+import qrcode
+from enhanced_registration_module import EnhancedExjamRegistrationModule, QR_ERROR_CORRECTION, QR_PAYLOAD_FORMATS
+
+try:
+    from PIL import Image
+    from pyzbar.pyzbar import decode as zbar_decode
+except ImportError:
+    zbar_decode = None
+
+FORM_URL = "https://docs.google.com/forms/d/e/1FAIpQLSexjamPGConference2025Registration/viewform"
+
+
+def qr_version(data: str, error_correction: str = 'L') -> int:
+    """Return the smallest QR version that holds the payload."""
+    qr = qrcode.QRCode(version=None, error_correction=QR_ERROR_CORRECTION[error_correction])
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr.version
+
+
+def benchmark_format(registration, registration_ids, payload_format: str, error_correction: str) -> dict:
+    """
+    Measure one payload format for every registration ID.
+    
+    Args:
+        registration (EnhancedExjamRegistrationModule): Module configured for the payload format
+        registration_ids (list): Registration IDs to encode
+        payload_format (str): 'compact' or 'json'
+        error_correction (str): QR error correction level
+    
+    Returns:
+        dict: Payload length, QR versions, render time and decode time
+    """
+    payloads = [registration._registration_qr_data(registration_id, FORM_URL)
+                for registration_id in registration_ids]
+    versions = [qr_version(payload, error_correction) for payload in payloads]
+    
+    start = time.perf_counter()
+    images = [registration.render_qr_code(payload, error_correction=error_correction) for payload in payloads]
+    render_seconds = time.perf_counter() - start
+    
+    if payload_format == 'compact':
+        codec = registration.payload_codec()
+        parse = lambda payload: codec.decode(payload)['registration_id']
+    else:
+        parse = lambda payload: json.loads(payload)['registration_id']
+    
+    start = time.perf_counter()
+    decoded = [parse(payload) for payload in payloads]
+    decode_seconds = time.perf_counter() - start
+    assert decoded == registration_ids
+    
+    results = {
+        'avg_payload_chars': round(sum(map(len, payloads)) / len(payloads), 1),
+        'min_version': min(versions),
+        'max_version': max(versions),
+        'render_ms_per_code': round(render_seconds * 1000 / len(payloads), 4),
+        'decode_us_per_payload': round(decode_seconds * 1e6 / len(payloads), 2),
+        'avg_png_bytes': round(sum(len(image.getvalue()) for image in images) / len(images), 1)
+    }
+    
+    if zbar_decode is not None:
+        start = time.perf_counter()
+        for image in images:
+            zbar_decode(Image.open(image))
+        results['image_decode_ms_per_code'] = round((time.perf_counter() - start) * 1000 / len(images), 4)
+    
+    return results
+
+
+def main():
+    """Run the QR payload benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=500, help='Number of registration IDs to encode')
+    parser.add_argument('--error-correction', choices=list(QR_ERROR_CORRECTION), default='L',
+                        help='QR error correction level')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    registration_ids = [f"EXJAM-20251128{index:06d}-{index * 7919 % 0xFFFFFFFF:08X}"
+                        for index in range(args.count)]
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as key_dir:
+        for payload_format in QR_PAYLOAD_FORMATS:
+            print(f"Encoding {args.count} {payload_format} payloads...")
+            # No cache, so every call measures a full encode
+            registration = EnhancedExjamRegistrationModule(qr_payload_format=payload_format,
+                                                           payload_key_file=os.path.join(key_dir, 'bench.key'))
+            results[payload_format] = benchmark_format(registration, registration_ids, payload_format,
+                                                       args.error_correction)
+    
+    print("\n| Payload | Avg chars | QR version | Render (ms/code) | Decode (us/payload) | Avg PNG (bytes) |")
+    print("|---------|-----------|------------|------------------|---------------------|-----------------|")
+    for payload_format, stats in results.items():
+        versions = f"{stats['min_version']}-{stats['max_version']}" \
+            if stats['min_version'] != stats['max_version'] else str(stats['min_version'])
+        print(f"| {payload_format} | {stats['avg_payload_chars']} | {versions} | {stats['render_ms_per_code']} | "
+              f"{stats['decode_us_per_payload']} | {stats['avg_png_bytes']} |")
+    
+    if zbar_decode is None:
+        print("\npyzbar is not installed; image decode time was not measured.")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'count': args.count, 'error_correction': args.error_correction, 'results': results},
+                      f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
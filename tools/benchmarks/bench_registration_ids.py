@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Registration ID Generation Benchmark
+
+This script compares the original timestamp-plus-uuid4 registration IDs with the ULID-style
+generator: IDs per second one at a time and in batches, with and without the persistent
+registry, plus a multi-process run that checks every registry ID is unique and increasing.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from registration_ids import IdGenerator, is_valid_id
+
+
+def legacy_id(prefix: str = "EXJAM") -> str:
+    """Build an ID the way generate_unique_id originally did."""
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    unique_part = str(uuid.uuid4())[:8].upper()
+    return f"{prefix}-{timestamp}-{unique_part}"
+
+
+def time_ids(generate, count: int) -> dict:
+    """
+    Time an ID generation strategy.
+    
+    Args:
+        generate (callable): Returns a list of ``count`` IDs
+        count (int): Number of IDs
+    
+    Returns:
+        dict: IDs per second and the number of duplicate IDs
+    """
+    start = time.perf_counter()
+    ids = generate(count)
+    elapsed = time.perf_counter() - start
+    return {'ids_per_second': round(count / elapsed), 'duplicates': count - len(set(ids))}
+
+
+def allocate_in_process(registry_file: str, batches: int, batch_size: int) -> list:
+    """Allocate batches of IDs from a shared registry inside a worker process."""
+    generator = IdGenerator(registry_file=registry_file)
+    ids = []
+    for _ in range(batches):
+        ids.extend(generator.allocate(batch_size))
+    return ids
+
+
+def main():
+    """Run the registration ID benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000, help='IDs generated per strategy')
+    parser.add_argument('--batch-size', type=int, default=1000, help='IDs per batch allocation')
+    parser.add_argument('--processes', type=int, default=4, help='Processes sharing one registry')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    # Each single-ID registry call locks and fsyncs the registry, so fewer of them are timed
+    single_count = min(args.count, 2000)
+    batches = max(1, args.count // args.batch_size)
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as registry_dir:
+        registry_file = os.path.join(registry_dir, 'registration_ids.log')
+        memory = IdGenerator()
+        registry = IdGenerator(registry_file=registry_file)
+        
+        strategies = {
+            'legacy (datetime + uuid4)': (lambda n: [legacy_id() for _ in range(n)], args.count),
+            'new_id, in memory': (lambda n: [memory.new_id() for _ in range(n)], args.count),
+            'allocate, in memory': (lambda n: [i for _ in range(batches) for i in memory.allocate(args.batch_size)],
+                                    batches * args.batch_size),
+            'new_id, registry': (lambda n: [registry.new_id() for _ in range(n)], single_count),
+            'allocate, registry': (lambda n: [i for _ in range(batches) for i in registry.allocate(args.batch_size)],
+                                   batches * args.batch_size)
+        }
+        
+        for name, (generate, count) in strategies.items():
+            print(f"Generating {count} IDs: {name}...")
+            results[name] = {'count': count, **time_ids(generate, count)}
+        
+        shared_file = os.path.join(registry_dir, 'shared.log')
+        per_process = max(1, batches // args.processes)
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            runs = list(executor.map(allocate_in_process, [shared_file] * args.processes,
+                                     [per_process] * args.processes, [args.batch_size] * args.processes))
+        
+        with open(shared_file, 'r') as f:
+            registry_ids = f.read().split()
+        issued = [registration_id for run in runs for registration_id in run]
+        results['multi-process registry'] = {
+            'processes': args.processes,
+            'count': len(issued),
+            'duplicates': len(issued) - len(set(issued)),
+            'registry_increasing': registry_ids == sorted(registry_ids) and len(registry_ids) == len(issued),
+            'check_characters_valid': all(is_valid_id(registration_id) for registration_id in registry_ids)
+        }
+    
+    print("\n| Strategy | IDs | IDs/s | Duplicates |")
+    print("|----------|-----|-------|------------|")
+    for name, stats in results.items():
+        print(f"| {name} | {stats['count']} | {stats.get('ids_per_second', '-')} | {stats['duplicates']} |")
+    
+    shared = results['multi-process registry']
+    print(f"\nShared registry across {shared['processes']} processes: "
+          f"increasing={shared['registry_increasing']}, check characters valid={shared['check_characters_valid']}")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Registration Report Benchmark
+
+This script generates seeded synthetic registrations and compares the original report
+generation (repeated ``value_counts``, ``to_markdown`` and a raw special-needs list) with the
+report engine (categorical aggregates computed once and a streamed Markdown template).
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+import pandas as pd
+from columnar_storage import REGISTRATION_CATEGORICAL_COLUMNS, REGISTRATION_REPORT_COLUMNS, read_table, write_table
+from registration_report import COMPREHENSIVE_REPORT_TEMPLATE, compute_aggregates, write_registration_report
+from synthetic_data import synthetic_registrations
+
+
+def legacy_report(df: pd.DataFrame, output_file: str) -> str:
+    """Write the report the way generate_comprehensive_report originally built it."""
+    report = f"""# ExJAM PG Conference Comprehensive Registration Report
+
+Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+## Executive Summary
+- **Total Registrations**: {len(df)}
+- **Registration Period**: {df['created_time'].min()} to {df['created_time'].max()}
+
+## Registration Statistics
+
+### Graduation Year Distribution
+{df['Graduation Year from Air Force Military School Jos'].value_counts().to_markdown()}
+
+### Geographic Distribution
+{df['Current Location (City, State/Province, Country)'].value_counts().head(10).to_markdown()}
+
+### Professional Distribution
+{df['Current Occupation/Profession'].value_counts().head(10).to_markdown()}
+
+### Accommodation Needs
+{df['Do you need accommodation assistance?'].value_counts().to_markdown()}
+
+### Transportation Needs
+{df['Do you need transportation assistance from the airport?'].value_counts().to_markdown()}
+
+### Session Interests
+{df['Which conference sessions are you most interested in? (Select all that apply)'].value_counts().to_markdown()}
+
+### Speaking Interest
+{df['Would you be interested in speaking at the conference?'].value_counts().to_markdown()}
+
+## Dietary Requirements
+{df['Dietary Restrictions (for catering purposes)'].value_counts().to_markdown()}
+
+## Special Needs
+Special needs and accessibility requirements:
+{df['Special Needs or Accessibility Requirements'].dropna().to_list()}
+
+## Event Logistics Recommendations
+1. **Catering**: Plan for {df['Dietary Restrictions (for catering purposes)'].value_counts().get('None', 0)} standard meals
+2. **Accommodation**: {df['Do you need accommodation assistance?'].value_counts().get('Yes, I need accommodation', 0)} participants
+3. **Transportation**: {df['Do you need transportation assistance from the airport?'].value_counts().get('Yes, I need airport pickup', 0)} participants
+"""
+    with open(output_file, 'w') as f:
+        f.write(report)
+    return output_file
+
+
+def timed(function, *args) -> float:
+    """Run a function and return the seconds it took."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the registration report benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500000, help='Synthetic registrations')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic data')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant (the fastest is kept)')
+    parser.add_argument('--output', help='Optional JSON file for the results')
+    args = parser.parse_args()
+    
+    print(f"Generating {args.rows} synthetic registrations...")
+    df = synthetic_registrations(args.rows, args.seed)
+    
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        data_file = write_table(df, os.path.join(work_dir, 'registrations.parquet'), REGISTRATION_CATEGORICAL_COLUMNS)
+        legacy_file = os.path.join(work_dir, 'legacy.md')
+        engine_file = os.path.join(work_dir, 'engine.md')
+        
+        # Both variants read the same categorical Parquet file, so the difference is the report itself
+        loaded = read_table(data_file, REGISTRATION_REPORT_COLUMNS, REGISTRATION_CATEGORICAL_COLUMNS)
+        plain = loaded.astype(object)
+        
+        variants = {
+            'legacy, object columns': lambda: legacy_report(plain, legacy_file),
+            'legacy, categorical columns': lambda: legacy_report(loaded, legacy_file),
+            'engine (aggregate + render)': lambda: write_registration_report(compute_aggregates(loaded), engine_file,
+                                                                             COMPREHENSIVE_REPORT_TEMPLATE),
+            'engine, including Parquet load': lambda: write_registration_report(
+                compute_aggregates(read_table(data_file, REGISTRATION_REPORT_COLUMNS,
+                                              REGISTRATION_CATEGORICAL_COLUMNS)),
+                engine_file, COMPREHENSIVE_REPORT_TEMPLATE)
+        }
+        
+        for name, run in variants.items():
+            print(f"Timing {name}...")
+            seconds = min(timed(run) for _ in range(args.repeat))
+            results[name] = {'seconds': round(seconds, 4)}
+        
+        results['report_bytes'] = {'legacy': os.path.getsize(legacy_file), 'engine': os.path.getsize(engine_file)}
+    
+    baseline = results['legacy, object columns']['seconds']
+    print(f"\n| Variant ({args.rows} rows) | Seconds | Speedup |")
+    print("|---------|---------|---------|")
+    for name, stats in results.items():
+        if name != 'report_bytes':
+            print(f"| {name} | {stats['seconds']:.4f} | {baseline / stats['seconds']:.1f}x |")
+    print(f"\nReport size: legacy {results['report_bytes']['legacy']} bytes, "
+          f"engine {results['report_bytes']['engine']} bytes")
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'rows': args.rows, 'seed': args.seed, 'results': results}, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
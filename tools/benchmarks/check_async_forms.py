@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Forms Client Checks
+
+This script exports synthetic forms from the local Forms API stub of the export benchmark with
+injected failures, and checks that the asynchronous client retries 429 and 5xx responses (waiting
+for ``Retry-After``), refreshes rejected credentials once, follows every page exactly once and
+writes the exact number of rows, and that a form whose retries run out fails on its own.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from aiohttp import web
+from async_forms_client import FormsApiError, export_forms
+from bench_async_forms import StubFormsApi, count_rows
+
+# Stub forms, responses per form and page size used by every check
+FORMS = 2
+RESPONSES = 23
+PAGE_SIZE = 5
+
+# Pages per form, and the requests of an export without failures (forms.get plus every page)
+PAGES = -(-RESPONSES // PAGE_SIZE)
+CLEAN_REQUESTS = FORMS * (1 + PAGES)
+
+
+class StubCredentials:
+    def __init__(self, stub: StubFormsApi, token: str):
+        """
+        Stand-in for google-auth credentials whose tokens are issued by the stub.
+        
+        Args:
+            stub (StubFormsApi): Stub that accepts the refreshed tokens
+            token (str): Token held before the first refresh
+        """
+        self.stub = stub
+        self.token = token
+        self.expiry = None
+        self.refreshes = 0
+    
+    @property
+    def valid(self) -> bool:
+        return self.token is not None
+    
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = self.stub.issue_token()
+
+
+@asynccontextmanager
+async def serve(stub: StubFormsApi):
+    """Serve a stub on a free local port and yield its base URL."""
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    try:
+        host, port = runner.addresses[0][:2]
+        yield f"http://{host}:{port}"
+    finally:
+        await runner.cleanup()
+
+
+async def export(stub: StubFormsApi, work_dir: str, credentials=None, **client_options) -> dict:
+    """Export every stub form into a work directory and return the rows written (or the error) per form."""
+    exports = [(form_id, os.path.join(work_dir, f"{form_id}.csv")) for form_id in stub.pages]
+    async with serve(stub) as base_url:
+        options = {'backoff_base': 0.01, 'requests_per_minute': {'read': 60000}, **client_options}
+        written = await export_forms(exports, credentials, page_size=PAGE_SIZE, schema_cache_dir=None,
+                                     base_url=base_url, **options)
+    return {form_id: written[output] if isinstance(written[output], Exception) else count_rows(output)
+            for form_id, output in exports}
+
+
+def new_stub() -> StubFormsApi:
+    """Return a stub with no latency and no random errors."""
+    return StubFormsApi(FORMS, RESPONSES, PAGE_SIZE, latency=0, error_rate=0, retry_after=0, seed=7)
+
+
+def assert_complete(stub: StubFormsApi, rows: dict):
+    """Every form exported all its responses, and every page was served exactly once."""
+    assert rows == {form_id: RESPONSES for form_id in stub.pages}, rows
+    expected_pages = {(form_id, index): 1 for form_id in stub.pages for index in range(PAGES)}
+    assert dict(stub.pages_served) == expected_pages, stub.pages_served
+
+
+async def check_retries(work_dir: str):
+    """429, 500 and 503 responses are retried and the rows are exported once each."""
+    stub = new_stub()
+    stub.inject(429, 500, 503, 500, 502)
+    rows = await export(stub, work_dir)
+    
+    assert_complete(stub, rows)
+    assert stub.errors == 5 and not stub.injected
+    assert stub.requests == CLEAN_REQUESTS + 5, stub.requests
+
+
+async def check_retry_after(work_dir: str):
+    """A 429 holds the retry for its Retry-After seconds rather than the (much shorter) backoff."""
+    stub = new_stub()
+    stub.inject(429, retry_after=0.5)
+    start = time.perf_counter()
+    rows = await export(stub, work_dir, backoff_base=0.001)
+    elapsed = time.perf_counter() - start
+    
+    assert_complete(stub, rows)
+    assert elapsed >= 0.5, f"retried after {elapsed:.3f}s"
+
+
+async def check_unauthorized_refresh(work_dir: str):
+    """A 401 refreshes the credentials once and the request is retried with the new token."""
+    stub = new_stub()
+    stub.tokens = set()
+    credentials = StubCredentials(stub, 'revoked-token')
+    rows = await export(stub, work_dir, credentials, concurrency=1)
+    
+    assert_complete(stub, rows)
+    assert credentials.refreshes == 1, credentials.refreshes
+    assert stub.unauthorized == 1, stub.unauthorized
+
+
+async def check_retries_exhausted(work_dir: str):
+    """A form whose retries run out fails with FormsApiError, without stopping the other form."""
+    stub = new_stub()
+    stub.inject(*[500] * 3, form_id='form-0')
+    rows = await export(stub, work_dir, max_retries=2)
+    
+    assert isinstance(rows['form-0'], FormsApiError) and rows['form-0'].status == 500, rows
+    assert rows['form-1'] == RESPONSES, rows
+    assert not os.path.exists(os.path.join(work_dir, 'form-0.csv.watermark.json'))
+
+
+async def run_checks() -> int:
+    """Run every check in its own work directory and return the number of failures."""
+    checks = [check_retries, check_retry_after, check_unauthorized_refresh, check_retries_exhausted]
+    failed = 0
+    for check in checks:
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                await check(work_dir)
+            except AssertionError as e:
+                failed += 1
+                print(f"FAIL {check.__name__}: {e}")
+            else:
+                print(f"ok   {check.__name__}")
+    return failed
+
+
+def main():
+    """Run the asynchronous Forms client checks."""
+    sys.exit(1 if asyncio.run(run_checks()) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Form Export Checks
+
+This script runs the Google Forms CSV export against an in-memory fake of the Forms API and
+checks the incremental merge: a response edited after the previous export replaces its earlier
+row instead of being appended a second time, questions added to the form get new columns, and
+an export interrupted by an API error leaves the previous file untouched.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from form_export import FormResponseExporter
+
+
+class FakeRequest:
+    def __init__(self, function):
+        """Wrap a callable as an API request with an ``execute`` method."""
+        self.function = function
+    
+    def execute(self):
+        return self.function()
+
+
+class FakeFormsService:
+    def __init__(self, questions: list):
+        """
+        Initialize the fake Forms API service.
+        
+        Args:
+            questions (list): Question IDs of the form
+        """
+        self.questions = list(questions)
+        self.responses_by_id = {}
+        self.fail_at_page = None
+    
+    def forms(self):
+        return self
+    
+    def responses(self):
+        return self
+    
+    def submit(self, response_id: str, second: int, answers: dict):
+        """Submit (or edit) a response at a given second past midnight."""
+        timestamp = f"2025-01-01T00:{second // 60:02d}:{second % 60:02d}Z"
+        created = self.responses_by_id.get(response_id, {}).get('createdTime', timestamp)
+        self.responses_by_id[response_id] = {
+            'responseId': response_id,
+            'createdTime': created,
+            'lastSubmittedTime': timestamp,
+            'answers': {question: {'questionId': question, 'textAnswers': {'answers': [{'value': value}]}}
+                        for question, value in answers.items()}
+        }
+    
+    def get(self, formId: str, fields: str = None):
+        items = [{'itemId': question, 'title': question.upper(), 'questionItem': {'question': {'questionId': question}}}
+                 for question in self.questions]
+        return FakeRequest(lambda: {'formId': formId, 'revisionId': str(len(self.questions)), 'items': items})
+    
+    def list(self, formId: str, pageSize: int, filter: str = None, pageToken: str = None):
+        def execute():
+            since = filter.partition('>')[2].strip() if filter else ''
+            matching = sorted((response for response in self.responses_by_id.values()
+                               if response['lastSubmittedTime'] > since),
+                              key=lambda response: response['lastSubmittedTime'])
+            page_index = int(pageToken or 0)
+            if self.fail_at_page is not None and page_index >= self.fail_at_page:
+                raise RuntimeError("Forms API unavailable")
+            result = {'responses': matching[page_index * pageSize:(page_index + 1) * pageSize]}
+            if (page_index + 1) * pageSize < len(matching):
+                result['nextPageToken'] = str(page_index + 1)
+            return result
+        return FakeRequest(execute)
+
+
+def read_rows(output_file: str) -> list:
+    """Return the rows of a CSV export as dicts."""
+    with open(output_file, 'r', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def check_edited_response(work_dir: str):
+    """An edited response replaces its earlier row in an incremental export."""
+    output_file = os.path.join(work_dir, 'edited.csv')
+    service = FakeFormsService(['q1', 'q2'])
+    exporter = FormResponseExporter(service, page_size=2, schema_cache_dir=None)
+    for index in range(5):
+        service.submit(f"r{index}", index, {'q1': f"first {index}", 'q2': 'yes'})
+    assert exporter.export_to_csv('form', output_file, incremental=True) == 5
+    
+    # r1 is edited and r5 is new; both arrive on the next incremental run
+    service.submit('r1', 10, {'q1': 'edited', 'q2': 'no'})
+    service.submit('r5', 11, {'q1': 'first 5', 'q2': 'yes'})
+    assert exporter.export_to_csv('form', output_file, incremental=True) == 2
+    
+    rows = read_rows(output_file)
+    response_ids = [row['response_id'] for row in rows]
+    assert sorted(response_ids) == [f"r{index}" for index in range(6)], response_ids
+    edited = next(row for row in rows if row['response_id'] == 'r1')
+    assert (edited['Q1'], edited['Q2'], edited['last_submitted_time']) == ('edited', 'no', '2025-01-01T00:00:10Z')
+    assert not os.path.exists(f"{output_file}.dedup.tmp")
+    
+    # Nothing new: the export is left as it is
+    assert exporter.export_to_csv('form', output_file, incremental=True) == 0
+    assert len(read_rows(output_file)) == 6
+
+
+def check_edited_response_with_new_question(work_dir: str):
+    """An edit merged while the export gains a column keeps one row per response."""
+    output_file = os.path.join(work_dir, 'new_question.csv')
+    service = FakeFormsService(['q1'])
+    exporter = FormResponseExporter(service, page_size=2, schema_cache_dir=None)
+    for index in range(3):
+        service.submit(f"r{index}", index, {'q1': f"first {index}"})
+    exporter.export_to_csv('form', output_file, incremental=True)
+    
+    service.questions.append('q2')
+    service.submit('r0', 10, {'q1': 'edited', 'q2': 'added'})
+    assert exporter.export_to_csv('form', output_file, incremental=True) == 1
+    
+    rows = read_rows(output_file)
+    assert [row['response_id'] for row in rows] == ['r1', 'r2', 'r0'], rows
+    assert list(rows[0]) == ['response_id', 'created_time', 'last_submitted_time', 'Q1', 'Q2']
+    assert (rows[0]['Q2'], rows[2]['Q1'], rows[2]['Q2']) == ('', 'edited', 'added')
+
+
+def check_failed_export(work_dir: str):
+    """A full export interrupted by an API error keeps the previous file."""
+    output_file = os.path.join(work_dir, 'failed.csv')
+    service = FakeFormsService(['q1'])
+    exporter = FormResponseExporter(service, page_size=2, schema_cache_dir=None)
+    for index in range(5):
+        service.submit(f"r{index}", index, {'q1': f"first {index}"})
+    exporter.export_to_csv('form', output_file)
+    with open(output_file, 'r') as f:
+        before = f.read()
+    
+    service.fail_at_page = 1
+    try:
+        exporter.export_to_csv('form', output_file)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("The API error was not raised")
+    
+    with open(output_file, 'r') as f:
+        assert f.read() == before
+    assert not os.path.exists(f"{output_file}.tmp")
+
+
+def main():
+    """Run the form export checks."""
+    checks = [check_edited_response, check_edited_response_with_new_question, check_failed_export]
+    failed = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        for check in checks:
+            try:
+                check(work_dir)
+            except AssertionError as e:
+                failed += 1
+                print(f"FAIL {check.__name__}: {e}")
+            else:
+                print(f"ok   {check.__name__}")
+    
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
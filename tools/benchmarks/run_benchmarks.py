@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+ExJAM Benchmark Suite
+
+This script times the hot paths of the toolchain on seeded synthetic data at several scales:
+alumni analyses, form response flattening and CSV export, QR code and barcode rendering,
+single and bulk badge generation, and report generation. Results are saved as JSON together
+with the git commit, so runs on different commits can be compared with ``--compare``.
+
+Rendering benchmarks (codes and badges) cost milliseconds per item, so they run on at most
+``--render-limit`` items at every scale and report the time per item.
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+from synthetic_data import iter_form_responses, registration_form, synthetic_alumni, synthetic_participants, \
+    synthetic_registrations
+
+# Named benchmark scales (rows of survey data, form responses and registrations)
+SCALES = {
+    '1k': 1000,
+    '100k': 100000,
+    '1m': 1000000
+}
+
+# Slowdown ratio reported as a regression by --compare
+REGRESSION_THRESHOLD = 1.2
+
+# Timings under this many seconds are too noisy to compare
+MIN_COMPARED_SECONDS = 0.02
+
+
+def timed(function, repeat: int = 1) -> tuple:
+    """
+    Run a function ``repeat`` times.
+    
+    Args:
+        function (callable): Function without arguments
+        repeat (int): Number of runs (the fastest is kept)
+    
+    Returns:
+        tuple: (fastest seconds, result of the last run)
+    """
+    best = None
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def case(seconds: float, items: int) -> dict:
+    """Build the result entry for one timed case."""
+    return {
+        'seconds': round(seconds, 4),
+        'items': items,
+        'us_per_item': round(seconds * 1e6 / items, 2) if items else None
+    }
+
+
+def bench_analysis(rows: int, args, work_dir: str) -> dict:
+    """Time the alumni analyses: in-memory, streaming, incremental append and the report."""
+    from alumni_analysis import CATEGORICAL_COLUMNS, AlumniAnalyzer
+    from columnar_storage import write_table
+    
+    survey = synthetic_alumni(rows, args.seed)
+    data_file = write_table(survey, os.path.join(work_dir, 'alumni.parquet'), CATEGORICAL_COLUMNS)
+    new_rows = synthetic_alumni(max(1, rows // 100), args.seed + 1)
+    results = {}
+    
+    analyzer = AlumniAnalyzer()
+    seconds, _ = timed(lambda: analyzer.load_data(data_file), args.repeat)
+    results['load_data'] = case(seconds, rows)
+    seconds, _ = timed(lambda: analyzer.run_all(force=True), args.repeat)
+    results['run_all'] = case(seconds, rows)
+    
+    streaming = AlumniAnalyzer()
+    seconds, _ = timed(lambda: streaming.analyze_stream(data_file), args.repeat)
+    results['analyze_stream'] = case(seconds, rows)
+    
+    # Appending 1% new rows to the state left by analyze_stream
+    state_file = os.path.join(work_dir, 'analysis_state.json')
+    streaming.state.save(state_file)
+    seconds, _ = timed(lambda: AlumniAnalyzer(state_file=state_file).append_data(new_rows, state_file=None),
+                       args.repeat)
+    results['append_data (1% new rows)'] = case(seconds, len(new_rows))
+    
+    report_file = os.path.join(work_dir, 'alumni_analysis_report.md')
+    seconds, _ = timed(lambda: analyzer.generate_report(report_file), args.repeat)
+    results['generate_report'] = case(seconds, rows)
+    
+    return results
+
+
+def bench_export(rows: int, args, work_dir: str) -> dict:
+    """Time flattening form responses and writing them to CSV, as the export does."""
+    from form_export import CompiledFlattener
+    
+    flattener = CompiledFlattener(registration_form())
+    output_file = os.path.join(work_dir, 'registration_responses.csv')
+    
+    # Responses are generated outside the timed section, one page at a time
+    flatten_seconds = 0.0
+    write_seconds = 0.0
+    with open(output_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(flattener.columns)
+        for page in iter_form_responses(rows, args.seed):
+            start = time.perf_counter()
+            flattened = [flattener.row(response) for response in page]
+            middle = time.perf_counter()
+            writer.writerows(flattened)
+            flatten_seconds += middle - start
+            write_seconds += time.perf_counter() - middle
+    
+    return {
+        'flatten': case(flatten_seconds, rows),
+        'flatten + csv write': case(flatten_seconds + write_seconds, rows),
+        'csv_bytes': os.path.getsize(output_file)
+    }
+
+
+def _registration_module(work_dir: str):
+    """Create an uncached registration module whose output stays in the work directory."""
+    from enhanced_registration_module import EnhancedExjamRegistrationModule
+    
+    return EnhancedExjamRegistrationModule(payload_key_file=os.path.join(work_dir, 'qr_payload.key'),
+                                           id_registry_file=os.path.join(work_dir, 'registration_ids.log'))
+
+
+def bench_codes(rows: int, args, work_dir: str) -> dict:
+    """Time QR code and barcode rendering in each output format."""
+    from enhanced_registration_module import CODE_OUTPUT_FORMATS
+    
+    registration = _registration_module(work_dir)
+    count = min(rows, args.render_limit)
+    registration_ids = registration.allocate_ids(count)
+    payloads = [registration._registration_qr_data(registration_id) for registration_id in registration_ids]
+    results = {}
+    
+    for output_format in CODE_OUTPUT_FORMATS:
+        seconds, _ = timed(lambda: [registration.render_qr_code(payload, output_format=output_format)
+                                    for payload in payloads], args.repeat)
+        results[f"qr_code ({output_format})"] = case(seconds, count)
+        seconds, _ = timed(lambda: [registration.render_barcode(registration_id, "code128", output_format)
+                                    for registration_id in registration_ids], args.repeat)
+        results[f"barcode ({output_format})"] = case(seconds, count)
+    
+    return results
+
+
+def bench_badges(rows: int, args, work_dir: str) -> dict:
+    """Time a single badge, bulk badges as separate files (in process and in a worker pool) and on a sheet."""
+    registration = _registration_module(work_dir)
+    count = min(rows, args.render_limit)
+    participants = synthetic_participants(count, args.seed)
+    registration_ids = registration.allocate_ids(count)
+    for participant, registration_id in zip(participants, registration_ids):
+        participant['registration_id'] = registration_id
+    results = {}
+    
+    single_file = os.path.join(work_dir, 'single_badge.pdf')
+    seconds, _ = timed(lambda: registration.create_participant_badge(participants[0], single_file), args.repeat)
+    results['single badge'] = case(seconds, 1)
+    seconds, _ = timed(lambda: registration.generate_bulk_badges(participants, workers=1), args.repeat)
+    results['bulk badges (files)'] = case(seconds, count)
+    seconds, _ = timed(lambda: registration.generate_bulk_badges(participants, workers=args.badge_workers,
+                                                                 chunk_size=max(1, count // (args.badge_workers * 4))),
+                       args.repeat)
+    results['bulk badges (files, worker pool)'] = case(seconds, count)
+    seconds, _ = timed(lambda: registration.generate_bulk_badges(participants, workers=1, layout='2x4'),
+                       args.repeat)
+    results['bulk badges (2x4 sheet)'] = case(seconds, count)
+    
+    return results
+
+
+def bench_report(rows: int, args, work_dir: str) -> dict:
+    """Time the registration report engine, from memory and including the Parquet load."""
+    from columnar_storage import REGISTRATION_CATEGORICAL_COLUMNS, REGISTRATION_REPORT_COLUMNS, read_table, \
+        write_table
+    from registration_report import COMPREHENSIVE_REPORT_TEMPLATE, compute_aggregates, \
+        generate_registration_report, write_registration_report
+    
+    registrations = synthetic_registrations(rows, args.seed)
+    data_file = write_table(registrations, os.path.join(work_dir, 'registrations.parquet'),
+                            REGISTRATION_CATEGORICAL_COLUMNS)
+    loaded = read_table(data_file, REGISTRATION_REPORT_COLUMNS, REGISTRATION_CATEGORICAL_COLUMNS)
+    report_file = os.path.join(work_dir, 'registration_report.md')
+    
+    seconds, _ = timed(lambda: compute_aggregates(loaded), args.repeat)
+    results = {'compute_aggregates': case(seconds, rows)}
+    seconds, _ = timed(lambda: write_registration_report(compute_aggregates(loaded), report_file,
+                                                         COMPREHENSIVE_REPORT_TEMPLATE), args.repeat)
+    results['aggregate + render'] = case(seconds, rows)
+    seconds, _ = timed(lambda: generate_registration_report(data_file, report_file, COMPREHENSIVE_REPORT_TEMPLATE),
+                       args.repeat)
+    results['generate_registration_report (Parquet)'] = case(seconds, rows)
+    
+    return results
+
+
+# Benchmarks by name, in run order
+BENCHMARKS = {
+    'analysis': bench_analysis,
+    'export': bench_export,
+    'codes': bench_codes,
+    'badges': bench_badges,
+    'report': bench_report
+}
+
+
+def git_commit() -> str:
+    """Return the current git commit of the repository, or None outside a checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    Compare two suite results case by case.
+    
+    Args:
+        baseline (dict): Earlier results file contents
+        current (dict): Current results
+        threshold (float): Slowdown ratio reported as a regression
+    
+    Returns:
+        list: (scale, benchmark, case, baseline seconds, current seconds, ratio, regressed) tuples
+    """
+    rows = []
+    for scale, benchmarks in current['results'].items():
+        for name, cases in benchmarks.items():
+            old_cases = baseline.get('results', {}).get(scale, {}).get(name, {})
+            for case_name, stats in cases.items():
+                old = old_cases.get(case_name)
+                if not isinstance(stats, dict) or not isinstance(old, dict) or not old.get('seconds'):
+                    continue
+                ratio = stats['seconds'] / old['seconds']
+                regressed = ratio > threshold and stats['seconds'] >= MIN_COMPARED_SECONDS
+                rows.append((scale, name, case_name, old['seconds'], stats['seconds'], ratio, regressed))
+    return rows
+
+
+def main():
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default='1k,100k', help=f"Comma-separated scales from: {', '.join(SCALES)}")
+    parser.add_argument('--only', help=f"Comma-separated benchmarks from: {', '.join(BENCHMARKS)}")
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic data')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (the fastest is kept)')
+    parser.add_argument('--render-limit', type=int, default=100, help='Most codes and badges rendered per scale')
+    parser.add_argument('--badge-workers', type=int, default=max(2, os.cpu_count() or 1),
+                        help='Worker processes for the pooled bulk badge case (at least 2 uses the pool)')
+    parser.add_argument('--output', default='benchmark_results.json', help='JSON file for the results')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='Slowdown ratio reported as a regression')
+    args = parser.parse_args()
+    
+    scales = [scale.strip().lower() for scale in args.scales.split(',') if scale.strip()]
+    names = [name.strip() for name in args.only.split(',')] if args.only else list(BENCHMARKS)
+    unknown = [scale for scale in scales if scale not in SCALES] + [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown scale or benchmark: {', '.join(unknown)}")
+    
+    output_file = os.path.abspath(args.output)
+    suite = {
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'seed': args.seed,
+        'repeat': args.repeat,
+        'render_limit': args.render_limit,
+        'badge_workers': args.badge_workers,
+        'results': {}
+    }
+    
+    original_dir = os.getcwd()
+    for scale in scales:
+        rows = SCALES[scale]
+        suite['results'][scale] = {}
+        for name in names:
+            print(f"Running {name} at {scale} ({rows} rows)...")
+            # The registration module writes its output directories to the working directory
+            with tempfile.TemporaryDirectory() as work_dir:
+                os.chdir(work_dir)
+                try:
+                    suite['results'][scale][name] = BENCHMARKS[name](rows, args, work_dir)
+                finally:
+                    os.chdir(original_dir)
+    
+    print("\n| Scale | Benchmark | Case | Items | Seconds | us/item |")
+    print("|-------|-----------|------|-------|---------|---------|")
+    for scale, benchmarks in suite['results'].items():
+        for name, cases in benchmarks.items():
+            for case_name, stats in cases.items():
+                if isinstance(stats, dict):
+                    print(f"| {scale} | {name} | {case_name} | {stats['items']} | {stats['seconds']:.4f} | "
+                          f"{stats['us_per_item']} |")
+    
+    with open(output_file, 'w') as f:
+        json.dump(suite, f, indent=2)
+    print(f"\nResults saved to {output_file}")
+    
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        
+        comparison = compare_results(baseline, suite, args.threshold)
+        print(f"\nCompared with {baseline.get('commit') or args.compare}:")
+        print("| Scale | Benchmark | Case | Before (s) | After (s) | Ratio |")
+        print("|-------|-----------|------|------------|-----------|-------|")
+        for scale, name, case_name, before, after, ratio, regressed in comparison:
+            flag = " **regression**" if regressed else ""
+            print(f"| {scale} | {name} | {case_name} | {before:.4f} | {after:.4f} | {ratio:.2f}x{flag} |")
+        
+        regressions = sum(1 for row in comparison if row[-1])
+        if regressions:
+            print(f"\n{regressions} case(s) slower than {args.threshold}x the baseline")
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Seeded Synthetic Data for the Benchmarks
+
+This module generates reproducible alumni survey rows, registration exports, Google Forms
+responses and badge participants, so every benchmark (and every commit) measures the same
+input for a given size and seed.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'analysis'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data-collection'))
+
+import numpy as np
+import pandas as pd
+from alumni_analysis import IMPACT_COLUMNS
+from columnar_storage import REGISTRATION_REPORT_COLUMNS
+from form_export import ANSWER_SEPARATOR
+
+# Answer pools for the synthetic alumni survey rows
+PROGRAMS = ["Computer Science", "Data Science", "Engineering", "Business Administration", "Aviation",
+            "Medicine", "Law", "Architecture"]
+INDUSTRIES = ["Technology", "Finance", "Healthcare", "Aviation", "Military", "Oil and Gas", "Education",
+              "Government", "Consulting", "Telecommunications"] + [f"Industry {index}" for index in range(40)]
+ALUMNI_LOCATIONS = [f"City {index}" for index in range(300)] + ["Abuja", "Lagos", "London", "Houston"]
+EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Freelance", "Self-employed", "Unemployed"]
+CONNECTION_LEVELS = ["Very connected", "Somewhat connected", "Minimally connected", "Not connected"]
+MENTORSHIP_INTEREST = ["Yes, definitely", "Maybe", "No"]
+RECOMMENDATION = ["Yes, definitely", "Yes, with reservations", "No"]
+
+# Answer pools for the synthetic registrations
+LOCATIONS = [f"City {index}, State {index % 36}, Nigeria" for index in range(400)] + \
+    ["London, England, UK", "Houston, Texas, USA", "Dubai, Dubai, UAE"]
+PROFESSIONS = ["Engineer", "Pilot", "Doctor", "Lawyer", "Accountant", "Teacher", "Entrepreneur",
+               "Civil Servant", "Military Officer", "Consultant", "Banker", "Architect"] + \
+    [f"Specialist {index}" for index in range(200)]
+ACCOMMODATION = ["Yes, I need accommodation", "No, I have arranged my own accommodation",
+                 "Maybe, please send me options"]
+TRANSPORTATION = ["Yes, I need airport pickup", "No, I will arrange my own transportation",
+                  "Maybe, please provide options"]
+SESSIONS = ["Leadership Development", "Career Advancement", "Alumni Network Building", "All sessions",
+            "Technology and Innovation", "Leadership Development, Alumni Network Building",
+            "Career Advancement, Technology and Innovation, Business and Entrepreneurship",
+            "Alumni Network Building, Community Service Projects, Education and Mentorship"]
+SPEAKING = ["Yes, I would like to speak", "No, I prefer to attend only", "Maybe, depending on the topic"]
+DIETARY = ["None", "Vegetarian", "Vegan", "Halal", "Gluten-free", "Vegetarian, Gluten-free", "Halal, Nut-free"]
+SPECIAL_NEEDS = ["Wheelchair access", "Sign language interpreter", "Large print materials",
+                 "Ground floor room", "Dietary assistance"] + [f"Note {index}" for index in range(2000)]
+
+# Registration form questions that are not part of the report columns
+CONTACT_QUESTIONS = ['Full Name', 'Email Address', 'Phone Number']
+
+
+def _pick(rng: np.random.Generator, pool: list, rows: int) -> np.ndarray:
+    """Draw ``rows`` answers uniformly from a pool."""
+    return np.array(pool, dtype=object)[rng.integers(0, len(pool), rows)]
+
+
+def synthetic_alumni(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build seeded synthetic alumni survey rows with the analysis columns.
+    
+    Args:
+        rows (int): Number of survey responses
+        seed (int): Random seed
+    
+    Returns:
+        pd.DataFrame: Survey rows, with about 2% of the impact ratings left unanswered
+    """
+    rng = np.random.default_rng(seed)
+    data = {
+        'graduation_year': rng.integers(1985, 2024, rows),
+        'program': _pick(rng, PROGRAMS, rows),
+        'industry': _pick(rng, INDUSTRIES, rows),
+        'location': _pick(rng, ALUMNI_LOCATIONS, rows),
+        'employment_type': _pick(rng, EMPLOYMENT_TYPES, rows),
+        'jobs_since_graduation': rng.poisson(2.5, rows),
+        'years_in_current_role': rng.integers(0, 15, rows),
+        'has_leadership': rng.random(rows) < 0.35,
+        'connection_level': _pick(rng, CONNECTION_LEVELS, rows),
+        'mentorship_interest': _pick(rng, MENTORSHIP_INTEREST, rows),
+        'would_recommend': _pick(rng, RECOMMENDATION, rows)
+    }
+    for col in IMPACT_COLUMNS:
+        ratings = rng.integers(1, 6, rows).astype(float)
+        ratings[rng.random(rows) < 0.02] = np.nan
+        data[col] = ratings
+    return pd.DataFrame(data)
+
+
+def synthetic_registrations(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Build seeded synthetic registrations with the report columns.
+    
+    Args:
+        rows (int): Number of registrations
+        seed (int): Random seed
+    
+    Returns:
+        pd.DataFrame: Registrations, with special needs filled for about 5% of rows
+    """
+    rng = np.random.default_rng(seed)
+    start = np.datetime64('2025-06-01T00:00:00')
+    created = start + rng.integers(0, 150 * 86400, rows).astype('timedelta64[s]')
+    special = _pick(rng, SPECIAL_NEEDS, rows)
+    special[rng.random(rows) > 0.05] = None
+    
+    columns = REGISTRATION_REPORT_COLUMNS
+    return pd.DataFrame({
+        columns[0]: pd.Series(created).dt.strftime('%Y-%m-%dT%H:%M:%S'),
+        columns[1]: rng.integers(1980, 2020, rows),
+        columns[2]: _pick(rng, LOCATIONS, rows),
+        columns[3]: _pick(rng, PROFESSIONS, rows),
+        columns[4]: _pick(rng, ACCOMMODATION, rows),
+        columns[5]: _pick(rng, TRANSPORTATION, rows),
+        columns[6]: _pick(rng, SESSIONS, rows),
+        columns[7]: _pick(rng, SPEAKING, rows),
+        columns[8]: _pick(rng, DIETARY, rows),
+        columns[9]: special
+    })
+
+
+def registration_form() -> dict:
+    """
+    Build a registration form resource in the Google Forms API layout.
+    
+    Returns:
+        dict: Form with one question item per contact question and report column
+    """
+    titles = CONTACT_QUESTIONS + REGISTRATION_REPORT_COLUMNS[1:]
+    return {
+        'formId': 'synthetic-registration-form',
+        'revisionId': '1',
+        'items': [{
+            'itemId': f"item{index:03d}",
+            'title': title,
+            'questionItem': {'question': {'questionId': f"q{index:03d}"}}
+        } for index, title in enumerate(titles)]
+    }
+
+
+def iter_form_responses(count: int, seed: int = 42, page_size: int = 5000):
+    """
+    Yield seeded synthetic Forms API responses to ``registration_form`` in pages.
+    
+    Responses are generated a page at a time, so a million of them never
+    have to be held in memory at once. Checkbox answers carry one value per
+    chosen option, as the Forms API returns them.
+    
+    Args:
+        count (int): Number of responses
+        seed (int): Random seed
+        page_size (int): Responses per page
+    
+    Yields:
+        list: Response resources, like one page of ``responses().list``
+    """
+    checkbox_columns = {REGISTRATION_REPORT_COLUMNS[6], REGISTRATION_REPORT_COLUMNS[8]}
+    question_ids = {item['title']: item['questionItem']['question']['questionId']
+                    for item in registration_form()['items']}
+    
+    for page_start in range(0, count, page_size):
+        rows = min(page_size, count - page_start)
+        page_seed = seed + page_start // page_size
+        registrations = synthetic_registrations(rows, page_seed)
+        created = registrations.pop(REGISTRATION_REPORT_COLUMNS[0]).to_numpy()
+        registrations.insert(0, 'Full Name', [f"Participant {page_start + index}" for index in range(rows)])
+        registrations.insert(1, 'Email Address', [f"participant{page_start + index}@example.com"
+                                                  for index in range(rows)])
+        registrations.insert(2, 'Phone Number', [f"+234 80{page_start + index:08d}" for index in range(rows)])
+        
+        page = []
+        for index, record in enumerate(registrations.to_dict('records')):
+            answers = {}
+            for title, value in record.items():
+                if value is None or (isinstance(value, float) and np.isnan(value)):
+                    continue
+                values = str(value).split(ANSWER_SEPARATOR) if title in checkbox_columns else [str(value)]
+                question_id = question_ids[title]
+                answers[question_id] = {
+                    'questionId': question_id,
+                    'textAnswers': {'answers': [{'value': text} for text in values]}
+                }
+            page.append({
+                'responseId': f"ACYDBN{page_start + index:010d}",
+                'createdTime': f"{created[index]}Z",
+                'lastSubmittedTime': f"{created[index]}Z",
+                'answers': answers
+            })
+        yield page
+
+
+def synthetic_participants(count: int, seed: int = 42) -> list:
+    """
+    Build seeded synthetic badge participants.
+    
+    Args:
+        count (int): Number of participants
+        seed (int): Random seed
+    
+    Returns:
+        list: Participant dicts with the fields shown on a badge (no registration IDs)
+    """
+    rng = np.random.default_rng(seed)
+    years = rng.integers(1980, 2020, count)
+    organizations = _pick(rng, PROFESSIONS, count)
+    locations = _pick(rng, LOCATIONS, count)
+    return [{
+        'full_name': f"Participant {index}",
+        'graduation_year': str(years[index]),
+        'organization': organizations[index],
+        'current_location': locations[index],
+        'email': f"participant{index}@example.com",
+        'phone': f"+234 80{index:08d}"
+    } for index in range(count)]
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Google Forms API Client
+
+This module talks to the Google Forms REST API with asyncio and a pooled aiohttp session, so
+several forms (one per event) can be exported concurrently. Requests share a concurrency limit
+and per-minute rate limits matching the Forms API read and write quotas, and are retried with
+exponential backoff and jitter on 429 and 5xx responses, honoring ``Retry-After``.
+
+The API root is configurable, so the client can run against a local stub server.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from form_export import FormResponseExporter, ResponseCsvWriter
+from instrumentation import count, timer
+
+logger = logging.getLogger(__name__)
+
+# Root of the Google Forms REST API
+FORMS_API_URL = 'https://forms.googleapis.com/v1'
+
+# Default Forms API per-user quotas, in requests per minute
+REQUESTS_PER_MINUTE = {
+    'read': 390,
+    'write': 150
+}
+
+# HTTP statuses retried with backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Concurrent requests (and pooled connections) per client
+DEFAULT_CONCURRENCY = 8
+
+# Retry attempts and backoff bounds in seconds
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 32.0
+
+# Seconds before a request is abandoned (and retried)
+REQUEST_TIMEOUT = 60
+
+
+class FormsApiError(Exception):
+    def __init__(self, status: int, message: str, call: str = None):
+        """
+        Error returned by the Forms API after retries were exhausted or for a non-retryable status.
+        
+        Args:
+            status (int): HTTP status (0 for connection errors)
+            message (str): Error message from the response body
+            call (str): API method that failed
+        """
+        super().__init__(f"{call or 'Forms API'} failed with HTTP {status}: {message}")
+        self.status = status
+        self.message = message
+        self.call = call
+
+
+class RateLimiter:
+    def __init__(self, requests_per_minute: float, burst: int = None):
+        """
+        Token bucket shared by the concurrent requests of one quota.
+        
+        Args:
+            requests_per_minute (float): Sustained request rate
+            burst (int): Requests allowed back to back (defaults to one second of quota, at least 1)
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst or int(self.rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def pause(self, seconds: float):
+        """
+        Hold every request of this quota for a while, e.g. after a 429 with ``Retry-After``.
+        
+        Args:
+            seconds (float): Pause length
+        """
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class AsyncFormsClient:
+    def __init__(self, credentials=None, base_url: str = FORMS_API_URL, concurrency: int = DEFAULT_CONCURRENCY,
+                 requests_per_minute: Dict[str, float] = None, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX,
+                 timeout: float = REQUEST_TIMEOUT):
+        """
+        Initialize the client; use it as ``async with AsyncFormsClient(...) as client``.
+        
+        Args:
+            credentials: google-auth credentials (refreshed when expired), or None for an unauthenticated stub
+            base_url (str): API root
+            concurrency (int): Maximum requests in flight (also the connection pool size)
+            requests_per_minute (Dict[str, float]): 'read' and 'write' rate limits (defaults to REQUESTS_PER_MINUTE)
+            max_retries (int): Retries after a 429, 5xx, timeout or connection error
+            backoff_base (float): First backoff delay in seconds
+            backoff_max (float): Longest backoff delay in seconds
+            timeout (float): Seconds before a request is abandoned
+        """
+        self.credentials = credentials
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = max(1, concurrency)
+        rates = {**REQUESTS_PER_MINUTE, **(requests_per_minute or {})}
+        self.limiters = {kind: RateLimiter(rate) for kind, rate in rates.items()}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.retries = 0
+        self._session = None
+        self._semaphore = None
+        self._auth_lock = None
+    
+    async def __aenter__(self):
+        try:
+            import aiohttp
+        except ImportError as e:
+            raise ImportError("The asynchronous Forms client needs aiohttp (pip install aiohttp)") from e
+        
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=aiohttp.ClientTimeout(total=self.timeout),
+                                              raise_for_status=False)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._auth_lock = asyncio.Lock()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def _headers(self) -> Dict[str, str]:
+        """Return the Authorization header, refreshing expired credentials first."""
+        if self.credentials is None:
+            return {}
+        
+        async with self._auth_lock:
+            if not self.credentials.valid:
+                from google.auth.transport.requests import Request
+                # google-auth refreshes synchronously, so it runs off the event loop
+                await asyncio.to_thread(self.credentials.refresh, Request())
+        return {'Authorization': f"Bearer {self.credentials.token}"}
+    
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Return the delay before a retry: ``Retry-After`` if given, else capped exponential with jitter."""
+        if retry_after:
+            try:
+                return min(self.backoff_max, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0.5, 1.0) * min(self.backoff_max, self.backoff_base * 2 ** attempt)
+    
+    async def request(self, method: str, path: str, call: str, quota: str = 'read',
+                      params: Dict = None, body: Dict = None) -> Dict:
+        """
+        Send one API request with rate limiting, the concurrency limit and retries.
+        
+        Args:
+            method (str): HTTP method
+            path (str): Path below the API root, e.g. '/forms/FORM_ID'
+            call (str): API method name used in metrics and errors, e.g. 'forms.get'
+            quota (str): Rate limit the request counts against ('read' or 'write')
+            params (Dict): Query parameters
+            body (Dict): JSON request body
+        
+        Returns:
+            Dict: Decoded JSON response
+        
+        Raises:
+            FormsApiError: On a non-retryable status or when retries are exhausted
+        """
+        import aiohttp
+        
+        if self._session is None:
+            raise RuntimeError("AsyncFormsClient must be used as 'async with AsyncFormsClient(...)'")
+        
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        limiter = self.limiters[quota]
+        
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            retry_after = None
+            async with self._semaphore:
+                try:
+                    with timer('api_call_seconds', call=call):
+                        async with self._session.request(method, f"{self.base_url}{path}", params=params,
+                                                         json=body, headers=await self._headers()) as response:
+                            if response.status < 400:
+                                return await response.json(content_type=None)
+                            status = response.status
+                            message = await response.text()
+                            retry_after = response.headers.get('Retry-After')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    status, message = 0, f"{type(e).__name__}: {e}"
+            
+            if status == 401 and self.credentials is not None and attempt == 0:
+                # Expired token: refresh on the next _headers call and retry once
+                self.credentials.expiry = None
+                self.credentials.token = None
+            elif status and status not in RETRY_STATUSES:
+                raise FormsApiError(status, message, call)
+            
+            if attempt == self.max_retries:
+                raise FormsApiError(status, message, call)
+            
+            delay = self._backoff(attempt, retry_after)
+            if status == 429:
+                # The quota is exhausted for every request, not just this one
+                limiter.pause(delay)
+            self.retries += 1
+            count('api_retries_total', call=call, status=str(status))
+            logger.info("Retrying %s after HTTP %s in %.2fs", call, status, delay,
+                        extra={'call': call, 'status': status, 'attempt': attempt + 1})
+            await asyncio.sleep(delay)
+    
+    async def get_form(self, form_id: str, fields: str = None) -> Dict:
+        """Fetch a form resource (``forms.get``)."""
+        return await self.request('GET', f"/forms/{form_id}", 'forms.get', params={'fields': fields})
+    
+    async def create_form(self, form: Dict) -> Dict:
+        """Create a form (``forms.create``)."""
+        return await self.request('POST', '/forms', 'forms.create', quota='write', body=form)
+    
+    async def batch_update(self, form_id: str, requests: List[Dict]) -> Dict:
+        """Apply update requests to a form (``forms.batchUpdate``)."""
+        return await self.request('POST', f"/forms/{form_id}:batchUpdate", 'forms.batchUpdate', quota='write',
+                                  body={'requests': requests})
+    
+    async def list_responses(self, form_id: str, page_size: int = 5000, page_token: str = None,
+                             since: str = None) -> Dict:
+        """
+        Fetch one page of form responses (``forms.responses.list``).
+        
+        Args:
+            form_id (str): Google Form ID
+            page_size (int): Responses per page
+            page_token (str): Token of the page to fetch
+            since (str): Optional RFC 3339 timestamp; only responses submitted after it are listed
+        
+        Returns:
+            Dict: API response with 'responses' and 'nextPageToken'
+        """
+        return await self.request('GET', f"/forms/{form_id}/responses", 'forms.responses.list', params={
+            'pageSize': page_size,
+            'pageToken': page_token,
+            'filter': f"timestamp > {since}" if since else None
+        })
+    
+    async def iter_response_pages(self, form_id: str, page_size: int = 5000,
+                                  since: str = None) -> AsyncIterator[List[Dict]]:
+        """
+        Yield pages of form responses, following ``nextPageToken`` until exhausted.
+        
+        Args:
+            form_id (str): Google Form ID
+            page_size (int): Responses per page
+            since (str): Optional RFC 3339 timestamp; only responses submitted after it are fetched
+        
+        Yields:
+            List[Dict]: Responses on one page
+        """
+        page_token = None
+        while True:
+            result = await self.list_responses(form_id, page_size, page_token, since)
+            yield result.get('responses', [])
+            
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                break
+
+
+class AsyncFormResponseExporter(FormResponseExporter):
+    def __init__(self, client: AsyncFormsClient, page_size: int = 5000,
+                 schema_cache_dir: str = "form_schema_cache"):
+        """
+        Export form responses to CSV with the asynchronous client.
+        
+        The export files, watermarks and schema cache are the same as
+        ``FormResponseExporter``'s, so synchronous and asynchronous exports
+        can be mixed for the same form.
+        
+        Args:
+            client (AsyncFormsClient): Open asynchronous client
+            page_size (int): Number of responses requested per page
+            schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
+        """
+        super().__init__(None, page_size, schema_cache_dir)
+        self.client = client
+    
+    async def get_form(self, form_id: str) -> Dict:
+        """Return the form schema, downloading it only when its revision changed."""
+        if not self.schema_cache:
+            return await self.client.get_form(form_id)
+        
+        revision = await self.client.get_form(form_id, fields='revisionId')
+        form = self.schema_cache.cached(form_id, revision.get('revisionId'))
+        if form is None:
+            form = await self.client.get_form(form_id)
+            self.schema_cache.store(form_id, form, revision.get('revisionId'))
+        return form
+    
+    async def export_to_csv(self, form_id: str, output_file: str, incremental: bool = False) -> int:
+        """
+        Stream one form's responses to a CSV file as pages arrive.
+        
+        Args:
+            form_id (str): Google Form ID
+            output_file (str): Output CSV filename
+            incremental (bool): Append only responses newer than the last export
+        
+        Returns:
+            int: Number of responses written
+        """
+        since = self.load_watermark(form_id, output_file) if incremental else None
+        form = await self.get_form(form_id)
+        
+        with ResponseCsvWriter(output_file, form, since) as writer:
+            async for page in self.client.iter_response_pages(form_id, self.page_size, since):
+                writer.write_page(page)
+        
+        if writer.written:
+            self.save_watermark(form_id, output_file, writer.newest)
+        return writer.written
+    
+    async def export_many(self, exports: Iterable[Tuple[str, str]], incremental: bool = False) -> Dict[str, object]:
+        """
+        Export several forms concurrently.
+        
+        A failing form does not stop the others; its entry holds the exception.
+        
+        Args:
+            exports (Iterable[Tuple[str, str]]): (form ID, output CSV) pairs
+            incremental (bool): Append only responses newer than each export's watermark
+        
+        Returns:
+            Dict[str, object]: Responses written, or the exception raised, per output file
+        """
+        exports = list(exports)
+        results = await asyncio.gather(*(self.export_to_csv(form_id, output_file, incremental)
+                                         for form_id, output_file in exports), return_exceptions=True)
+        return {output_file: result for (_, output_file), result in zip(exports, results)}
+
+
+async def export_forms(exports: Iterable[Tuple[str, str]], credentials=None, incremental: bool = False,
+                       page_size: int = 5000, schema_cache_dir: str = "form_schema_cache",
+                       **client_options) -> Dict[str, object]:
+    """
+    Open a client and export several forms concurrently.
+    
+    Args:
+        exports (Iterable[Tuple[str, str]]): (form ID, output CSV) pairs
+        credentials: google-auth credentials, or None for an unauthenticated stub
+        incremental (bool): Append only responses newer than each export's watermark
+        page_size (int): Number of responses requested per page
+        schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
+        **client_options: Further AsyncFormsClient options (base_url, concurrency, ...)
+    
+    Returns:
+        Dict[str, object]: Responses written, or the exception raised, per output file
+    """
+    async with AsyncFormsClient(credentials, **client_options) as client:
+        exporter = AsyncFormResponseExporter(client, page_size, schema_cache_dir)
+        return await exporter.export_many(exports, incremental)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Canvas Badge Renderer
+
+This module draws participant badges straight onto a ReportLab canvas from a layout computed
+once per badge template. Each badge table is measured once from its TableStyle commands and the
+font metrics, by the same rules as a platypus Table, so badges keep the platypus look (row
+heights, padding, backgrounds and grid lines), while every participant costs only a few text,
+rectangle and image operations instead of a flowable layout pass. The parts shared by every badge (title, event table, labels, backgrounds and grid lines)
+are written to each PDF once as a form XObject and stamped onto every badge, so only the
+participant's fields and codes are drawn per badge.
+
+A template is built from its parts and then drawn once per participant:
+    template = BadgeTemplate(width, height)
+    template.add_title(title, 'Helvetica-Bold', 24, 22, center_x, top, max_width)
+    template.add_table(TableLayout(rows, col_widths, table_commands), x, y)
+    template.add_code('qr_code', x, y, width, height)
+    template.draw(canvas, 0, 0, participant, codes)
+"""
+
+import itertools
+from io import BytesIO
+from typing import Dict, Optional, Sequence, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+# A badge table row: label, static value, and the participant field shown instead (None keeps the value)
+BadgeRow = Tuple[str, str, Optional[str]]
+
+# Text shown for a participant field that is missing
+MISSING_VALUE = 'N/A'
+
+# Table line commands TableLayout can draw
+_LINE_COMMANDS = ('GRID', 'BOX', 'OUTLINE', 'INNERGRID')
+
+# Table cell commands TableLayout applies (besides FONT), with the cell style entry each one sets
+_CELL_COMMANDS = {
+    'FONTNAME': 'fontname', 'FACE': 'fontname', 'FONTSIZE': 'fontsize', 'SIZE': 'fontsize', 'LEADING': 'leading',
+    'TEXTCOLOR': 'color', 'ALIGN': 'alignment', 'ALIGNMENT': 'alignment', 'VALIGN': 'valign',
+    'LEFTPADDING': 'leftPadding', 'RIGHTPADDING': 'rightPadding', 'TOPPADDING': 'topPadding',
+    'BOTTOMPADDING': 'bottomPadding'
+}
+
+# Cell style before any command applies, the same as a platypus Table cell's
+_DEFAULT_CELL_STYLE = {
+    'fontname': 'Helvetica', 'fontsize': 10, 'leading': 12, 'color': colors.black, 'alignment': 'LEFT',
+    'valign': 'BOTTOM', 'leftPadding': 6, 'rightPadding': 6, 'topPadding': 3, 'bottomPadding': 3
+}
+
+# Numbers that keep the static-part form names of templates drawn into the same PDF apart
+_form_numbers = itertools.count(1)
+
+
+def field_text(participant: Dict, field: str) -> str:
+    """Return a participant field as single-line badge text."""
+    value = participant.get(field, MISSING_VALUE)
+    return '' if value is None else str(value).replace('\n', ' ')
+
+
+class TableLayout:
+    def __init__(self, rows: Sequence[BadgeRow], col_widths: Sequence[Optional[float]], commands: Sequence[tuple]):
+        """
+        Measure a badge table once from its style commands.
+        
+        The commands are TableStyle command tuples, applied with the same
+        rules as a platypus Table: a row is as tall as its tallest cell's
+        leading plus vertical padding, and a column without a width is as
+        wide as its widest text plus horizontal padding. Only single-line
+        text cells and the cell, BACKGROUND and grid commands are supported,
+        which is all the badge styles use. Row heights of text cells do not
+        depend on the text, so participant values can be drawn into the
+        measured cells later.
+        
+        Args:
+            rows (Sequence[BadgeRow]): Table rows
+            col_widths (Sequence[Optional[float]]): Column widths in points (None fits the column to its text)
+            commands (Sequence[tuple]): Style commands, e.g. ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        """
+        texts = [(label, value) for label, value, _ in rows]
+        row_count, col_count = len(rows), len(col_widths)
+        cells = [[dict(_DEFAULT_CELL_STYLE) for _ in range(col_count)] for _ in range(row_count)]
+        background_commands = []
+        line_commands = []
+        
+        for op, (start_col, start_row), (end_col, end_row), *values in commands:
+            start_col, end_col = start_col % col_count, end_col % col_count
+            start_row, end_row = start_row % row_count, end_row % row_count
+            area = (start_col, start_row, end_col, end_row)
+            if op == 'BACKGROUND':
+                background_commands.append((values[0], area))
+            elif op in _LINE_COMMANDS:
+                line_commands.append((op, area, values[0], values[1]))
+            elif op == 'FONT' or op in _CELL_COMMANDS:
+                if op == 'FONT':
+                    settings = {'fontname': values[0]}
+                    if len(values) > 1:
+                        settings['fontsize'] = values[1]
+                        settings['leading'] = values[2] if len(values) > 2 else values[1] * 1.2
+                elif op == 'TEXTCOLOR':
+                    settings = {'color': colors.toColor(values[0])}
+                else:
+                    settings = {_CELL_COMMANDS[op]: values[0]}
+                for row in cells[start_row:end_row + 1]:
+                    for cell in row[start_col:end_col + 1]:
+                        cell.update(settings)
+            else:
+                raise ValueError(f"Unsupported badge table command '{op}'")
+        
+        widths = [width if width is not None else
+                  max(stringWidth(str(row_texts[col_index]), row[col_index]['fontname'], row[col_index]['fontsize'])
+                      + row[col_index]['leftPadding'] + row[col_index]['rightPadding']
+                      for row_texts, row in zip(texts, cells))
+                  for col_index, width in enumerate(col_widths)]
+        heights = [max((cell['leading'] or 1.2 * cell['fontsize']) + cell['topPadding'] + cell['bottomPadding']
+                       for cell in row)
+                   for row in cells]
+        self.width, self.height = sum(widths), sum(heights)
+        
+        columns = list(itertools.accumulate(widths, initial=0))
+        # Row boundaries from the top of the table down to its bottom
+        tops = list(itertools.accumulate(heights, lambda top, height: top - height, initial=self.height))
+        
+        self.backgrounds = []
+        for color, (start_col, start_row, end_col, end_row) in background_commands:
+            self.backgrounds.append((color, columns[start_col], tops[end_row + 1],
+                                     columns[end_col + 1] - columns[start_col],
+                                     tops[start_row] - tops[end_row + 1]))
+        
+        self.lines = []
+        for op, (start_col, start_row, end_col, end_row), weight, color in line_commands:
+            left, right = columns[start_col], columns[end_col + 1]
+            top, bottom = tops[start_row], tops[end_row + 1]
+            verticals = columns[start_col:end_col + 2]
+            horizontals = tops[start_row:end_row + 2]
+            if op in ('BOX', 'OUTLINE'):
+                verticals, horizontals = [left, right], [top, bottom]
+            elif op == 'INNERGRID':
+                verticals, horizontals = verticals[1:-1], horizontals[1:-1]
+            
+            segments = [(x, bottom, x, top) for x in verticals] + [(left, y, right, y) for y in horizontals]
+            self.lines.append((weight, color, segments))
+        
+        self.labels = []
+        self.fields = []
+        for row_index, (label, value, field) in enumerate(rows):
+            for col_index, text in enumerate((label, value)):
+                placement = self._text_placement(cells[row_index][col_index], columns[col_index],
+                                                 columns[col_index + 1] - columns[col_index],
+                                                 tops[row_index + 1], tops[row_index] - tops[row_index + 1])
+                if col_index == 1 and field:
+                    self.fields.append(placement + (field,))
+                else:
+                    self.labels.append(placement + (str(text),))
+    
+    @staticmethod
+    def _text_placement(cell: Dict, col_x: float, col_width: float, row_y: float, row_height: float) -> Tuple:
+        """Return (font, size, color, alignment, x, y) of a single-line text cell, as platypus places it."""
+        leading = cell['leading'] or 1.2 * cell['fontsize']
+        if cell['valign'] == 'TOP':
+            y = row_y + row_height - cell['topPadding'] - cell['fontsize']
+        elif cell['valign'] == 'MIDDLE':
+            y = row_y + (cell['bottomPadding'] + row_height - cell['topPadding'] + leading) / 2.0 - cell['fontsize']
+        else:
+            y = row_y + cell['bottomPadding'] + leading - cell['fontsize']
+        
+        if cell['alignment'] == 'RIGHT':
+            x = col_x + col_width - cell['rightPadding']
+        elif cell['alignment'] in ('CENTRE', 'CENTER'):
+            x = col_x + (col_width + cell['leftPadding'] - cell['rightPadding']) / 2.0
+        else:
+            x = col_x + cell['leftPadding']
+        return cell['fontname'], cell['fontsize'], cell['color'], cell['alignment'], x, y
+    
+    @staticmethod
+    def _draw_texts(canvas, x: float, y: float, cells: Sequence[Tuple[Tuple, str]]):
+        """Draw cell texts at their measured positions in one text object, setting fonts and colors only on change."""
+        text_object = canvas.beginText()
+        font = color = None
+        for (font_name, size, cell_color, alignment, text_x, text_y), text in cells:
+            if (font_name, size) != font:
+                font = (font_name, size)
+                text_object.setFont(font_name, size)
+            if cell_color != color:
+                color = cell_color
+                text_object.setFillColor(cell_color)
+            if alignment == 'RIGHT':
+                text_x -= stringWidth(text, font_name, size)
+            elif alignment in ('CENTRE', 'CENTER'):
+                text_x -= stringWidth(text, font_name, size) / 2.0
+            text_object.setTextOrigin(x + text_x, y + text_y)
+            text_object.textOut(text)
+        canvas.drawText(text_object)
+    
+    def draw_static(self, canvas, x: float, y: float):
+        """
+        Draw the backgrounds, grid lines and fixed text of the table.
+        
+        Args:
+            canvas: ReportLab canvas
+            x (float): Left edge of the table
+            y (float): Bottom edge of the table
+        """
+        for color, left, bottom, width, height in self.backgrounds:
+            canvas.setFillColor(color)
+            canvas.rect(x + left, y + bottom, width, height, stroke=0, fill=1)
+        
+        self._draw_texts(canvas, x, y, [(placement[:6], placement[6]) for placement in self.labels])
+        
+        for weight, color, segments in self.lines:
+            canvas.setLineWidth(weight)
+            canvas.setStrokeColor(color)
+            canvas.lines([(x + x1, y + y1, x + x2, y + y2) for x1, y1, x2, y2 in segments])
+    
+    def draw_fields(self, canvas, x: float, y: float, participant: Dict):
+        """
+        Draw a participant's values into the table's field cells.
+        
+        Args:
+            canvas: ReportLab canvas
+            x (float): Left edge of the table
+            y (float): Bottom edge of the table
+            participant (Dict): Participant information
+        """
+        self._draw_texts(canvas, x, y, [(placement[:6], field_text(participant, placement[6]))
+                                        for placement in self.fields])
+
+
+class BadgeTemplate:
+    def __init__(self, width: float, height: float, static_form: bool = True):
+        """
+        Start an empty badge layout.
+        
+        Args:
+            width (float): Badge width in points
+            height (float): Badge height in points
+            static_form (bool): Stamp the static parts from a form XObject (False redraws them per badge)
+        """
+        self.width = width
+        self.height = height
+        self.static_form = static_form
+        self.form_name = f"BadgeStatic{next(_form_numbers)}"
+        self.titles = []
+        self.tables = []
+        self.codes = []
+    
+    def add_title(self, text: str, font: str, size: float, leading: float, center_x: float, top: float,
+                  max_width: float = None):
+        """
+        Add a centred title, wrapped to the available width like a platypus Paragraph.
+        
+        Args:
+            text (str): Title text
+            font (str): Font name
+            size (float): Font size
+            leading (float): Distance between wrapped lines
+            center_x (float): Horizontal centre of the title
+            top (float): Top of the title box (the first baseline is one font size below)
+            max_width (float): Width available to each line (None keeps the title on one line)
+        
+        Returns:
+            float: Height taken by the title lines
+        """
+        lines = (simpleSplit(text, font, size, max_width) if max_width else [text]) or ['']
+        for index, line in enumerate(lines):
+            self.titles.append((font, size, center_x, top - size - index * leading, line))
+        return len(lines) * leading
+    
+    def add_table(self, table: TableLayout, x: float, y: float):
+        """
+        Place a measured table.
+        
+        Args:
+            table (TableLayout): Measured table
+            x (float): Left edge of the table
+            y (float): Bottom edge of the table
+        """
+        self.tables.append((table, x, y))
+    
+    def add_code(self, name: str, x: float, y: float, width: float, height: float, max_width: float = None,
+                 max_height: float = None, halign: str = 'CENTER', valign: str = 'MIDDLE'):
+        """
+        Reserve a box for a QR code or barcode.
+        
+        The code is scaled to the largest size within ``max_width`` x
+        ``max_height`` (the box size by default) that keeps its aspect
+        ratio, then aligned inside the box.
+        
+        Args:
+            name (str): Key of the code in the codes passed to draw, e.g. 'qr_code'
+            x (float): Left edge of the box
+            y (float): Bottom edge of the box
+            width (float): Box width
+            height (float): Box height
+            max_width (float): Largest code width
+            max_height (float): Largest code height
+            halign (str): 'LEFT', 'CENTER' or 'RIGHT'
+            valign (str): 'BOTTOM', 'MIDDLE' or 'TOP'
+        """
+        self.codes.append((name, x, y, width, height, max_width or width, max_height or height, halign, valign))
+    
+    def draw_static(self, canvas, x: float = 0, y: float = 0):
+        """
+        Draw the parts shared by every badge: titles, table backgrounds, grid lines and labels.
+        
+        Args:
+            canvas: ReportLab canvas
+            x (float): Left edge of the badge
+            y (float): Bottom edge of the badge
+        """
+        for font, size, center_x, baseline, line in self.titles:
+            canvas.setFont(font, size)
+            canvas.setFillColorRGB(0, 0, 0)
+            canvas.drawCentredString(x + center_x, y + baseline, line)
+        
+        for table, table_x, table_y in self.tables:
+            table.draw_static(canvas, x + table_x, y + table_y)
+    
+    def draw_fields(self, canvas, x: float, y: float, participant: Dict, codes: Dict = None):
+        """
+        Draw one participant's values and codes.
+        
+        Args:
+            canvas: ReportLab canvas
+            x (float): Left edge of the badge
+            y (float): Bottom edge of the badge
+            participant (Dict): Participant information
+            codes (Dict): Rendered codes from render_registration_codes (None leaves the boxes empty)
+        """
+        for table, table_x, table_y in self.tables:
+            table.draw_fields(canvas, x + table_x, y + table_y, participant)
+        
+        if codes:
+            for name, box_x, box_y, width, height, max_width, max_height, halign, valign in self.codes:
+                draw_code(canvas, codes[name], x + box_x, y + box_y, width, height, max_width, max_height,
+                          halign, valign)
+    
+    def draw(self, canvas, x: float, y: float, participant: Dict, codes: Dict = None):
+        """
+        Draw a complete badge, leaving the canvas graphics state as it was.
+        
+        Args:
+            canvas: ReportLab canvas
+            x (float): Left edge of the badge
+            y (float): Bottom edge of the badge
+            participant (Dict): Participant information
+            codes (Dict): Rendered codes from render_registration_codes
+        """
+        # Drawing every badge at the origin keeps the page stream repetitive, so it compresses well
+        canvas.saveState()
+        canvas.translate(x, y)
+        if self.static_form:
+            canvas.doForm(self.define_static_form(canvas))
+        else:
+            self.draw_static(canvas)
+        self.draw_fields(canvas, 0, 0, participant, codes)
+        canvas.restoreState()
+    
+    def define_static_form(self, canvas) -> str:
+        """
+        Write the static parts to the canvas's PDF as a form XObject, once per document.
+        
+        Args:
+            canvas: ReportLab canvas
+        
+        Returns:
+            str: Form name to pass to ``canvas.doForm``
+        """
+        if not canvas.hasForm(self.form_name):
+            canvas.beginForm(self.form_name, 0, 0, self.width, self.height)
+            self.draw_static(canvas)
+            canvas.endForm()
+        return self.form_name
+
+
+def draw_code(canvas, code, x: float, y: float, width: float, height: float, max_width: float, max_height: float,
+              halign: str = 'CENTER', valign: str = 'MIDDLE') -> Tuple[float, float]:
+    """
+    Draw a rendered code scaled to fit a box without distortion.
+    
+    Args:
+        canvas: ReportLab canvas
+        code: PNG image buffer (BytesIO) or ReportLab Drawing
+        x (float): Left edge of the box
+        y (float): Bottom edge of the box
+        width (float): Box width
+        height (float): Box height
+        max_width (float): Largest code width
+        max_height (float): Largest code height
+        halign (str): 'LEFT', 'CENTER' or 'RIGHT'
+        valign (str): 'BOTTOM', 'MIDDLE' or 'TOP'
+    
+    Returns:
+        Tuple[float, float]: Drawn width and height
+    """
+    if isinstance(code, BytesIO):
+        code.seek(0)
+        image = ImageReader(code)
+        code_width, code_height = image.getSize()
+    else:
+        image = None
+        code_width, code_height = code.width, code.height
+    
+    scale = min(max_width / code_width, max_height / code_height)
+    drawn_width, drawn_height = code_width * scale, code_height * scale
+    
+    if halign == 'LEFT':
+        left = x
+    elif halign == 'RIGHT':
+        left = x + width - drawn_width
+    else:
+        left = x + (width - drawn_width) / 2.0
+    
+    if valign == 'BOTTOM':
+        bottom = y
+    elif valign == 'TOP':
+        bottom = y + height - drawn_height
+    else:
+        bottom = y + (height - drawn_height) / 2.0
+    
+    if image is not None:
+        canvas.drawImage(image, left, bottom, drawn_width, drawn_height)
+    else:
+        code.renderScale = scale
+        code.drawOn(canvas, left, bottom)
+    return drawn_width, drawn_height
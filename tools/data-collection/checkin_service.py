@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Offline Check-In Service
+
+This module loads exported registrations into in-memory hash indexes (registration ID, plus
+normalized email and phone) and accepts badge scans over a local asyncio socket, recording
+every check-in to an append-only log. It needs no network access beyond the venue LAN.
+
+Protocol: each scan is one line of text (a QR payload, registration ID, email or phone
+number); a multi-line JSON QR payload is read until it parses. The reply is one JSON line.
+Compact signed QR payloads are verified against the badge signing key, and generated
+registration IDs (e.g. from a barcode) by their check character, before lookup.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from qr_payload import InvalidPayload, PayloadCodec, is_compact_payload, load_key
+from registration_ids import is_generated_id, is_valid_id
+
+# Column names in a registration export (or participant file) for each indexed field
+REGISTRATION_FIELDS = {
+    'registration_id': ['registration_id', 'Registration ID (will be auto-generated)'],
+    'full_name': ['full_name', 'Full Name (as it appears on official documents)', 'Full Name'],
+    'email': ['email', 'Email Address'],
+    'phone': ['phone', 'Phone Number'],
+    'response_id': ['response_id'],
+    'event_code': ['event_code']
+}
+
+# Registration IDs assigned to rows without one, kept next to the registrations file
+ASSIGNED_IDS_SUFFIX = '.registration_ids.csv'
+
+# The same inside a dataset directory (the leading underscore keeps it out of the partitions)
+DATASET_ASSIGNED_IDS_FILE = '_registration_ids.csv'
+
+# Columns of an assigned IDs file
+ASSIGNED_IDS_COLUMNS = ['key', 'registration_id', 'full_name']
+
+# Trailing digits used to match phone numbers written with or without a country code
+PHONE_MATCH_DIGITS = 10
+
+# Longest multi-line scan accepted before the payload is rejected
+MAX_SCAN_LINES = 50
+
+_NON_DIGITS = re.compile(r'\D')
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """Return an email address trimmed and lowercased, or None if empty."""
+    if not email or not isinstance(email, str):
+        return None
+    email = email.strip().lower()
+    return email or None
+
+
+def normalize_phone(phone) -> Optional[str]:
+    """
+    Return the last PHONE_MATCH_DIGITS digits of a phone number, or None if too short.
+    
+    Matching on the trailing digits lets "+234 803 123 4567" and "0803 123 4567"
+    resolve to the same registration.
+    """
+    if phone is None:
+        return None
+    digits = _NON_DIGITS.sub('', str(phone))
+    return digits[-PHONE_MATCH_DIGITS:] if len(digits) >= 7 else None
+
+
+def registration_record(row: Dict) -> Dict:
+    """Map export column names onto the indexed field names."""
+    record = {}
+    for field, names in REGISTRATION_FIELDS.items():
+        record[field] = next((row[name] for name in names if row.get(name) not in (None, '')), None)
+    return record
+
+
+def registration_key(row: Dict) -> Optional[str]:
+    """
+    Return the key that identifies a registration without an ID across exports.
+    
+    Form responses are keyed by their response ID, other rows by their
+    normalized email address and full name, within the row's event.
+    
+    Args:
+        row (Dict): Registration or participant (export column names or field names)
+    
+    Returns:
+        Optional[str]: Key, or None if the row has no response ID, email or name
+    """
+    record = registration_record(row)
+    event = f"{record['event_code']}/" if record['event_code'] else ''
+    if record['response_id']:
+        return f"{event}{str(record['response_id']).strip()}"
+    email = normalize_email(record['email'])
+    name = str(record['full_name'] or '').strip().casefold()
+    if not (email or name):
+        return None
+    return f"{event}{email or ''}|{name}"
+
+
+def assigned_ids_path(file_path: str) -> str:
+    """Return the assigned IDs file kept next to a registrations file or inside a dataset."""
+    if os.path.isdir(file_path):
+        return os.path.join(file_path, DATASET_ASSIGNED_IDS_FILE)
+    return f"{file_path}{ASSIGNED_IDS_SUFFIX}"
+
+
+def load_assigned_ids(file_path: str) -> Dict[str, str]:
+    """
+    Load the registration IDs assigned to rows of a registrations file.
+    
+    Args:
+        file_path (str): Registrations file or dataset directory
+    
+    Returns:
+        Dict[str, str]: Registration ID keyed by registration_key (empty if none were assigned)
+    """
+    ids_file = assigned_ids_path(file_path)
+    if not os.path.exists(ids_file):
+        return {}
+    
+    with open(ids_file, 'r', newline='') as f:
+        return {row['key']: row['registration_id'] for row in csv.DictReader(f)}
+
+
+def save_assigned_ids(file_path: str, rows: Iterable[Dict]):
+    """
+    Record the registration IDs assigned to rows of a registrations file.
+    
+    The IDs are appended (and synced) before any badge carrying them is
+    rendered, so a scanned badge always resolves at check-in.
+    
+    Args:
+        file_path (str): Registrations file or dataset directory the rows were loaded from
+        rows (Iterable[Dict]): Rows with their new ``registration_id`` (and a registration_key)
+    """
+    ids_file = assigned_ids_path(file_path)
+    write_header = not os.path.exists(ids_file)
+    with open(ids_file, 'a', newline='') as f:
+        writer = csv.writer(f)
+        if write_header:
+            writer.writerow(ASSIGNED_IDS_COLUMNS)
+        for row in rows:
+            record = registration_record(row)
+            writer.writerow([registration_key(row), record['registration_id'], record['full_name'] or ''])
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class RegistrationIndex:
+    def __init__(self, records: Iterable[Dict]):
+        """
+        Build the lookup indexes from registration records.
+        
+        Records are keyed by registration ID; email and phone map to the
+        registration ID of the first record that uses them.
+        
+        Args:
+            records (Iterable[Dict]): Registrations with registration_id, full_name, email and phone
+        """
+        self.by_id = {}
+        self.by_email = {}
+        self.by_phone = {}
+        
+        for record in records:
+            registration_id = record.get('registration_id')
+            if not registration_id:
+                continue
+            registration_id = str(registration_id).strip()
+            self.by_id[registration_id] = {
+                'registration_id': registration_id,
+                'full_name': record.get('full_name') or 'N/A'
+            }
+            email = normalize_email(record.get('email'))
+            if email:
+                self.by_email.setdefault(email, registration_id)
+            phone = normalize_phone(record.get('phone'))
+            if phone:
+                self.by_phone.setdefault(phone, registration_id)
+    
+    @classmethod
+    def load(cls, file_path: str) -> 'RegistrationIndex':
+        """
+        Load registrations from a JSON list or a CSV, Parquet or Feather export.
+        
+        Rows without a registration ID take the one assigned to them when
+        their badge was generated (see save_assigned_ids).
+        
+        Args:
+            file_path (str): Registrations file
+        
+        Returns:
+            RegistrationIndex: Index over the loaded registrations
+        """
+        if file_path.lower().endswith('.json'):
+            with open(file_path, 'r') as f:
+                rows = json.load(f)
+        else:
+            from columnar_storage import available_columns, read_table
+            present = set(available_columns(file_path))
+            columns = [name for names in REGISTRATION_FIELDS.values() for name in names if name in present]
+            df = read_table(file_path, columns)
+            rows = df.astype(object).where(df.notna(), None).to_dict('records')
+        
+        records = [registration_record(row) for row in rows]
+        assigned = load_assigned_ids(file_path)
+        if assigned:
+            for record in records:
+                if not record['registration_id']:
+                    record['registration_id'] = assigned.get(registration_key(record))
+        
+        return cls(records)
+    
+    def __len__(self) -> int:
+        """Return the number of indexed registrations."""
+        return len(self.by_id)
+    
+    def lookup(self, scan: str) -> Optional[Dict]:
+        """
+        Find the registration for a scan.
+        
+        A scan may be a QR payload (JSON carrying ``registration_id``), a
+        registration ID, an email address or a phone number.
+        
+        Args:
+            scan (str): Scanned or typed text
+        
+        Returns:
+            Optional[Dict]: Registration record, or None if nothing matches
+        """
+        scan = scan.strip()
+        if not scan:
+            return None
+        
+        if scan.startswith('{'):
+            try:
+                scan = str(json.loads(scan).get('registration_id', '')).strip()
+            except (ValueError, AttributeError):
+                return None
+        
+        record = self.by_id.get(scan)
+        if record is not None:
+            return record
+        
+        if '@' in scan:
+            registration_id = self.by_email.get(normalize_email(scan))
+        else:
+            registration_id = self.by_phone.get(normalize_phone(scan))
+        return self.by_id.get(registration_id) if registration_id else None
+
+
+class CheckInLog:
+    def __init__(self, log_file: str = "checkins.jsonl"):
+        """
+        Open the append-only check-in log.
+        
+        Args:
+            log_file (str): JSON Lines file, one check-in per line
+        """
+        self.log_file = log_file
+        self._file = None
+    
+    def replay(self) -> Dict[str, Dict]:
+        """
+        Read earlier check-ins so a restarted service does not admit anyone twice.
+        
+        Returns:
+            Dict[str, Dict]: First check-in entry per registration ID
+        """
+        checked_in = {}
+        if not os.path.exists(self.log_file):
+            return checked_in
+        
+        with open(self.log_file, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash is skipped
+                    continue
+                checked_in.setdefault(entry['registration_id'], entry)
+        return checked_in
+    
+    def append(self, entry: Dict):
+        """Append one check-in and flush it to disk."""
+        if self._file is None:
+            self._file = open(self.log_file, 'a+')
+            # Terminate a torn last line so the new entry starts on its own line
+            if self._file.tell():
+                self._file.seek(self._file.tell() - 1)
+                if self._file.read(1) != '\n':
+                    self._file.write('\n')
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+    
+    def close(self):
+        """Close the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CheckInService:
+    def __init__(self, index: RegistrationIndex, log_file: str = "checkins.jsonl",
+                 codec: PayloadCodec = None):
+        """
+        Initialize the check-in service.
+        
+        Args:
+            index (RegistrationIndex): Registrations to check in against
+            log_file (str): Append-only check-in log
+            codec (PayloadCodec): Verifies compact QR payloads; without it they are rejected
+        """
+        self.index = index
+        self.codec = codec
+        self.log = CheckInLog(log_file)
+        self.checked_in = self.log.replay()
+        self.scans = 0
+    
+    def check_in(self, scan: str, station: str = None) -> Dict:
+        """
+        Check in the registration matching a scan.
+        
+        Args:
+            scan (str): Scanned QR payload, registration ID, email or phone
+            station (str): Optional name of the door or scanner
+        
+        Returns:
+            Dict: Result with 'status' ('checked_in', 'already_checked_in', 'not_found',
+                'invalid_payload' or 'invalid_id')
+        """
+        self.scans += 1
+        
+        # Base45 may end in a space, so only the line ending is stripped from compact payloads
+        payload = scan.lstrip().rstrip('\r\n')
+        if is_compact_payload(payload):
+            if self.codec is None:
+                return {'status': 'invalid_payload', 'error': 'No signing key loaded'}
+            try:
+                scan = self.codec.decode(payload)['registration_id']
+            except (InvalidPayload, UnicodeDecodeError) as e:
+                return {'status': 'invalid_payload', 'error': str(e)}
+        
+        # A misread barcode fails its check character instead of matching nothing
+        candidate = scan.strip().upper()
+        if is_generated_id(candidate):
+            if not is_valid_id(candidate):
+                return {'status': 'invalid_id'}
+            scan = candidate
+        
+        record = self.index.lookup(scan)
+        if record is None:
+            return {'status': 'not_found'}
+        
+        registration_id = record['registration_id']
+        previous = self.checked_in.get(registration_id)
+        if previous is not None:
+            return {'status': 'already_checked_in', **record, 'checked_in_at': previous['checked_in_at']}
+        
+        entry = {
+            'registration_id': registration_id,
+            'checked_in_at': datetime.now().isoformat(timespec='seconds'),
+            'station': station
+        }
+        self.log.append(entry)
+        self.checked_in[registration_id] = entry
+        return {'status': 'checked_in', **record, 'checked_in_at': entry['checked_in_at']}
+    
+    async def _read_scan(self, reader: asyncio.StreamReader) -> Optional[str]:
+        """Read one scan, continuing multi-line JSON payloads until they parse."""
+        line = await reader.readline()
+        if not line:
+            return None
+        
+        scan = line.decode('utf-8', errors='replace')
+        if scan.lstrip().startswith('{'):
+            for _ in range(MAX_SCAN_LINES):
+                try:
+                    json.loads(scan)
+                    break
+                except ValueError:
+                    more = await reader.readline()
+                    if not more:
+                        break
+                    scan += more.decode('utf-8', errors='replace')
+        return scan
+    
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve scans from one connected scanner until it disconnects."""
+        station = '{}:{}'.format(*writer.get_extra_info('peername')[:2])
+        try:
+            while True:
+                scan = await self._read_scan(reader)
+                if scan is None:
+                    break
+                if not scan.strip():
+                    continue
+                writer.write((json.dumps(self.check_in(scan, station)) + '\n').encode('utf-8'))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765):
+        """
+        Accept scanner connections until cancelled.
+        
+        Args:
+            host (str): Interface to listen on (use the venue LAN address for remote scanners)
+            port (int): TCP port
+        """
+        server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"Check-in service listening on {host}:{port} "
+              f"({len(self.index)} registrations, {len(self.checked_in)} already checked in)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.log.close()
+
+
+def load_codec(key_file: str = "qr_payload.key") -> Optional[PayloadCodec]:
+    """Return a codec for the badge signing key, or None (with a warning) if the key is missing."""
+    key = load_key(key_file)
+    if key is None:
+        print(f"Warning: signing key {key_file} not found; compact QR payloads will be rejected")
+        return None
+    return PayloadCodec(key)
+
+
+def main():
+    """Run the check-in service from the command line."""
+    parser = argparse.ArgumentParser(description="ExJAM offline check-in service")
+    parser.add_argument('registrations', help='Registrations file (JSON, CSV, Parquet or Feather)')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port')
+    parser.add_argument('--log', default='checkins.jsonl', help='Append-only check-in log')
+    parser.add_argument('--key', default='qr_payload.key', help='Signing key used for the badge QR codes')
+    args = parser.parse_args()
+    
+    service = CheckInService(RegistrationIndex.load(args.registrations), args.log, load_codec(args.key))
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\nCheck-in service stopped after {service.scans} scans "
+              f"({len(service.checked_in)} checked in)")
+
+
+if __name__ == "__main__":
+    main()
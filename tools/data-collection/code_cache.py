@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Code Image Cache
+
+This module provides a content-addressed, on-disk cache for rendered QR codes and barcodes,
+so repeated runs and badge reprints can skip encoding images that were already produced.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CodeCache:
+    def __init__(self, cache_dir: str = "code_cache", max_entries: int = 10000, autosave_every: int = 100):
+        """
+        Initialize the code cache.
+        
+        Entries are stored as one file per key, named after the SHA-256 of the
+        payload and render parameters. An index file keeps the least-recently
+        used order so the cache can be trimmed to ``max_entries``.
+        
+        Args:
+            cache_dir (str): Directory holding cached images and the index
+            max_entries (int): Maximum number of cached images before LRU eviction
+            autosave_every (int): Write the index after this many changes
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.autosave_every = autosave_every
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending_changes = 0
+        
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index = self._load_index()
+    
+    @staticmethod
+    def make_key(kind: str, payload: str, **params) -> str:
+        """
+        Build the cache key for a payload and its render parameters.
+        
+        Args:
+            kind (str): Kind of image, e.g. 'qr' or 'barcode'
+            payload (str): Data encoded in the image
+            **params: Render parameters (box size, border, error correction, symbology, ...)
+            
+        Returns:
+            str: Hex digest identifying the rendered image
+        """
+        material = json.dumps({'kind': kind, 'payload': payload, 'params': params}, sort_keys=True)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+    
+    def _load_index(self) -> OrderedDict:
+        """Load the LRU index from disk, oldest entry first."""
+        if not os.path.exists(self.index_file):
+            return OrderedDict()
+        
+        try:
+            with open(self.index_file, 'r') as f:
+                return OrderedDict((key, None) for key in json.load(f).get('entries', []))
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable code cache index: %s", e, extra={'index_file': self.index_file})
+            return OrderedDict()
+    
+    def _entry_path(self, key: str) -> str:
+        """Return the file path of a cache entry."""
+        return os.path.join(self.cache_dir, key[:2], key)
+    
+    def _touch(self, key: str):
+        """Mark a key as most recently used and autosave the index when due."""
+        self.index[key] = None
+        self.index.move_to_end(key)
+        self._pending_changes += 1
+        if self._pending_changes >= self.autosave_every:
+            self.flush()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a cached image.
+        
+        Args:
+            key (str): Cache key from ``make_key``
+            
+        Returns:
+            Optional[bytes]: Cached image bytes, or None on a miss
+        """
+        path = self._entry_path(key)
+        
+        # The entry file is the source of truth, so entries written by other
+        # processes are found even if this process's index has not seen them
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self._touch(key)
+        return data
+    
+    def put(self, key: str, data: bytes):
+        """
+        Store an image in the cache, evicting the least recently used entries if full.
+        
+        Args:
+            key (str): Cache key from ``make_key``
+            data (bytes): Rendered image bytes
+        """
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        
+        self._touch(key)
+        self._evict()
+    
+    def _evict(self):
+        """Remove least recently used entries until the cache fits ``max_entries``."""
+        while len(self.index) > self.max_entries:
+            evicted_key, _ = self.index.popitem(last=False)
+            try:
+                os.remove(self._entry_path(evicted_key))
+            except OSError:
+                pass
+            self.evictions += 1
+    
+    def flush(self):
+        """
+        Write the LRU index to disk.
+        
+        Entries recorded on disk by other processes (e.g. bulk-badge workers)
+        are merged in as older than this process's entries, then the index is
+        trimmed back to ``max_entries``.
+        """
+        merged = self._load_index()
+        for key in self.index:
+            merged.pop(key, None)
+        merged.update(self.index)
+        self.index = merged
+        self._evict()
+        
+        temp_file = f"{self.index_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w') as f:
+            json.dump({'entries': list(self.index)}, f)
+        os.replace(temp_file, self.index_file)
+        self._pending_changes = 0
+    
+    def stats(self) -> Dict[str, float]:
+        """
+        Report cache counters.
+        
+        Returns:
+            Dict[str, float]: Hits, misses, evictions, entry count and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self.index),
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Columnar Storage for Registration and Alumni Data
+
+This module reads and writes registration exports and alumni survey data as Parquet or Feather
+files with categorical dtypes, so repeated analyses load only the columns they use instead of
+reparsing a CSV. CSV stays available as an import/export format.
+
+Registrations for several events are kept as a dataset directory partitioned by event code
+(``<dataset>/event_code=<CODE>/part-0.parquet``), which ``read_table`` reads like a single file.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from instrumentation import count, timer
+
+logger = logging.getLogger(__name__)
+
+# pandas and pyarrow are imported on first use so that importing this module is cheap
+if TYPE_CHECKING:
+    import pandas as pd
+
+# File extensions understood by read_table and write_table
+STORAGE_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.csv': 'csv'
+}
+
+# Columns read by the registration report generators
+REGISTRATION_REPORT_COLUMNS = [
+    'created_time',
+    'Graduation Year from Air Force Military School Jos',
+    'Current Location (City, State/Province, Country)',
+    'Current Occupation/Profession',
+    'Do you need accommodation assistance?',
+    'Do you need transportation assistance from the airport?',
+    'Which conference sessions are you most interested in? (Select all that apply)',
+    'Would you be interested in speaking at the conference?',
+    'Dietary Restrictions (for catering purposes)',
+    'Special Needs or Accessibility Requirements'
+]
+
+# Repetitive registration answers stored as categoricals
+REGISTRATION_CATEGORICAL_COLUMNS = REGISTRATION_REPORT_COLUMNS[1:-1]
+
+# Text columns with at most this share of distinct values are stored as categoricals
+CATEGORICAL_MAX_RATIO = 0.5
+
+# Column a dataset directory is partitioned by, and the file written per partition
+PARTITION_COLUMN = 'event_code'
+PARTITION_FILE = 'part-0.parquet'
+
+
+def detect_format(file_path: str) -> str:
+    """
+    Return the storage format of a file from its extension.
+    
+    Args:
+        file_path (str): Path to a Parquet, Feather or CSV file
+    
+    Returns:
+        str: 'parquet', 'feather', 'csv' or 'dataset' (a partitioned dataset directory)
+    """
+    if os.path.isdir(file_path):
+        return 'dataset'
+    
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in STORAGE_FORMATS:
+        raise ValueError(f"Unsupported data file '{file_path}'. Use one of: {', '.join(sorted(STORAGE_FORMATS))}")
+    return STORAGE_FORMATS[extension]
+
+
+def available_columns(file_path: str) -> List[str]:
+    """
+    List the columns stored in a file without loading its data.
+    
+    Args:
+        file_path (str): Path to a Parquet, Feather or CSV file
+    
+    Returns:
+        List[str]: Column names in file order
+    """
+    file_format = detect_format(file_path)
+    
+    if file_format == 'dataset':
+        names = [PARTITION_COLUMN]
+        for partition_file in dataset_partitions(file_path).values():
+            names += [name for name in available_columns(partition_file) if name not in names]
+        return names
+    
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        return [name for name in pq.read_schema(file_path).names if not name.startswith('__index_level_')]
+    
+    if file_format == 'feather':
+        import pyarrow.ipc as ipc
+        with ipc.open_file(file_path) as reader:
+            return reader.schema.names
+    
+    import pandas as pd
+    return list(pd.read_csv(file_path, nrows=0).columns)
+
+
+def to_categoricals(df: pd.DataFrame, categorical_columns: Iterable[str] = None,
+                    max_ratio: float = CATEGORICAL_MAX_RATIO) -> pd.DataFrame:
+    """
+    Convert repetitive columns to categorical dtype in place.
+    
+    Columns listed in ``categorical_columns`` are always converted (this is
+    how repetitive numeric columns such as graduation year are opted in).
+    Any other text column is converted when its share of distinct values is
+    at most ``max_ratio``.
+    
+    Args:
+        df (pd.DataFrame): Data to convert
+        categorical_columns (Iterable[str]): Columns to convert regardless of type
+        max_ratio (float): Distinct-value ratio below which text columns are converted
+    
+    Returns:
+        pd.DataFrame: The same DataFrame, for chaining
+    """
+    import pandas as pd
+    
+    forced = set(categorical_columns or ())
+    rows = len(df)
+    
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        
+        if column in forced:
+            df[column] = series.astype('category')
+        elif rows and (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+            if series.nunique(dropna=True) <= rows * max_ratio:
+                df[column] = series.astype('category')
+    
+    return df
+
+
+def read_table(file_path: str, columns: Iterable[str] = None,
+               categorical_columns: Iterable[str] = None, partitions: Iterable[str] = None) -> pd.DataFrame:
+    """
+    Load a Parquet, Feather or CSV file, reading only the requested columns.
+    
+    Requested columns that are not present in the file are skipped, so
+    callers can ask for optional columns. CSV input is converted to
+    categoricals after parsing; columnar files keep the dtypes they were
+    written with. A dataset directory is read with ``read_dataset``.
+    
+    Args:
+        file_path (str): Path to the data file or dataset directory
+        columns (Iterable[str]): Columns to load (None loads every column)
+        categorical_columns (Iterable[str]): Columns to force to categorical dtype
+        partitions (Iterable[str]): Partitions to read from a dataset directory (None reads all)
+    
+    Returns:
+        pd.DataFrame: Loaded data
+    """
+    import pandas as pd
+    
+    file_format = detect_format(file_path)
+    if file_format == 'dataset':
+        return read_dataset(file_path, columns, categorical_columns, partitions)
+    
+    wanted = list(dict.fromkeys(columns)) if columns is not None else None
+    
+    with timer('table_read_seconds', format=file_format):
+        if file_format == 'csv':
+            usecols = (lambda column: column in wanted) if wanted is not None else None
+            df = to_categoricals(pd.read_csv(file_path, usecols=usecols), categorical_columns)
+        else:
+            if wanted is not None:
+                present = set(available_columns(file_path))
+                wanted = [column for column in wanted if column in present]
+            
+            if file_format == 'parquet':
+                df = pd.read_parquet(file_path, columns=wanted)
+            else:
+                df = pd.read_feather(file_path, columns=wanted)
+            
+            if categorical_columns:
+                to_categoricals(df, [column for column in categorical_columns if column in df.columns], max_ratio=0)
+    
+    count('table_rows_read_total', len(df), format=file_format)
+    return df
+
+
+def dataset_partitions(dataset_dir: str) -> Dict[str, str]:
+    """
+    List the partitions of a dataset directory.
+    
+    Args:
+        dataset_dir (str): Dataset directory
+    
+    Returns:
+        Dict[str, str]: Partition file per partition value, sorted by value
+    """
+    prefix = f"{PARTITION_COLUMN}="
+    partitions = {}
+    for name in sorted(os.listdir(dataset_dir)):
+        partition_file = os.path.join(dataset_dir, name, PARTITION_FILE)
+        if name.startswith(prefix) and os.path.isfile(partition_file):
+            partitions[name[len(prefix):]] = partition_file
+    return partitions
+
+
+def read_dataset(dataset_dir: str, columns: Iterable[str] = None, categorical_columns: Iterable[str] = None,
+                 partitions: Iterable[str] = None) -> pd.DataFrame:
+    """
+    Load the partitions of a dataset directory as one table.
+    
+    Each row gets its partition value in ``PARTITION_COLUMN``. Partitions
+    may have different columns (e.g. events asking different questions);
+    the result has the union, with missing answers left empty.
+    
+    Args:
+        dataset_dir (str): Dataset directory
+        columns (Iterable[str]): Columns to load (None loads every column)
+        categorical_columns (Iterable[str]): Columns to force to categorical dtype
+        partitions (Iterable[str]): Partition values to read (None reads all)
+    
+    Returns:
+        pd.DataFrame: Rows of the selected partitions, in partition order
+    """
+    import pandas as pd
+    
+    available = dataset_partitions(dataset_dir)
+    selected = list(available) if partitions is None else [value for value in partitions if value in available]
+    
+    frames = []
+    for value in selected:
+        df = read_table(available[value], columns)
+        df.insert(0, PARTITION_COLUMN, value)
+        frames.append(df)
+    
+    if frames:
+        # Categories differ between partitions, so categoricals are rebuilt after concatenating
+        df = pd.concat(frames, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=[PARTITION_COLUMN] + list(columns or []))
+    
+    if columns is not None:
+        df = df[[PARTITION_COLUMN] + [column for column in dict.fromkeys(columns)
+                                      if column in df.columns and column != PARTITION_COLUMN]]
+    
+    forced = [PARTITION_COLUMN] + [column for column in categorical_columns or () if column in df.columns]
+    return to_categoricals(df, forced, max_ratio=0)
+
+
+def write_partition(df: pd.DataFrame, dataset_dir: str, value: str, categorical_columns: Iterable[str] = None,
+                    compression: Optional[str] = 'zstd') -> str:
+    """
+    Write (or replace) one partition of a dataset directory.
+    
+    The partition file is written next to the old one and renamed over it,
+    so readers never see a half-written partition.
+    
+    Args:
+        df (pd.DataFrame): Rows of the partition (a ``PARTITION_COLUMN`` column is dropped)
+        dataset_dir (str): Dataset directory
+        value (str): Partition value, e.g. the event code
+        categorical_columns (Iterable[str]): Columns to force to categorical dtype
+        compression (str): Compression codec (None disables it)
+    
+    Returns:
+        str: Path to the written partition file
+    """
+    partition_dir = os.path.join(dataset_dir, f"{PARTITION_COLUMN}={value}")
+    os.makedirs(partition_dir, exist_ok=True)
+    
+    partition_file = os.path.join(partition_dir, PARTITION_FILE)
+    temp_file = f"{partition_file}.tmp.parquet"
+    write_table(df.drop(columns=[PARTITION_COLUMN], errors='ignore'), temp_file, categorical_columns, compression)
+    os.replace(temp_file, partition_file)
+    return partition_file
+
+
+def iter_table_chunks(file_path: str, columns: Iterable[str] = None,
+                      chunk_size: int = 100000) -> Iterator[pd.DataFrame]:
+    """
+    Yield a Parquet, Feather or CSV file in chunks of at most ``chunk_size`` rows.
+    
+    Only the requested columns are read, and missing ones are skipped as in
+    ``read_table``. Memory use is bounded by the chunk size rather than the
+    file size; a dataset directory is read partition by partition.
+    
+    Args:
+        file_path (str): Path to the data file
+        columns (Iterable[str]): Columns to load (None loads every column)
+        chunk_size (int): Maximum rows per chunk
+    
+    Yields:
+        pd.DataFrame: Next chunk of rows
+    """
+    import pandas as pd
+    
+    file_format = detect_format(file_path)
+    wanted = list(dict.fromkeys(columns)) if columns is not None else None
+    
+    if file_format == 'dataset':
+        for value, partition_file in dataset_partitions(file_path).items():
+            for chunk in iter_table_chunks(partition_file, columns, chunk_size):
+                chunk.insert(0, PARTITION_COLUMN, value)
+                yield chunk
+        return
+    
+    if file_format == 'csv':
+        usecols = (lambda column: column in wanted) if wanted is not None else None
+        yield from pd.read_csv(file_path, usecols=usecols, chunksize=chunk_size)
+        return
+    
+    if wanted is not None:
+        present = set(available_columns(file_path))
+        wanted = [column for column in wanted if column in present]
+    
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size, columns=wanted):
+            yield batch.to_pandas()
+        return
+    
+    import pyarrow.ipc as ipc
+    with ipc.open_file(file_path) as reader:
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            if wanted is not None:
+                batch = batch.select(wanted)
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size).to_pandas()
+
+
+def write_table(df: pd.DataFrame, file_path: str, categorical_columns: Iterable[str] = None,
+                compression: Optional[str] = 'zstd') -> str:
+    """
+    Write data to Parquet, Feather or CSV, chosen by the file extension.
+    
+    Columnar files are written with categorical dtypes so repetitive answers
+    are dictionary-encoded on disk.
+    
+    Args:
+        df (pd.DataFrame): Data to write
+        file_path (str): Output path
+        categorical_columns (Iterable[str]): Columns to force to categorical dtype
+        compression (str): Compression codec for columnar files (None disables it)
+    
+    Returns:
+        str: Path to the written file
+    """
+    file_format = detect_format(file_path)
+    
+    if file_format == 'csv':
+        df.to_csv(file_path, index=False)
+        return file_path
+    
+    df = to_categoricals(df.reset_index(drop=True), categorical_columns)
+    
+    if file_format == 'parquet':
+        df.to_parquet(file_path, index=False, compression=compression)
+    else:
+        df.to_feather(file_path, compression=compression or 'uncompressed')
+    
+    return file_path
+
+
+def convert_table(source_file: str, output_file: str, categorical_columns: Iterable[str] = None) -> str:
+    """
+    Convert between CSV, Parquet and Feather (e.g. import a CSV export into Parquet).
+    
+    Args:
+        source_file (str): Input data file
+        output_file (str): Output data file
+        categorical_columns (Iterable[str]): Columns to force to categorical dtype
+    
+    Returns:
+        str: Path to the written file
+    """
+    df = read_table(source_file, categorical_columns=categorical_columns)
+    write_table(df, output_file, categorical_columns)
+    logger.info("Converted %s to %s: %d records", source_file, output_file, len(df),
+                extra={'source_file': source_file, 'output_file': output_file, 'records': len(df)})
+    return output_file
@@ -6,46 +6,367 @@ This module provides comprehensive functionality for creating Google Forms-based
 with both QR codes and barcodes for events like the PG Conference.
 """
 
-import qrcode
-import barcode
-from barcode.writer import ImageWriter
-import requests
+from __future__ import annotations
+
+import asyncio
 import json
-import csv
+import logging
 import os
-import uuid
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 import pickle
-import base64
 from io import BytesIO
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from async_forms_client import DEFAULT_CONCURRENCY, FORMS_API_URL, export_forms
+from code_cache import CodeCache
+from form_export import FormResponseExporter
+from instrumentation import METRICS, count, installed_rate_limit, timer
+from registration_report import COMPREHENSIVE_REPORT_TEMPLATE, generate_registration_report
+from qr_payload import DEFAULT_EVENT_CODE, EVENT_CODES, PayloadCodec, event_details, load_or_create_key, register_event
+from registration_ids import IdGenerator
+
+# qrcode, python-barcode, ReportLab and the Google API clients are imported by the
+# functions that use them, so importing this module (e.g. for a CLI) stays fast
+if TYPE_CHECKING:
+    from reportlab.graphics.shapes import Drawing
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Image, TableStyle
+
+logger = logging.getLogger(__name__)
+
+# QR code error correction levels accepted by render_qr_code
+# (the values of qrcode.constants.ERROR_CORRECT_*)
+QR_ERROR_CORRECTION = {
+    'L': 1,
+    'M': 0,
+    'Q': 3,
+    'H': 2
+}
+
+# Output formats accepted by render_qr_code and render_barcode, with their file extensions
+CODE_OUTPUT_FORMATS = ('png', 'svg', 'drawing')
+CODE_FILE_EXTENSIONS = {'png': 'png', 'svg': 'svg', 'drawing': 'pdf'}
+
+# Code formats ReportLab can embed in a badge (SVG needs an extra converter)
+BADGE_CODE_FORMATS = ('png', 'drawing')
+
+# python-barcode symbologies with a ReportLab vector equivalent
+REPORTLAB_BARCODE_TYPES = {
+    'code128': 'Code128',
+    'code39': 'Standard39',
+    'ean13': 'EAN13',
+    'ean8': 'EAN8',
+    'upca': 'UPCA'
+}
+
+# Registration QR payload formats: signed base45 ('compact') or the original pretty-printed JSON
+QR_PAYLOAD_FORMATS = ('compact', 'json')
+
+# Badge renderers: precomputed layouts drawn on the canvas, or the original platypus flowables
+BADGE_RENDERERS = ('canvas', 'platypus')
+
+# Participant fields shown on a badge, with their labels
+BADGE_INFO_FIELDS = [
+    ('Name:', 'full_name'),
+    ('Registration ID:', 'registration_id'),
+    ('Graduation Year:', 'graduation_year'),
+    ('Organization:', 'organization'),
+    ('Location:', 'current_location'),
+    ('Email:', 'email'),
+    ('Phone:', 'phone')
+]
+
+# Badges per A4 page for the batch badge sheet, as (columns, rows)
+BADGE_SHEET_LAYOUTS = {
+    '2x2': (2, 2),
+    '2x4': (2, 4)
+}
+
+# Badge styles shared by every badge, built on first use
+_badge_table_commands = {}
+_badge_table_styles = {}
+_badge_title_style = None
+_badge_codes_style = None
+
+# Registration module owned by each bulk-badge worker process
+_worker_registration = None
+
+
+def _get_badge_title_style() -> ParagraphStyle:
+    """Return the badge title paragraph style, building it once."""
+    global _badge_title_style
+    if _badge_title_style is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        
+        styles = getSampleStyleSheet()
+        _badge_title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=1  # Center alignment
+        )
+    return _badge_title_style
+
+
+def _get_badge_codes_style() -> TableStyle:
+    """Return the style of the badge QR code and barcode row, building it once."""
+    global _badge_codes_style
+    if _badge_codes_style is None:
+        from reportlab.platypus import TableStyle
+        
+        _badge_codes_style = TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+        ])
+    return _badge_codes_style
+
+
+def _get_badge_table_commands(font_size: float) -> Tuple[List[tuple], List[tuple]]:
+    """
+    Return the (info, event) badge table style commands for a font size, building them once.
+    
+    Platypus badges wrap them in TableStyles; the canvas renderer lays its tables out from them.
+    
+    Args:
+        font_size (float): Font size used in the badge tables
+        
+    Returns:
+        Tuple[List[tuple], List[tuple]]: Commands for the participant and event tables
+    """
+    if font_size not in _badge_table_commands:
+        from reportlab.lib import colors
+        
+        # Full-page badges keep the roomy padding; sheet badges are packed tighter
+        padding = [('BOTTOMPADDING', (0, 0), (-1, -1), 12)] if font_size >= 12 else [
+            ('LEADING', (0, 0), (-1, -1), font_size * 1.2),
+            ('TOPPADDING', (0, 0), (-1, -1), font_size * 0.25),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), font_size * 0.35)
+        ]
+        info_commands = [
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('BACKGROUND', (0, 0), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ] + padding
+        event_commands = [
+            ('BACKGROUND', (0, 0), (0, -1), colors.lightgreen),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, -1), font_size),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ] + padding
+        _badge_table_commands[font_size] = (info_commands, event_commands)
+    
+    return _badge_table_commands[font_size]
+
+
+def _get_badge_table_styles(font_size: float) -> Tuple[TableStyle, TableStyle]:
+    """
+    Return the (info, event) badge table styles for a font size, building them once.
+    
+    Args:
+        font_size (float): Font size used in the badge tables
+        
+    Returns:
+        Tuple[TableStyle, TableStyle]: Styles for the participant and event tables
+    """
+    if font_size not in _badge_table_styles:
+        from reportlab.platypus import TableStyle
+        
+        info_commands, event_commands = _get_badge_table_commands(font_size)
+        _badge_table_styles[font_size] = (TableStyle(info_commands), TableStyle(event_commands))
+    
+    return _badge_table_styles[font_size]
+
+
+def _qr_matrix_drawing(matrix: List[List[bool]], module_size: float) -> Drawing:
+    """
+    Build a ReportLab vector drawing from a QR module matrix.
+    
+    Consecutive dark modules in a row are merged into one rectangle, and all
+    rectangles go into a single path, which keeps both the drawing and the
+    PDF content stream small.
+    
+    Args:
+        matrix (List[List[bool]]): QR modules including the quiet zone, top row first
+        module_size (float): Width of one module in points
+        
+    Returns:
+        Drawing: Vector drawing of the QR code
+    """
+    from reportlab.graphics.shapes import Drawing, Path, Rect
+    from reportlab.lib import colors
+    
+    side = len(matrix) * module_size
+    drawing = Drawing(side, side)
+    drawing.add(Rect(0, 0, side, side, fillColor=colors.white, strokeColor=None))
+    
+    modules = Path(fillColor=colors.black, strokeColor=None)
+    for row_index, row in enumerate(matrix):
+        bottom = side - (row_index + 1) * module_size
+        top = bottom + module_size
+        run_start = None
+        for col_index, dark in enumerate(row + [False]):
+            if dark and run_start is None:
+                run_start = col_index
+            elif not dark and run_start is not None:
+                left, right = run_start * module_size, col_index * module_size
+                modules.moveTo(left, bottom)
+                modules.lineTo(right, bottom)
+                modules.lineTo(right, top)
+                modules.lineTo(left, top)
+                modules.closePath()
+                run_start = None
+    drawing.add(modules)
+    
+    return drawing
+
+
+def _fit_code(code: Union[BytesIO, Drawing], max_width: float, max_height: float) -> Union[Image, Drawing]:
+    """
+    Scale a rendered code to the largest size that fits the box without distortion.
+    
+    Args:
+        code (Union[BytesIO, Drawing]): Raster image buffer or vector drawing
+        max_width (float): Available width in points
+        max_height (float): Available height in points
+        
+    Returns:
+        Union[Image, Drawing]: Flowable that can be added to a story or drawn on a canvas
+    """
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Image
+    
+    if not isinstance(code, BytesIO):
+        code.renderScale = min(max_width / code.width, max_height / code.height)
+        return code
+    
+    image_width, image_height = ImageReader(code).getSize()
+    code.seek(0)
+    scale = min(max_width / image_width, max_height / image_height)
+    return Image(code, width=image_width * scale, height=image_height * scale)
+
+
+def _init_badge_worker(cache_dir: str = None, cache_size: int = 10000, code_format: str = 'png',
+                       qr_payload_format: str = 'compact', payload_key_file: str = "qr_payload.key",
+                       event_code: str = DEFAULT_EVENT_CODE, event: Dict = None, badge_renderer: str = 'canvas'):
+    """Create the registration module used by a bulk-badge worker process."""
+    global _worker_registration
+    # Events loaded from a configuration file are not known to a freshly spawned worker
+    if event is not None:
+        register_event(event_code, event)
+    _worker_registration = EnhancedExjamRegistrationModule(cache_dir=cache_dir, cache_size=cache_size,
+                                                           code_format=code_format,
+                                                           qr_payload_format=qr_payload_format,
+                                                           payload_key_file=payload_key_file,
+                                                           event_code=event_code, badge_renderer=badge_renderer)
+
+
+def _render_badge(registration, participant: Dict, save_code_images: bool = False) -> str:
+    """Render the registration codes in memory and build the badge for a single participant."""
+    registration_id = participant['registration_id']
+    codes = registration.render_registration_codes(registration_id)
+    
+    if save_code_images:
+        registration.save_registration_codes(registration_id, codes)
+    
+    return registration.create_participant_badge(participant, codes=codes)
+
+
+def _render_badge_chunk(chunk: List[Tuple[int, Dict]], save_code_images: bool = False
+                        ) -> Tuple[List[Tuple[int, Optional[str], Optional[str]]], Tuple[int, int], Dict, Dict]:
+    """
+    Render a chunk of badges inside a worker process.
+    
+    Args:
+        chunk (List[Tuple[int, Dict]]): (index, participant) pairs to render
+        save_code_images (bool): Also write the QR code and barcode images to disk
+        
+    Returns:
+        Tuple: (index, badge path, error) per participant, the chunk's code cache (hits, misses),
+            the worker's metrics recorded for the chunk and its suppressed log record counts
+    """
+    cache = _worker_registration.code_cache
+    hits, misses = (cache.hits, cache.misses) if cache else (0, 0)
+    
+    results = []
+    for index, participant in chunk:
+        try:
+            results.append((index, _render_badge(_worker_registration, participant, save_code_images), None))
+        except Exception as e:
+            results.append((index, None, f"{type(e).__name__}: {e}"))
+    
+    # Metrics and suppressed log counts are handed to the parent with each chunk,
+    # so the worker starts the next chunk empty
+    metrics = METRICS.snapshot()
+    METRICS.reset()
+    rate_limit = installed_rate_limit()
+    suppressed = rate_limit.drain() if rate_limit else {}
+    
+    if cache:
+        cache.flush()
+        return results, (cache.hits - hits, cache.misses - misses), metrics, suppressed
+    return results, (0, 0), metrics, suppressed
+
 
 class EnhancedExjamRegistrationModule:
-    def __init__(self, credentials_file: str = None):
+    def __init__(self, credentials_file: str = None, cache_dir: str = None, cache_size: int = 10000,
+                 code_format: str = 'png', qr_payload_format: str = 'compact',
+                 payload_key_file: str = "qr_payload.key", event_code: str = DEFAULT_EVENT_CODE,
+                 id_registry_file: str = "registration_ids.log", badge_renderer: str = 'canvas'):
         """
         Initialize the enhanced registration module.
         
         Args:
             credentials_file (str): Path to Google API credentials file
+            cache_dir (str): Optional directory for the QR code and barcode image cache
+            cache_size (int): Maximum number of cached code images
+            code_format (str): Format of the codes embedded in badges ('png' or 'drawing')
+            qr_payload_format (str): Registration QR payload, 'compact' (signed) or 'json'
+            payload_key_file (str): Signing key for compact payloads, created on first use
+            event_code (str): Event whose details appear on codes, badges and reports (see EVENT_CODES)
+            id_registry_file (str): Registry of issued registration IDs, shared across runs and processes
+            badge_renderer (str): 'canvas' (layout computed once, fast) or 'platypus' (flowables per badge)
         """
+        if code_format not in BADGE_CODE_FORMATS:
+            raise ValueError(f"Unknown badge code format '{code_format}'. "
+                             f"Choose from: {', '.join(BADGE_CODE_FORMATS)}")
+        if qr_payload_format not in QR_PAYLOAD_FORMATS:
+            raise ValueError(f"Unknown QR payload format '{qr_payload_format}'. "
+                             f"Choose from: {', '.join(QR_PAYLOAD_FORMATS)}")
+        if event_code not in EVENT_CODES:
+            raise ValueError(f"Unknown event code '{event_code}'. Choose from: {', '.join(EVENT_CODES)}")
+        if badge_renderer not in BADGE_RENDERERS:
+            raise ValueError(f"Unknown badge renderer '{badge_renderer}'. Choose from: {', '.join(BADGE_RENDERERS)}")
+        
         self.credentials_file = credentials_file
+        self.credentials = None
         self.service = None
         self.form_id = None
         self.qr_codes_dir = "qr_codes"
         self.barcodes_dir = "barcodes"
         self.badges_dir = "badges"
         self.registration_data = {}
+        self.bulk_badge_failures = []
+        self.cache_dir = cache_dir
+        self.cache_size = cache_size
+        self.code_cache = CodeCache(cache_dir, cache_size) if cache_dir else None
+        self.code_format = code_format
+        self.qr_payload_format = qr_payload_format
+        self.payload_key_file = payload_key_file
+        self.event_code = event_code
+        self.event = event_details(event_code)
+        self._payload_codec = None
+        self.id_registry_file = id_registry_file
+        self._id_generators = {}
+        self.badge_renderer = badge_renderer
+        self._badge_templates = {}
         
         # Create directories
         for directory in [self.qr_codes_dir, self.barcodes_dir, self.badges_dir]:
@@ -57,6 +378,10 @@ class EnhancedExjamRegistrationModule:
     
     def _initialize_google_service(self):
         """Initialize Google Forms API service."""
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
+        
         SCOPES = ['https://www.googleapis.com/auth/forms.body',
                   'https://www.googleapis.com/auth/forms.responses.readonly']
         
@@ -80,23 +405,202 @@ class EnhancedExjamRegistrationModule:
             with open('token.pickle', 'wb') as token:
                 pickle.dump(creds, token)
         
+        self.credentials = creds
         self.service = build('forms', 'v1', credentials=creds)
     
+    def _id_generator(self, prefix: str) -> IdGenerator:
+        """Return the ID generator for a prefix."""
+        if prefix not in self._id_generators:
+            self._id_generators[prefix] = IdGenerator(prefix, self.id_registry_file)
+        return self._id_generators[prefix]
+    
     def generate_unique_id(self, prefix: str = "EXJAM") -> str:
         """
         Generate a unique identifier for registration.
         
+        IDs are time-ordered and end in a check character (see registration_ids).
+        
         Args:
             prefix (str): Prefix for the ID
             
         Returns:
             str: Unique identifier
         """
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique_part = str(uuid.uuid4())[:8].upper()
-        return f"{prefix}-{timestamp}-{unique_part}"
+        return self._id_generator(prefix).new_id()
     
-    def generate_qr_code(self, data: str, filename: str = None, size: int = 10) -> str:
+    def allocate_ids(self, count: int, prefix: str = "EXJAM") -> List[str]:
+        """
+        Allocate a batch of unique registration IDs with one registry update.
+        
+        Args:
+            count (int): Number of IDs
+            prefix (str): Prefix for the IDs
+            
+        Returns:
+            List[str]: Unique identifiers in increasing order
+        """
+        return self._id_generator(prefix).allocate(count)
+    
+    def render_qr_code(self, data: str, size: int = 10, border: int = 4,
+                       error_correction: str = 'L', output_format: str = 'png') -> Union[BytesIO, Drawing]:
+        """
+        Render a QR code for the given data in memory.
+        
+        The 'png' format is a raster image; 'svg' and 'drawing' are vector
+        outputs that stay sharp at any print size. A 'drawing' is a ReportLab
+        ``Drawing`` sized ``size`` points per module, ready to place on a badge.
+        When a code cache is configured, identical PNG and SVG payloads rendered
+        with the same parameters are served from the cache instead of re-encoded.
+        
+        Args:
+            data (str): Data to encode in QR code
+            size (int): Size of the QR code
+            border (int): Quiet-zone width in boxes
+            error_correction (str): Error correction level (L, M, Q or H)
+            output_format (str): One of CODE_OUTPUT_FORMATS ('png', 'svg' or 'drawing')
+            
+        Returns:
+            Union[BytesIO, Drawing]: Image buffer positioned at the start, or a ReportLab Drawing
+        """
+        if output_format not in CODE_OUTPUT_FORMATS:
+            raise ValueError(f"Unknown code output format '{output_format}'. "
+                             f"Choose from: {', '.join(CODE_OUTPUT_FORMATS)}")
+        
+        cache_key = None
+        if self.code_cache and output_format != 'drawing':
+            cache_key = CodeCache.make_key('qr', data, box_size=size, border=border,
+                                           error_correction=error_correction, format=output_format)
+            cached = self.code_cache.get(cache_key)
+            if cached is not None:
+                return BytesIO(cached)
+        
+        import qrcode
+        from qrcode.image.svg import SvgPathImage
+        
+        with timer('qr_encode_seconds', format=output_format):
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=QR_ERROR_CORRECTION[error_correction],
+                box_size=size,
+                border=border,
+                image_factory=SvgPathImage if output_format == 'svg' else None
+            )
+            qr.add_data(data)
+            qr.make(fit=True)
+            
+            if output_format == 'drawing':
+                return _qr_matrix_drawing(qr.get_matrix(), size)
+            
+            img = qr.make_image(fill_color="black", back_color="white")
+            
+            buffer = BytesIO()
+            if output_format == 'svg':
+                img.save(buffer)
+            else:
+                img.save(buffer, format="PNG")
+            buffer.seek(0)
+        
+        if cache_key:
+            self.code_cache.put(cache_key, buffer.getvalue())
+        return buffer
+    
+    def render_barcode(self, data: str, barcode_type: str = "code128",
+                       output_format: str = 'png') -> Union[BytesIO, Drawing]:
+        """
+        Render a barcode for the given data in memory.
+        
+        The 'svg' format uses python-barcode's SVG writer; 'drawing' builds a
+        ReportLab barcode ``Drawing`` with human-readable text underneath.
+        
+        Args:
+            data (str): Data to encode in barcode
+            barcode_type (str): Type of barcode (code128, code39, ean13, etc.)
+            output_format (str): One of CODE_OUTPUT_FORMATS ('png', 'svg' or 'drawing')
+            
+        Returns:
+            Union[BytesIO, Drawing]: Image buffer positioned at the start, or a ReportLab Drawing
+        """
+        if output_format not in CODE_OUTPUT_FORMATS:
+            raise ValueError(f"Unknown code output format '{output_format}'. "
+                             f"Choose from: {', '.join(CODE_OUTPUT_FORMATS)}")
+        
+        if output_format == 'drawing':
+            if barcode_type not in REPORTLAB_BARCODE_TYPES:
+                raise ValueError(f"Barcode type '{barcode_type}' has no vector drawing renderer. "
+                                 f"Choose from: {', '.join(REPORTLAB_BARCODE_TYPES)}")
+            from reportlab.graphics.barcode import createBarcodeDrawing
+            from reportlab.lib.units import inch
+            with timer('barcode_encode_seconds', format=output_format):
+                return createBarcodeDrawing(REPORTLAB_BARCODE_TYPES[barcode_type], value=data,
+                                            humanReadable=True, barHeight=0.6*inch)
+        
+        cache_key = None
+        if self.code_cache:
+            cache_key = CodeCache.make_key('barcode', data, symbology=barcode_type, format=output_format)
+            cached = self.code_cache.get(cache_key)
+            if cached is not None:
+                return BytesIO(cached)
+        
+        import barcode
+        from barcode.writer import ImageWriter, SVGWriter
+        
+        with timer('barcode_encode_seconds', format=output_format):
+            barcode_class = barcode.get_barcode_class(barcode_type)
+            writer = SVGWriter() if output_format == 'svg' else ImageWriter()
+            barcode_instance = barcode_class(data, writer=writer)
+            
+            buffer = BytesIO()
+            barcode_instance.write(buffer)
+            buffer.seek(0)
+        
+        if cache_key:
+            self.code_cache.put(cache_key, buffer.getvalue())
+        return buffer
+    
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Report code cache hit/miss counters and flush the cache index to disk.
+        
+        Returns:
+            Dict[str, float]: Cache counters, or an empty dict when caching is disabled
+        """
+        if not self.code_cache:
+            return {}
+        
+        self.code_cache.flush()
+        return self.code_cache.stats()
+    
+    def _save_code_image(self, code: Union[BytesIO, Drawing], directory: str, filename: str) -> str:
+        """Write a rendered code (image buffer, or drawing as PDF) to disk and return its path."""
+        filepath = os.path.join(directory, filename)
+        if isinstance(code, BytesIO):
+            with open(filepath, 'wb') as f:
+                f.write(code.getvalue())
+        else:
+            from reportlab.graphics import renderPDF
+            renderPDF.drawToFile(code, filepath)
+        return filepath
+    
+    def save_registration_codes(self, registration_id: str, codes: Dict) -> Dict[str, str]:
+        """
+        Write in-memory registration codes to the QR code and barcode directories.
+        
+        Args:
+            registration_id (str): Registration the codes belong to (used in the filenames)
+            codes (Dict): Rendered codes from render_registration_codes
+            
+        Returns:
+            Dict[str, str]: Paths of the saved 'qr_code' and 'barcode' files
+        """
+        return {
+            'qr_code': self._save_code_image(codes['qr_code'], self.qr_codes_dir,
+                                             f"registration_qr_{registration_id}.{codes['extension']}"),
+            'barcode': self._save_code_image(codes['barcode'], self.barcodes_dir,
+                                             f"registration_barcode_{registration_id}.{codes['extension']}")
+        }
+    
+    def generate_qr_code(self, data: str, filename: str = None, size: int = 10,
+                         output_format: str = 'png') -> str:
         """
         Generate a QR code for the given data.
         
@@ -104,36 +608,25 @@ class EnhancedExjamRegistrationModule:
             data (str): Data to encode in QR code
             filename (str): Optional filename for the QR code image
             size (int): Size of the QR code
+            output_format (str): 'png', 'svg', or 'drawing' (saved as a vector PDF)
             
         Returns:
             str: Path to the generated QR code image
         """
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=4,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
+        code = self.render_qr_code(data, size, output_format=output_format)
         
         # Generate filename if not provided
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"qr_code_{timestamp}.png"
+            filename = f"qr_code_{timestamp}.{CODE_FILE_EXTENSIONS[output_format]}"
         
-        # Save image
-        filepath = os.path.join(self.qr_codes_dir, filename)
-        img.save(filepath)
+        filepath = self._save_code_image(code, self.qr_codes_dir, filename)
         
-        print(f"QR code generated: {filepath}")
+        logger.info("QR code generated: %s", filepath, extra={'path': filepath})
         return filepath
     
-    def generate_barcode(self, data: str, barcode_type: str = "code128", filename: str = None) -> str:
+    def generate_barcode(self, data: str, barcode_type: str = "code128", filename: str = None,
+                         output_format: str = 'png') -> str:
         """
         Generate a barcode for the given data.
         
@@ -141,31 +634,74 @@ class EnhancedExjamRegistrationModule:
             data (str): Data to encode in barcode
             barcode_type (str): Type of barcode (code128, code39, ean13, etc.)
             filename (str): Optional filename for the barcode image
+            output_format (str): 'png', 'svg', or 'drawing' (saved as a vector PDF)
             
         Returns:
             str: Path to the generated barcode image
         """
         try:
-            # Create barcode
-            barcode_class = barcode.get_barcode_class(barcode_type)
-            barcode_instance = barcode_class(data, writer=ImageWriter())
+            code = self.render_barcode(data, barcode_type, output_format)
             
             # Generate filename if not provided
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"barcode_{barcode_type}_{timestamp}.png"
+                filename = f"barcode_{barcode_type}_{timestamp}.{CODE_FILE_EXTENSIONS[output_format]}"
             
-            # Save image
-            filepath = os.path.join(self.barcodes_dir, filename)
-            barcode_instance.save(filepath)
+            filepath = self._save_code_image(code, self.barcodes_dir, filename)
             
-            print(f"Barcode generated: {filepath}")
+            logger.info("Barcode generated: %s", filepath, extra={'path': filepath})
             return filepath
             
         except Exception as e:
-            print(f"Error generating barcode: {e}")
+            logger.error("Error generating barcode: %s", e, extra={'barcode_type': barcode_type})
             return None
     
+    def payload_codec(self) -> PayloadCodec:
+        """Return the compact payload codec, loading (or creating) the signing key on first use."""
+        if self._payload_codec is None:
+            self._payload_codec = PayloadCodec(load_or_create_key(self.payload_key_file))
+        return self._payload_codec
+    
+    def _registration_qr_data(self, registration_id: str, form_url: str = None) -> str:
+        """
+        Build the QR payload carried by a participant's registration code.
+        
+        The compact payload holds only the registration ID, event code and
+        signature; the event details and form URL are known to the scanner.
+        """
+        if self.qr_payload_format == 'compact':
+            return self.payload_codec().encode(registration_id, self.event_code)
+        
+        qr_data = {
+            "registration_id": registration_id,
+            "event": self.event['event'],
+            "date": self.event['date'],
+            "venue": self.event['venue'],
+            "form_url": form_url
+        }
+        return json.dumps(qr_data, indent=2)
+    
+    def render_registration_codes(self, registration_id: str, form_url: str = None,
+                                  output_format: str = None) -> Dict:
+        """
+        Render both QR code and barcode for a registration in memory.
+        
+        Args:
+            registration_id (str): Unique registration identifier
+            form_url (str): Google Form URL
+            output_format (str): 'png', 'svg' or 'drawing' (defaults to the module's code_format)
+            
+        Returns:
+            Dict: Rendered codes keyed by 'qr_code' and 'barcode', plus their file 'extension'
+        """
+        output_format = output_format or self.code_format
+        return {
+            'qr_code': self.render_qr_code(self._registration_qr_data(registration_id, form_url),
+                                           output_format=output_format),
+            'barcode': self.render_barcode(registration_id, "code128", output_format),
+            'extension': CODE_FILE_EXTENSIONS[output_format]
+        }
+    
     def generate_registration_codes(self, registration_id: str, form_url: str = None) -> Dict[str, str]:
         """
         Generate both QR code and barcode for a registration.
@@ -180,17 +716,9 @@ class EnhancedExjamRegistrationModule:
         codes = {}
         
         # Generate QR code with registration data
-        qr_data = {
-            "registration_id": registration_id,
-            "event": "ExJAM PG Conference - Maiden Flight",
-            "date": "Nov 28-30, 2025",
-            "venue": "NAF Conference Centre, FCT, ABUJA",
-            "form_url": form_url
-        }
-        
         qr_filename = f"registration_qr_{registration_id}.png"
         codes['qr_code'] = self.generate_qr_code(
-            json.dumps(qr_data, indent=2),
+            self._registration_qr_data(registration_id, form_url),
             qr_filename
         )
         
@@ -491,7 +1019,8 @@ class EnhancedExjamRegistrationModule:
         
         # Create the form
         try:
-            created_form = self.service.forms().create(body=form).execute()
+            with timer('api_call_seconds', call='forms.create'):
+                created_form = self.service.forms().create(body=form).execute()
             self.form_id = created_form['formId']
             form_url = f"https://docs.google.com/forms/d/{self.form_id}/viewform"
             
@@ -509,6 +1038,8 @@ class EnhancedExjamRegistrationModule:
         """
         Generate QR codes for different event purposes.
         
+        The event details come from the module's event code (see EVENT_CODES).
+        
         Args:
             form_id (str): Google Form ID
             
@@ -532,11 +1063,13 @@ class EnhancedExjamRegistrationModule:
             "pg_conference_registration.png"
         )
         
+        event = self.event
+        theme = f"Theme: {event['theme']}\n" if event['theme'] else ""
         qr_codes['event_info'] = self.generate_qr_code(
-            "ExJAM PG Conference - Maiden Flight\n"
-            "Date: Nov 28-30, 2025\n"
-            "Venue: NAF Conference Centre, FCT, ABUJA\n"
-            "Theme: Strive to Excel\n"
+            f"{event['event']}\n"
+            f"Date: {event['date']}\n"
+            f"Venue: {event['venue']}\n"
+            f"{theme}"
             f"Register at: {form_url}",
             "event_info.png"
         )
@@ -544,18 +1077,16 @@ class EnhancedExjamRegistrationModule:
         qr_codes['contact_info'] = self.generate_qr_code(
             "ExJAM Association\n"
             "Contact: E-signed DM OBADIAH PRO National\n"
-            "Event: PG Conference - Maiden Flight\n"
-            "Date: Nov 28-30, 2025\n"
+            f"Event: {event['event']}\n"
+            f"Date: {event['date']}\n"
             f"Registration: {form_url}",
             "contact_info.png"
         )
         
         qr_codes['venue_info'] = self.generate_qr_code(
-            "NAF Conference Centre\n"
-            "FCT, ABUJA\n"
-            "Nigeria\n"
-            "Event: ExJAM PG Conference\n"
-            "Date: Nov 28-30, 2025",
+            f"{event['venue']}\n"
+            f"Event: {event['short_name']}\n"
+            f"Date: {event['date']}",
             "venue_info.png"
         )
         
@@ -571,148 +1102,513 @@ class EnhancedExjamRegistrationModule:
         barcodes = {}
         
         # Generate different types of barcodes
+        event = self.event
         barcodes['event_id'] = self.generate_barcode(
-            "EXJAM-PG-2025",
+            event['event_id'],
             "code128",
             "event_id_barcode.png"
         )
         
-        barcodes['venue_code'] = self.generate_barcode(
-            "NAF-CC-ABUJA",
-            "code39",
-            "venue_barcode.png"
-        )
+        if event.get('venue_code'):
+            barcodes['venue_code'] = self.generate_barcode(
+                event['venue_code'],
+                "code39",
+                "venue_barcode.png"
+            )
         
-        barcodes['date_code'] = self.generate_barcode(
-            "20251128-30",
-            "code128",
-            "date_barcode.png"
-        )
+        if event.get('date_code'):
+            barcodes['date_code'] = self.generate_barcode(
+                event['date_code'],
+                "code128",
+                "date_barcode.png"
+            )
         
         return barcodes
     
-    def create_participant_badge(self, participant_data: Dict, output_filename: str = None) -> str:
+    def create_participant_badge(self, participant_data: Dict, output_filename: str = None,
+                                 codes: Dict = None) -> str:
         """
         Create a participant badge with QR code and barcode.
         
+        The codes are embedded straight from memory; when they are not passed
+        in they are rendered with ``render_registration_codes``. With the
+        canvas renderer the badge is drawn from a layout computed once per
+        module (see ``badge_template``) instead of laying out flowables.
+        
         Args:
             participant_data (Dict): Participant information
             output_filename (str): Output PDF filename
+            codes (Dict): Optional pre-rendered codes from render_registration_codes
             
         Returns:
             str: Path to the generated badge PDF
         """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table
+        
         if not output_filename:
             registration_id = participant_data.get('registration_id', 'UNKNOWN')
             output_filename = f"badge_{registration_id}.pdf"
         
         filepath = os.path.join(self.badges_dir, output_filename)
         
+        if self.badge_renderer == 'canvas':
+            from reportlab.pdfgen import canvas
+            
+            if codes is None and participant_data.get('registration_id'):
+                codes = self.render_registration_codes(participant_data['registration_id'])
+            
+            with timer('pdf_build_seconds', document='badge'):
+                pdf = canvas.Canvas(filepath, pagesize=A4)
+                self.badge_template().draw(pdf, 0, 0, participant_data, codes)
+                pdf.showPage()
+                pdf.save()
+            
+            logger.info("Participant badge created: %s", filepath,
+                        extra={'path': filepath, 'registration_id': participant_data.get('registration_id')})
+            return filepath
+        
         # Create PDF badge
         doc = SimpleDocTemplate(filepath, pagesize=A4)
         story = []
-        styles = getSampleStyleSheet()
         
         # Add title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=1  # Center alignment
-        )
-        title = Paragraph("ExJAM PG Conference - Maiden Flight", title_style)
+        title = Paragraph(self.event['event'], _get_badge_title_style())
         story.append(title)
         story.append(Spacer(1, 20))
         
         # Add participant information
-        info_data = [
-            ['Name:', participant_data.get('full_name', 'N/A')],
-            ['Registration ID:', participant_data.get('registration_id', 'N/A')],
-            ['Graduation Year:', participant_data.get('graduation_year', 'N/A')],
-            ['Organization:', participant_data.get('organization', 'N/A')],
-            ['Location:', participant_data.get('current_location', 'N/A')],
-            ['Email:', participant_data.get('email', 'N/A')],
-            ['Phone:', participant_data.get('phone', 'N/A')]
-        ]
-        
-        info_table = Table(info_data, colWidths=[2*inch, 4*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('BACKGROUND', (0, 0), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        info_style, event_style = _get_badge_table_styles(12)
+        info_table = Table(self._badge_info_rows(participant_data), colWidths=[2*inch, 4*inch])
+        info_table.setStyle(info_style)
         
         story.append(info_table)
         story.append(Spacer(1, 30))
         
         # Add event details
-        event_data = [
-            ['Event:', 'ExJAM President General\'s Conference'],
-            ['Theme:', 'Maiden Flight'],
-            ['Date:', 'November 28-30, 2025'],
-            ['Venue:', 'NAF Conference Centre, FCT, ABUJA'],
-            ['Registration ID:', participant_data.get('registration_id', 'N/A')]
-        ]
-        
-        event_table = Table(event_data, colWidths=[2*inch, 4*inch])
-        event_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightgreen),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        event_table = Table(self._badge_event_rows(participant_data), colWidths=[2*inch, 4*inch])
+        event_table.setStyle(event_style)
         
         story.append(event_table)
         
+        # Add registration QR code and barcode
+        if codes is None and participant_data.get('registration_id'):
+            codes = self.render_registration_codes(participant_data['registration_id'])
+        
+        if codes:
+            codes_table = Table([[
+                _fit_code(codes['qr_code'], 2*inch, 2*inch),
+                _fit_code(codes['barcode'], 3.8*inch, 1.8*inch)
+            ]], colWidths=[2*inch, 4*inch])
+            codes_table.setStyle(_get_badge_codes_style())
+            story.append(Spacer(1, 20))
+            story.append(codes_table)
+        
         # Build PDF
-        doc.build(story)
+        with timer('pdf_build_seconds', document='badge'):
+            doc.build(story)
         
-        print(f"Participant badge created: {filepath}")
+        logger.info("Participant badge created: %s", filepath,
+                    extra={'path': filepath, 'registration_id': participant_data.get('registration_id')})
         return filepath
     
-    def generate_bulk_badges(self, participants_data: List[Dict]) -> List[str]:
+    def _badge_info_rows(self, participant_data: Dict) -> List[List[str]]:
+        """Build the participant information rows shown on a badge."""
+        return [[label, participant_data.get(field, 'N/A')] for label, field in BADGE_INFO_FIELDS]
+    
+    def _badge_event_rows(self, participant_data: Dict) -> List[List[str]]:
+        """Build the event detail rows shown on a badge."""
+        return [[label, participant_data.get(field, 'N/A') if field else value]
+                for label, value, field in self._badge_event_template_rows()]
+    
+    def _badge_event_template_rows(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Return the event rows as (label, value, participant field) for badge templates."""
+        rows = [('Event:', self.event['name'], None)]
+        if self.event['theme']:
+            rows.append(('Theme:', self.event['theme'], None))
+        return rows + [
+            ('Date:', self.event['full_date'], None),
+            ('Venue:', self.event['venue'], None),
+            ('Registration ID:', '', 'registration_id')
+        ]
+    
+    def badge_template(self, layout: str = None):
         """
-        Generate badges for multiple participants.
+        Return the canvas layout of a badge, computing it on first use.
+        
+        A full-page badge follows the platypus badge: centred title, the
+        participant and event tables and a row with the QR code and barcode.
+        A sheet badge fills one cell of a BADGE_SHEET_LAYOUTS layout, with
+        the fonts sized to fit the cell and the codes along its bottom; its
+        static parts are written once per sheet as a form XObject.
+        
+        Args:
+            layout (str): Sheet layout, e.g. '2x4' (None for a full A4 page)
+            
+        Returns:
+            BadgeTemplate: Layout shared by every badge of this module and layout
+        """
+        if layout not in self._badge_templates:
+            self._badge_templates[layout] = (self._sheet_badge_template(layout) if layout
+                                             else self._page_badge_template())
+        return self._badge_templates[layout]
+    
+    def _page_badge_template(self):
+        """Lay out a full-page badge where the platypus badge places its flowables."""
+        from badge_renderer import BadgeTemplate, TableLayout
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        
+        page_width, page_height = A4
+        # SimpleDocTemplate margins plus the frame padding
+        left = inch + 6
+        width = page_width - 2 * left
+        top = page_height - left
+        
+        # Each full-page badge is a PDF of its own, so a static form would never be reused
+        template = BadgeTemplate(page_width, page_height, static_form=False)
+        title_style = _get_badge_title_style()
+        y = top - template.add_title(self.event['event'], title_style.fontName, title_style.fontSize,
+                                     title_style.leading, left + width / 2, top, width)
+        y -= title_style.spaceAfter + 20
+        
+        info_commands, event_commands = _get_badge_table_commands(12)
+        info_table = TableLayout([(label, '', field) for label, field in BADGE_INFO_FIELDS],
+                                 [2*inch, 4*inch], info_commands)
+        y -= info_table.height
+        template.add_table(info_table, left + (width - info_table.width) / 2, y)
+        y -= 30
+        
+        event_table = TableLayout(self._badge_event_template_rows(), [2*inch, 4*inch], event_commands)
+        y -= event_table.height
+        template.add_table(event_table, left + (width - event_table.width) / 2, y)
+        y -= 20
+        
+        # The codes row is as tall as the square QR code plus the default cell padding
+        row_height = 2*inch + 6
+        row_left = left + (width - 6*inch) / 2
+        y -= row_height
+        template.add_code('qr_code', row_left, y, 2*inch, row_height, 2*inch, 2*inch)
+        template.add_code('barcode', row_left + 2*inch, y, 4*inch, row_height, 3.8*inch, 1.8*inch)
+        return template
+    
+    def _badge_sheet_geometry(self, layout: str) -> Dict:
+        """Compute the cell size, fonts and table style commands of a badge sheet layout."""
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        
+        columns, rows = BADGE_SHEET_LAYOUTS[layout]
+        page_width, page_height = A4
+        margin = 0.4 * inch
+        cell_width = (page_width - 2 * margin) / columns
+        cell_height = (page_height - 2 * margin) / rows
+        inner = 0.15 * inch
+        content_width = cell_width - 2 * inner
+        col_widths = [content_width * 0.32, content_width * 0.68]
+        title = self.event['event']
+        # The bottom quarter of each badge holds the QR code and barcode
+        codes_height = cell_height * 0.25
+        # Fit twelve table rows plus the title vertically, and the event details horizontally
+        event_rows = self._badge_event_rows({})
+        label_width = max(stringWidth(label, 'Helvetica-Bold', 1) for label, _ in event_rows)
+        value_width = max(stringWidth(value, 'Helvetica-Bold', 1) for _, value in event_rows)
+        font_size = round(max(5, min(12,
+                                     (cell_height - codes_height - 2 * inner) / 26,
+                                     (col_widths[0] - 12) / label_width,
+                                     (col_widths[1] - 12) / value_width)), 1)
+        title_size = min(font_size * 1.5, content_width / stringWidth(title, 'Helvetica-Bold', 1))
+        info_commands, event_commands = _get_badge_table_commands(font_size)
+        
+        return {
+            'columns': columns, 'rows': rows, 'page_height': page_height, 'margin': margin,
+            'cell_width': cell_width, 'cell_height': cell_height, 'inner': inner,
+            'content_width': content_width, 'col_widths': col_widths, 'title': title,
+            'codes_height': codes_height, 'font_size': font_size, 'title_size': title_size,
+            'info_commands': info_commands, 'event_commands': event_commands
+        }
+    
+    def _sheet_badge_template(self, layout: str):
+        """Lay out one badge cell of a sheet layout where the platypus sheet draws it."""
+        from badge_renderer import BadgeTemplate, TableLayout
+        
+        geometry = self._badge_sheet_geometry(layout)
+        cell_width, cell_height = geometry['cell_width'], geometry['cell_height']
+        inner, content_width = geometry['inner'], geometry['content_width']
+        title_size, col_widths = geometry['title_size'], geometry['col_widths']
+        
+        template = BadgeTemplate(cell_width, cell_height)
+        # The title size is chosen to fit the cell, so it is never wrapped
+        template.add_title(geometry['title'], 'Helvetica-Bold', title_size, title_size, cell_width / 2,
+                           cell_height - inner)
+        y = cell_height - inner - title_size * 1.6
+        
+        info_table = TableLayout([(label, '', field) for label, field in BADGE_INFO_FIELDS], col_widths,
+                                 geometry['info_commands'])
+        y -= info_table.height
+        template.add_table(info_table, inner, y)
+        
+        event_table = TableLayout(self._badge_event_template_rows(), col_widths, geometry['event_commands'])
+        y -= geometry['font_size'] + event_table.height
+        template.add_table(event_table, inner, y)
+        
+        code_box = geometry['codes_height'] - inner
+        template.add_code('qr_code', inner, inner, code_box, code_box, halign='LEFT', valign='BOTTOM')
+        template.add_code('barcode', 2 * inner + code_box, inner, content_width - code_box - inner, code_box,
+                          halign='RIGHT', valign='BOTTOM')
+        return template
+    
+    def create_badge_sheet(self, participants_data: List[Dict], output_filename: str = "badge_sheet.pdf",
+                           layout: str = "2x2", save_code_images: bool = False) -> str:
+        """
+        Create a single print-ready PDF with several participant badges per A4 page.
+        
+        Badges are drawn straight onto the page canvas one page at a time, so
+        the table styles and page geometry are set up once for the whole run.
+        Each badge carries its QR code and barcode, rendered in memory. A
+        participant whose badge cannot be drawn is skipped and recorded in
+        ``self.bulk_badge_failures``.
         
         Args:
             participants_data (List[Dict]): List of participant information
+            output_filename (str): Output PDF filename
+            layout (str): Badges per page as columns x rows (see BADGE_SHEET_LAYOUTS)
+            save_code_images (bool): Also write the QR code and barcode images to disk
             
         Returns:
-            List[str]: List of generated badge file paths
+            str: Path to the generated badge sheet PDF
         """
-        badge_files = []
+        if layout not in BADGE_SHEET_LAYOUTS:
+            raise ValueError(f"Unknown badge layout '{layout}'. "
+                             f"Choose from: {', '.join(BADGE_SHEET_LAYOUTS)}")
+        
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.pdfgen import canvas
+        from reportlab.platypus import Table
+        
+        filepath = os.path.join(self.badges_dir, output_filename)
+        
+        # Page geometry and styles are computed once for every badge on the sheet
+        geometry = self._badge_sheet_geometry(layout)
+        columns, margin, page_height = geometry['columns'], geometry['margin'], geometry['page_height']
+        cell_width, cell_height = geometry['cell_width'], geometry['cell_height']
+        inner, content_width = geometry['inner'], geometry['content_width']
+        font_size, title_size, title = geometry['font_size'], geometry['title_size'], geometry['title']
+        badges_per_page = columns * geometry['rows']
+        template = self.badge_template(layout) if self.badge_renderer == 'canvas' else None
+        if template is None:
+            info_style, event_style = _get_badge_table_styles(font_size)
+        
+        pdf = canvas.Canvas(filepath, pagesize=A4, pageCompression=1)
+        self.bulk_badge_failures = []
+        slot = 0
+        
+        for index, participant in enumerate(participants_data):
+            try:
+                if template is None:
+                    info_table = Table(self._badge_info_rows(participant), colWidths=geometry['col_widths'])
+                    info_table.setStyle(info_style)
+                    event_table = Table(self._badge_event_rows(participant), colWidths=geometry['col_widths'])
+                    event_table.setStyle(event_style)
+                    _, info_height = info_table.wrapOn(pdf, cell_width, cell_height)
+                    _, event_height = event_table.wrapOn(pdf, cell_width, cell_height)
+                
+                registration_id = participant.get('registration_id')
+                codes = self.render_registration_codes(registration_id) if registration_id else None
+                if codes and save_code_images:
+                    self.save_registration_codes(registration_id, codes)
+            except Exception as e:
+                self.bulk_badge_failures.append({
+                    'index': index,
+                    'registration_id': participant.get('registration_id'),
+                    'full_name': participant.get('full_name', 'N/A'),
+                    'error': f"{type(e).__name__}: {e}"
+                })
+                continue
+            
+            if slot and slot % badges_per_page == 0:
+                pdf.showPage()
+            
+            position = slot % badges_per_page
+            x = margin + (position % columns) * cell_width
+            top = page_height - margin - (position // columns) * cell_height
+            
+            # Cut guide around the badge
+            pdf.setStrokeColor(colors.lightgrey)
+            pdf.rect(x, top - cell_height, cell_width, cell_height)
+            
+            if template is not None:
+                template.draw(pdf, x, top - cell_height, participant, codes)
+                slot += 1
+                continue
+            
+            pdf.setFont('Helvetica-Bold', title_size)
+            pdf.setFillColor(colors.black)
+            y = top - inner - title_size
+            pdf.drawCentredString(x + cell_width / 2, y, title)
+            
+            y -= title_size * 0.6 + info_height
+            info_table.drawOn(pdf, x + inner, y)
+            y -= font_size + event_height
+            event_table.drawOn(pdf, x + inner, y)
+            
+            if codes:
+                bottom = top - cell_height + inner
+                code_box = geometry['codes_height'] - inner
+                qr_code = _fit_code(codes['qr_code'], code_box, code_box)
+                qr_width, _ = qr_code.wrapOn(pdf, code_box, code_box)
+                qr_code.drawOn(pdf, x + inner, bottom)
+                barcode_box = content_width - qr_width - inner
+                barcode_flowable = _fit_code(codes['barcode'], barcode_box, code_box)
+                barcode_width, _ = barcode_flowable.wrapOn(pdf, barcode_box, code_box)
+                barcode_flowable.drawOn(pdf, x + cell_width - inner - barcode_width, bottom)
+            slot += 1
+        
+        with timer('pdf_build_seconds', document='badge_sheet'):
+            pdf.save()
+        
+        logger.info("Badge sheet created: %s (%d badges, layout %s)", filepath, slot, layout,
+                    extra={'path': filepath, 'badges': slot, 'layout': layout})
+        if self.bulk_badge_failures:
+            logger.warning("Skipped %d badges on %s", len(self.bulk_badge_failures), filepath,
+                           extra={'path': filepath, 'failures': len(self.bulk_badge_failures)})
+            for failure in self.bulk_badge_failures:
+                logger.warning("Skipped badge [%d] %s (%s): %s", failure['index'], failure['registration_id'],
+                               failure['full_name'], failure['error'], extra=failure)
         
-        for participant in participants_data:
-            # Generate registration codes for this participant
-            registration_id = participant.get('registration_id', self.generate_unique_id())
+        return filepath
+    
+    def generate_bulk_badges(self, participants_data: List[Dict], workers: int = 1,
+                             chunk_size: int = 25, layout: str = None,
+                             save_code_images: bool = False, sheet_filename: str = "badge_sheet.pdf") -> List[str]:
+        """
+        Generate badges for multiple participants.
+        
+        With more than one worker the participants are split into chunks and
+        rendered across a process pool. Results are collected in input order,
+        and a failing participant does not stop the run; failures are reported
+        at the end and kept in ``self.bulk_badge_failures``.
+        
+        When a sheet layout is given, all badges are written into a single
+        multi-badge PDF via ``create_badge_sheet`` instead of one file each.
+        QR codes and barcodes are rendered in memory and embedded in the
+        badges; the image files are only written when requested. Participants
+        without a registration ID get a newly allocated one.
+        
+        Args:
+            participants_data (List[Dict]): List of participant information
+            workers (int): Number of worker processes (None uses all CPUs, 1 runs in-process)
+            chunk_size (int): Number of participants handed to a worker at a time
+            layout (str): Optional badge sheet layout, e.g. '2x2' or '2x4'
+            save_code_images (bool): Also write the QR code and barcode images to disk
+            sheet_filename (str): Output PDF filename when a sheet layout is given
+            
+        Returns:
+            List[str]: List of generated badge file paths, in input order
+        """
+        # Assign registration IDs up front so every worker sees the same IDs. They are only set on
+        # the participant dicts: callers badging rows of a file must record them (see save_assigned_ids)
+        unassigned = [participant for participant in participants_data if not participant.get('registration_id')]
+        for participant, registration_id in zip(unassigned, self.allocate_ids(len(unassigned))):
             participant['registration_id'] = registration_id
+        
+        if layout:
+            return [self.create_badge_sheet(participants_data, sheet_filename, layout=layout,
+                                            save_code_images=save_code_images)]
+        
+        total = len(participants_data)
+        workers = workers or os.cpu_count() or 1
+        chunk_size = max(1, chunk_size)
+        results = []
+        worker_hits = worker_misses = 0
+        
+        if workers <= 1 or total <= 1:
+            for index, participant in enumerate(participants_data):
+                try:
+                    results.append((index, _render_badge(self, participant, save_code_images), None))
+                except Exception as e:
+                    results.append((index, None, f"{type(e).__name__}: {e}"))
+                if (index + 1) % chunk_size == 0 or index + 1 == total:
+                    logger.info("Badge progress: %d/%d", index + 1, total, extra={'done': index + 1, 'total': total})
+        else:
+            indexed = list(enumerate(participants_data))
+            chunks = [indexed[i:i + chunk_size] for i in range(0, total, chunk_size)]
             
-            # Generate QR and barcode
-            codes = self.generate_registration_codes(registration_id)
+            # Create the signing key before the workers start so they all load the same one
+            if self.qr_payload_format == 'compact':
+                self.payload_codec()
             
-            # Create badge
-            badge_file = self.create_participant_badge(participant)
-            badge_files.append(badge_file)
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)),
+                                     initializer=_init_badge_worker,
+                                     initargs=(self.cache_dir, self.cache_size, self.code_format,
+                                               self.qr_payload_format, self.payload_key_file,
+                                               self.event_code, EVENT_CODES[self.event_code],
+                                               self.badge_renderer)) as executor:
+                rate_limit = installed_rate_limit()
+                # executor.map yields chunk results in submission order
+                for chunk_results, (hits, misses), metrics, suppressed in executor.map(
+                        _render_badge_chunk, chunks, repeat(save_code_images)):
+                    results.extend(chunk_results)
+                    worker_hits += hits
+                    worker_misses += misses
+                    METRICS.merge(metrics)
+                    if rate_limit:
+                        rate_limit.merge(suppressed)
+                    logger.info("Badge progress: %d/%d", len(results), total,
+                                extra={'done': len(results), 'total': total})
+        
+        badge_files = []
+        self.bulk_badge_failures = []
+        
+        for index, badge_file, error in results:
+            if error is None:
+                badge_files.append(badge_file)
+            else:
+                participant = participants_data[index]
+                self.bulk_badge_failures.append({
+                    'index': index,
+                    'registration_id': participant.get('registration_id'),
+                    'full_name': participant.get('full_name', 'N/A'),
+                    'error': error
+                })
+        
+        count('badges_total', len(badge_files))
+        count('badge_failures_total', len(self.bulk_badge_failures))
+        logger.info("Generated %d participant badges", len(badge_files), extra={'badges': len(badge_files)})
+        
+        if self.code_cache:
+            stats = self.cache_stats()
+            hits, misses = stats['hits'] + worker_hits, stats['misses'] + worker_misses
+            logger.info("Code cache: %d hits, %d misses", hits, misses, extra={'hits': hits, 'misses': misses})
+        
+        if self.bulk_badge_failures:
+            logger.warning("Failed to generate %d badges", len(self.bulk_badge_failures),
+                           extra={'failures': len(self.bulk_badge_failures)})
+            for failure in self.bulk_badge_failures:
+                logger.warning("Failed badge [%d] %s (%s): %s", failure['index'], failure['registration_id'],
+                               failure['full_name'], failure['error'], extra=failure)
         
-        print(f"Generated {len(badge_files)} participant badges")
         return badge_files
     
-    def export_responses_to_csv(self, form_id: str = None, output_file: str = "registration_responses.csv") -> str:
+    def export_responses_to_csv(self, form_id: str = None, output_file: str = "registration_responses.csv",
+                                incremental: bool = False, page_size: int = 5000,
+                                schema_cache_dir: str = "form_schema_cache") -> str:
         """
         Export form responses to CSV file.
         
+        Responses are fetched page by page and streamed to the CSV as they
+        arrive. With ``incremental=True`` only responses submitted since the
+        previous export (tracked in a watermark file next to the CSV) are
+        fetched and appended.
+        
         Args:
             form_id (str): Google Form ID
             output_file (str): Output CSV filename
+            incremental (bool): Append only responses newer than the last export
+            page_size (int): Number of responses requested per page
+            schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
             
         Returns:
             str: Path to the exported CSV file
@@ -729,52 +1625,18 @@ class EnhancedExjamRegistrationModule:
             return None
         
         try:
-            # Get form responses
-            responses = self.service.forms().responses().list(formId=form_id).execute()
+            exporter = FormResponseExporter(self.service, page_size, schema_cache_dir)
+            total = exporter.export_to_csv(form_id, output_file, incremental)
             
-            if not responses.get('responses'):
+            if not total:
+                if incremental and os.path.exists(output_file):
+                    print("No new responses since the last export.")
+                    return output_file
                 print("No responses found for this form.")
                 return None
             
-            # Get form structure to map question IDs to questions
-            form = self.service.forms().get(formId=form_id).execute()
-            question_map = {}
-            
-            for item in form.get('items', []):
-                if 'question' in item:
-                    question_id = item['itemId']
-                    question_text = item['question'].get('textQuestion', {}).get('question', '')
-                    question_map[question_id] = question_text
-            
-            # Process responses
-            processed_responses = []
-            
-            for response in responses['responses']:
-                response_data = {
-                    'response_id': response['responseId'],
-                    'created_time': response['createdTime'],
-                    'last_submitted_time': response['lastSubmittedTime']
-                }
-                
-                # Extract answers
-                for answer in response.get('answers', {}).values():
-                    question_id = answer['questionId']
-                    question_text = question_map.get(question_id, question_id)
-                    
-                    if 'textAnswers' in answer:
-                        response_data[question_text] = answer['textAnswers']['answers'][0]['value']
-                    elif 'choiceAnswers' in answer:
-                        choices = [choice['value'] for choice in answer['choiceAnswers']['answers']]
-                        response_data[question_text] = ', '.join(choices)
-                
-                processed_responses.append(response_data)
-            
-            # Convert to DataFrame and save
-            df = pd.DataFrame(processed_responses)
-            df.to_csv(output_file, index=False)
-            
             print(f"Responses exported to: {output_file}")
-            print(f"Total responses: {len(processed_responses)}")
+            print(f"Total responses: {total}")
             
             return output_file
             
@@ -782,89 +1644,73 @@ class EnhancedExjamRegistrationModule:
             print(f"Error exporting responses: {e}")
             return None
     
+    def export_forms_to_csv(self, form_ids: List[str], output_file: str = "registration_responses.csv",
+                            incremental: bool = False, page_size: int = 5000,
+                            schema_cache_dir: str = "form_schema_cache", concurrency: int = DEFAULT_CONCURRENCY,
+                            base_url: str = FORMS_API_URL) -> Dict[str, str]:
+        """
+        Export the responses of several forms (e.g. one per event) concurrently.
+        
+        Forms are fetched with the asynchronous client, which shares one
+        connection pool, retries rate-limited and failed requests with
+        backoff, and stays within the Forms API quotas. Each form is written
+        to its own CSV, named after ``output_file`` and the form ID.
+        
+        Args:
+            form_ids (List[str]): Google Form IDs
+            output_file (str): Output CSV filename, used as the pattern for the per-form files
+            incremental (bool): Append only responses newer than each form's last export
+            page_size (int): Number of responses requested per page
+            schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
+            concurrency (int): Maximum API requests in flight
+            base_url (str): Forms API root (e.g. a local stub server)
+            
+        Returns:
+            Dict[str, str]: Exported CSV path per form ID, for forms that exported successfully
+        """
+        if not self.credentials and base_url == FORMS_API_URL:
+            print("Google service not initialized. Cannot export responses.")
+            return {}
+        
+        stem, extension = os.path.splitext(output_file)
+        exports = [(form_id, f"{stem}_{form_id}{extension or '.csv'}") for form_id in form_ids]
+        
+        try:
+            results = asyncio.run(export_forms(exports, self.credentials, incremental, page_size,
+                                               schema_cache_dir, base_url=base_url, concurrency=concurrency))
+        except Exception as e:
+            print(f"Error exporting responses: {e}")
+            return {}
+        
+        exported = {}
+        for form_id, csv_file in exports:
+            result = results[csv_file]
+            if isinstance(result, Exception):
+                print(f"Error exporting form {form_id}: {result}")
+            elif result or (incremental and os.path.exists(csv_file)):
+                print(f"Form {form_id}: {result} responses exported to {csv_file}")
+                exported[form_id] = csv_file
+            else:
+                print(f"Form {form_id}: no responses found.")
+        
+        return exported
+    
     def generate_comprehensive_report(self, csv_file: str, output_file: str = "comprehensive_registration_report.md") -> str:
         """
         Generate a comprehensive registration report with QR codes and barcodes.
         
+        The report covers the module's event; from a dataset partitioned by
+        event only that event's registrations are read.
+        
         Args:
-            csv_file (str): Path to CSV file with registration data
+            csv_file (str): Path to registration data (CSV, Parquet, Feather or a dataset directory)
             output_file (str): Output report filename
             
         Returns:
             str: Path to the generated report
         """
         try:
-            df = pd.read_csv(csv_file)
-            
-            report = f"""# ExJAM PG Conference Comprehensive Registration Report
-
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Executive Summary
-- **Total Registrations**: {len(df)}
-- **Registration Period**: {df['created_time'].min()} to {df['created_time'].max()}
-- **Event**: ExJAM President General's Conference - Maiden Flight
-- **Date**: November 28-30, 2025
-- **Venue**: NAF Conference Centre, FCT, ABUJA
-
-## Registration Statistics
-
-### Graduation Year Distribution
-{df['Graduation Year from Air Force Military School Jos'].value_counts().to_markdown()}
-
-### Geographic Distribution
-{df['Current Location (City, State/Province, Country)'].value_counts().head(10).to_markdown()}
-
-### Professional Distribution
-{df['Current Occupation/Profession'].value_counts().head(10).to_markdown()}
-
-### Accommodation Needs
-{df['Do you need accommodation assistance?'].value_counts().to_markdown()}
-
-### Transportation Needs
-{df['Do you need transportation assistance from the airport?'].value_counts().to_markdown()}
-
-### Session Interests
-{df['Which conference sessions are you most interested in? (Select all that apply)'].value_counts().to_markdown()}
-
-### Speaking Interest
-{df['Would you be interested in speaking at the conference?'].value_counts().to_markdown()}
-
-## Dietary Requirements
-{df['Dietary Restrictions (for catering purposes)'].value_counts().to_markdown()}
-
-## Special Needs
-Special needs and accessibility requirements:
-{df['Special Needs or Accessibility Requirements'].dropna().to_list()}
-
-## QR Codes and Barcodes Generated
-- Registration QR codes: {len(df)} individual codes
-- Event information QR codes: 4 types
-- Barcodes: 3 types (Event ID, Venue, Date)
-- Participant badges: {len(df)} badges
-
-## Event Logistics Recommendations
-Based on the registration data:
-
-1. **Catering**: Plan for {df['Dietary Restrictions (for catering purposes)'].value_counts().get('None', 0)} standard meals and accommodate special dietary requirements
-2. **Accommodation**: {df['Do you need accommodation assistance?'].value_counts().get('Yes, I need accommodation', 0)} participants need accommodation assistance
-3. **Transportation**: {df['Do you need transportation assistance from the airport?'].value_counts().get('Yes, I need airport pickup', 0)} participants need airport pickup
-4. **Sessions**: Focus on the most popular session topics based on participant interests
-5. **Badges**: {len(df)} participant badges need to be printed with QR codes and barcodes
-
-## Technical Implementation
-- Google Forms integration for registration
-- QR code generation for each participant
-- Barcode generation for event tracking
-- PDF badge generation with participant information
-- Automated report generation
-
----
-*Report generated automatically from registration data*
-"""
-            
-            with open(output_file, 'w') as f:
-                f.write(report)
+            generate_registration_report(csv_file, output_file, COMPREHENSIVE_REPORT_TEMPLATE, self.event_code)
             
             print(f"Comprehensive report generated: {output_file}")
             return output_file
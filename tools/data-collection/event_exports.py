@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Multi-Event Registration Exports
+
+This module exports the registration forms of several events (conferences, chapter meetups)
+concurrently and merges them into one Parquet dataset partitioned by event code. The dataset
+is the input to the report, badge and check-in commands, so each event is fetched once and
+every tool reads only the partitions and columns it needs.
+
+Events are described in a JSON file, one object per event:
+    [{"code": "PGC25", "form_id": "FORM_ID", "event": "...", "date": "...", "venue": "..."}]
+Any other EVENT_CODES field (name, theme, full_date, ...) may be given as well. The event
+details are saved with the dataset, so later runs need only the dataset directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from async_forms_client import export_forms
+from columnar_storage import (PARTITION_COLUMN, REGISTRATION_CATEGORICAL_COLUMNS, dataset_partitions,
+                              read_table, write_partition)
+from instrumentation import timer
+from qr_payload import EVENT_CODES, register_event
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Event details saved with a dataset (the leading underscore keeps it out of the partitions)
+DATASET_EVENTS_FILE = '_events.json'
+
+# Per-event CSV exports kept inside the dataset for incremental runs
+STAGING_DIR = '_exports'
+
+# Column names in a registration export (or participant file) for each badge field
+PARTICIPANT_FIELDS = {
+    'registration_id': ['registration_id', 'Registration ID (will be auto-generated)'],
+    'full_name': ['full_name', 'Full Name (as it appears on official documents)', 'Full Name'],
+    'graduation_year': ['graduation_year', 'Graduation Year from Air Force Military School Jos'],
+    'organization': ['organization', 'Organization/Company (if applicable)', 'Current Occupation/Profession'],
+    'current_location': ['current_location', 'Current Location (City, State/Province, Country)'],
+    'email': ['email', 'Email Address'],
+    'phone': ['phone', 'Phone Number'],
+    'response_id': ['response_id'],
+    PARTITION_COLUMN: [PARTITION_COLUMN]
+}
+
+
+def load_events(config_file: str) -> List[Dict]:
+    """
+    Load event configurations and register their details in EVENT_CODES.
+    
+    Args:
+        config_file (str): JSON list of events (or an object with an 'events' list)
+    
+    Returns:
+        List[Dict]: Event configurations, each with 'code' and 'form_id'
+    """
+    with open(config_file, 'r') as f:
+        events = json.load(f)
+    if isinstance(events, dict):
+        events = events.get('events', [])
+    
+    seen = set()
+    for event in events:
+        code = event.get('code')
+        if code in seen:
+            raise ValueError(f"Event '{code}' is configured twice in {config_file}")
+        if not event.get('form_id'):
+            raise ValueError(f"Event '{code}' in {config_file} has no form_id")
+        seen.add(code)
+        register_event(code, {key: value for key, value in event.items() if key not in ('code', 'form_id')})
+    
+    return events
+
+
+def register_dataset_events(dataset_dir: str) -> List[str]:
+    """
+    Register the event details saved with a dataset.
+    
+    Args:
+        dataset_dir (str): Dataset directory written by export_events
+    
+    Returns:
+        List[str]: Registered event codes
+    """
+    events_file = os.path.join(dataset_dir, DATASET_EVENTS_FILE)
+    if not os.path.exists(events_file):
+        return []
+    
+    with open(events_file, 'r') as f:
+        events = json.load(f)
+    for code, details in events.items():
+        register_event(code, details)
+    return list(events)
+
+
+def _save_dataset_events(dataset_dir: str, codes: Iterable[str]):
+    """Merge the details of the given events into the dataset's events file."""
+    events_file = os.path.join(dataset_dir, DATASET_EVENTS_FILE)
+    events = {}
+    if os.path.exists(events_file):
+        with open(events_file, 'r') as f:
+            events = json.load(f)
+    events.update({code: EVENT_CODES[code] for code in codes})
+    
+    temp_file = f"{events_file}.tmp"
+    with open(temp_file, 'w') as f:
+        json.dump(events, f, indent=2)
+    os.replace(temp_file, events_file)
+
+
+def export_events(events: List[Dict], dataset_dir: str, credentials=None, incremental: bool = False,
+                  page_size: int = 5000, schema_cache_dir: str = "form_schema_cache",
+                  **client_options) -> Dict[str, object]:
+    """
+    Export every event's form concurrently and write its partition of the dataset.
+    
+    Responses are streamed to a CSV per event under ``STAGING_DIR`` (where
+    the incremental watermarks live), then each event that changed has its
+    partition rewritten from that CSV, keeping the last row of a response
+    exported more than once (a staging CSV written before edited responses
+    replaced their earlier rows). A failing event does not stop the others
+    and keeps its previous partition.
+    
+    Args:
+        events (List[Dict]): Event configurations from load_events
+        dataset_dir (str): Dataset directory
+        credentials: google-auth credentials, or None for an unauthenticated stub
+        incremental (bool): Fetch only responses newer than each event's last export
+        page_size (int): Number of responses requested per page
+        schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
+        **client_options: AsyncFormsClient options (base_url, concurrency, ...)
+    
+    Returns:
+        Dict[str, object]: Registrations in each event's partition, or the exception raised
+    """
+    staging_dir = os.path.join(dataset_dir, STAGING_DIR)
+    os.makedirs(staging_dir, exist_ok=True)
+    
+    exports = [(event['form_id'], os.path.join(staging_dir, f"{event['code']}.csv")) for event in events]
+    fetched = asyncio.run(export_forms(exports, credentials, incremental, page_size, schema_cache_dir,
+                                       **client_options))
+    
+    partitions = dataset_partitions(dataset_dir)
+    results = {}
+    for event, (_, csv_file) in zip(events, exports):
+        code = event['code']
+        result = fetched[csv_file]
+        if isinstance(result, Exception) or not os.path.exists(csv_file):
+            results[code] = result
+            continue
+        
+        if result or code not in partitions:
+            with timer('event_merge_seconds', event=code):
+                df = read_table(csv_file, categorical_columns=REGISTRATION_CATEGORICAL_COLUMNS)
+                if 'response_id' in df.columns:
+                    df = df.drop_duplicates('response_id', keep='last', ignore_index=True)
+                write_partition(df, dataset_dir, code, REGISTRATION_CATEGORICAL_COLUMNS)
+            results[code] = len(df)
+        else:
+            results[code] = len(read_table(partitions[code], ['response_id']))
+    
+    _save_dataset_events(dataset_dir, [code for code, result in results.items()
+                                       if not isinstance(result, Exception)])
+    return results
+
+
+def participant_records(df: pd.DataFrame) -> List[Dict]:
+    """
+    Map registration export rows onto the participant fields used for badges.
+    
+    Args:
+        df (pd.DataFrame): Registrations (an export, a dataset or a participant table)
+    
+    Returns:
+        List[Dict]: Participant dictionaries with the PARTICIPANT_FIELDS keys present in the data
+    """
+    rows = df.astype(object).where(df.notna(), None).to_dict('records')
+    fields = {field: [name for name in names if name in df.columns] for field, names in PARTICIPANT_FIELDS.items()}
+    fields = {field: names for field, names in fields.items() if names}
+    
+    participants = []
+    for row in rows:
+        participant = {}
+        for field, names in fields.items():
+            value = next((row[name] for name in names if row[name] not in (None, '')), None)
+            if isinstance(value, float) and value.is_integer():
+                # Years read back from a CSV with gaps come out as floats
+                value = int(value)
+            if value is not None:
+                participant[field] = str(value)
+        participants.append(participant)
+    return participants
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Google Forms Response Export
+
+This module streams Google Forms responses to CSV page by page, with an optional incremental
+mode that only fetches responses submitted since the previous export. Form schemas are cached
+per revision and compiled into a fixed-column flattener that produces row tuples directly.
+"""
+
+import csv
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from instrumentation import count, timer
+
+logger = logging.getLogger(__name__)
+
+# Columns written before the question columns of every export
+BASE_COLUMNS = ['response_id', 'created_time', 'last_submitted_time']
+
+# Separator used when an answer holds several values
+ANSWER_SEPARATOR = ', '
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an RFC 3339 timestamp as returned by the Forms API."""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def build_question_map(form: Dict) -> Dict[str, str]:
+    """
+    Map question IDs to question text for a form.
+    
+    Handles both the item layout used by the registration modules
+    (``itemId`` plus ``question.textQuestion``/``question.choiceQuestion``)
+    and the Forms API layout (``questionItem.question.questionId`` plus the
+    item ``title``).
+    
+    Args:
+        form (Dict): Form resource returned by ``forms().get``
+        
+    Returns:
+        Dict[str, str]: Question text keyed by question ID, in form order
+    """
+    question_map = {}
+    
+    for item in form.get('items', []):
+        if 'questionItem' in item:
+            question_id = item['questionItem']['question'].get('questionId', item.get('itemId'))
+            question_map[question_id] = item.get('title') or question_id
+        elif 'question' in item:
+            question = item['question']
+            details = question.get('textQuestion') or question.get('choiceQuestion') or {}
+            question_map[item['itemId']] = details.get('question') or item.get('title') or item['itemId']
+    
+    return question_map
+
+
+def _answer_value(answer: Dict) -> str:
+    """
+    Return the cell value for any answer type.
+    
+    Text, choice, date/time, scale and rating answers arrive as
+    ``textAnswers``; the registration modules' forms also use
+    ``choiceAnswers``. Multiple values (checkbox questions) are joined with
+    ANSWER_SEPARATOR. File uploads are written as "name (file ID)".
+    """
+    if 'textAnswers' in answer:
+        values = answer['textAnswers'].get('answers', [])
+        if len(values) == 1:
+            return values[0].get('value', '')
+        return ANSWER_SEPARATOR.join(value.get('value', '') for value in values)
+    
+    if 'choiceAnswers' in answer:
+        return ANSWER_SEPARATOR.join(choice.get('value', '') for choice in answer['choiceAnswers'].get('answers', []))
+    
+    if 'fileUploadAnswers' in answer:
+        return ANSWER_SEPARATOR.join(f"{upload.get('fileName', '')} ({upload.get('fileId', '')})"
+                                     for upload in answer['fileUploadAnswers'].get('answers', []))
+    
+    return ''
+
+
+class CompiledFlattener:
+    def __init__(self, form: Dict, columns: List[str] = None):
+        """
+        Compile a response flattener for one form schema.
+        
+        Column positions are resolved once, so flattening a response only
+        fills a preallocated row instead of building a dict per response.
+        Quiz forms get an extra "(score)" column per question.
+        
+        Args:
+            form (Dict): Form resource returned by ``forms().get``
+            columns (List[str]): Optional fixed column order (e.g. the header of an existing export)
+        """
+        question_map = build_question_map(form)
+        is_quiz = form.get('settings', {}).get('quizSettings', {}).get('isQuiz', False)
+        
+        if columns is None:
+            titles = list(dict.fromkeys(question_map.values()))
+            columns = BASE_COLUMNS + titles + ([f"{title} (score)" for title in titles] if is_quiz else [])
+        
+        self.columns = tuple(columns)
+        position = {column: index for index, column in enumerate(self.columns)}
+        self._width = len(self.columns)
+        self._base_slots = tuple(position.get(column) for column in BASE_COLUMNS)
+        self._value_slots = {question_id: position[title]
+                             for question_id, title in question_map.items() if title in position}
+        self._score_slots = {question_id: position[f"{title} (score)"]
+                             for question_id, title in question_map.items() if f"{title} (score)" in position}
+    
+    def row(self, response: Dict) -> tuple:
+        """
+        Flatten a form response into a row tuple in column order.
+        
+        Args:
+            response (Dict): Response resource from ``responses().list``
+            
+        Returns:
+            tuple: Row for the CSV export
+        """
+        row = [''] * self._width
+        
+        response_slot, created_slot, submitted_slot = self._base_slots
+        if response_slot is not None:
+            row[response_slot] = response['responseId']
+        if created_slot is not None:
+            row[created_slot] = response['createdTime']
+        if submitted_slot is not None:
+            row[submitted_slot] = response['lastSubmittedTime']
+        
+        value_slots = self._value_slots
+        score_slots = self._score_slots
+        for answer in response.get('answers', {}).values():
+            question_id = answer['questionId']
+            slot = value_slots.get(question_id)
+            if slot is not None:
+                row[slot] = _answer_value(answer)
+            if score_slots and 'grade' in answer and question_id in score_slots:
+                row[score_slots[question_id]] = answer['grade'].get('score', 0)
+        
+        return tuple(row)
+
+
+class FormSchemaCache:
+    def __init__(self, cache_dir: str = "form_schema_cache"):
+        """
+        Initialize the form schema cache.
+        
+        Args:
+            cache_dir (str): Directory holding one cached form resource per form ID
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def get(self, service, form_id: str) -> Dict:
+        """
+        Return the form schema, refetching it only when the form's revision changed.
+        
+        A cheap ``forms().get`` limited to the ``revisionId`` field is compared
+        with the cached revision; the full form is only downloaded on a mismatch.
+        
+        Args:
+            service: Google Forms API service
+            form_id (str): Google Form ID
+            
+        Returns:
+            Dict: Form resource
+        """
+        with timer('api_call_seconds', call='forms.get_revision'):
+            revision_id = service.forms().get(formId=form_id, fields='revisionId').execute().get('revisionId')
+        
+        form = self.cached(form_id, revision_id)
+        if form is None:
+            with timer('api_call_seconds', call='forms.get'):
+                form = service.forms().get(formId=form_id).execute()
+            self.store(form_id, form, revision_id)
+        
+        return form
+    
+    def cached(self, form_id: str, revision_id: Optional[str]) -> Optional[Dict]:
+        """
+        Return the cached form if it matches the given revision.
+        
+        Args:
+            form_id (str): Google Form ID
+            revision_id (Optional[str]): Current revision of the form
+            
+        Returns:
+            Optional[Dict]: Cached form resource, or None if missing or stale
+        """
+        cache_file = os.path.join(self.cache_dir, f"{form_id}.json")
+        if revision_id and os.path.exists(cache_file):
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get('revisionId') == revision_id:
+                return cached['form']
+        return None
+    
+    def store(self, form_id: str, form: Dict, revision_id: Optional[str] = None):
+        """Cache a downloaded form resource under its revision."""
+        with open(os.path.join(self.cache_dir, f"{form_id}.json"), 'w') as f:
+            json.dump({'revisionId': form.get('revisionId', revision_id), 'form': form}, f)
+
+
+class ResponseCsvWriter:
+    def __init__(self, output_file: str, form: Dict, since: Optional[str] = None):
+        """
+        Write pages of form responses to a CSV export and track the newest submission.
+        
+        The file is only opened when the first non-empty page arrives. When
+        ``since`` is set the responses are appended in the column order of
+        the existing export. Otherwise the export is written to a temporary
+        file that replaces the output only once the last page is written, so
+        a failed export leaves the previous file untouched. Questions added
+        to the form since an incremental export's header was written get
+        new columns at the end; the export is then rewritten the same way
+        with the earlier rows left blank in those columns. A response that
+        is already in the export (edited since, or appended by a run that
+        failed before saving its watermark) replaces its earlier row when
+        the writer is closed, so every ``response_id`` appears once.
+        
+        Args:
+            output_file (str): Output CSV filename
+            form (Dict): Form resource the responses belong to
+            since (Optional[str]): Watermark of an incremental export (None writes a full export)
+        """
+        self.output_file = output_file
+        self.appending = since is not None
+        self.written = 0
+        self.newest = since
+        self._newest_time = _parse_timestamp(since) if since else None
+        self._temp_file = f"{output_file}.tmp"
+        self._file = None
+        self._writer = None
+        # Response IDs in the export, and those written more than once
+        self._exported_ids = set()
+        self._superseded = set()
+        
+        if self.appending:
+            # Keep the column order of the existing export
+            with open(output_file, 'r', newline='') as f:
+                self._existing_columns = next(csv.reader(f), [])
+            new_columns = [column for column in CompiledFlattener(form).columns
+                           if column not in self._existing_columns]
+            self.flattener = CompiledFlattener(form, self._existing_columns + new_columns)
+            self.rewrite = bool(new_columns)
+            if new_columns:
+                logger.warning("Rewriting %s with %d columns for new form questions", output_file,
+                               len(new_columns), extra={'output_file': output_file, 'new_columns': new_columns})
+        else:
+            self._existing_columns = []
+            self.flattener = CompiledFlattener(form)
+            self.rewrite = True
+        
+        columns = self.flattener.columns
+        self._id_slot = columns.index('response_id') if 'response_id' in columns else None
+        if self.appending and self._id_slot is not None:
+            with open(output_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                self._exported_ids.update(row[self._id_slot] for row in reader if len(row) > self._id_slot)
+    
+    def _open(self):
+        """Open the export for appending, or start its temporary replacement."""
+        if not self.rewrite:
+            self._file = open(self.output_file, 'a', newline='')
+            self._writer = csv.writer(self._file)
+            return
+        
+        self._file = open(self._temp_file, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.flattener.columns)
+        if self.appending:
+            # Copy the earlier rows under the merged header
+            padding = [''] * (len(self.flattener.columns) - len(self._existing_columns))
+            with open(self.output_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                self._writer.writerows(row + padding for row in reader)
+    
+    def write_page(self, page: List[Dict]) -> int:
+        """
+        Flatten and write one page of responses.
+        
+        Args:
+            page (List[Dict]): Responses on one page
+            
+        Returns:
+            int: Responses written so far
+        """
+        if not page:
+            return self.written
+        
+        if self._file is None:
+            self._open()
+        
+        flatten = self.flattener.row
+        self._writer.writerows(flatten(response) for response in page)
+        
+        if self._id_slot is not None:
+            exported_ids = self._exported_ids
+            for response in page:
+                response_id = response['responseId']
+                if response_id in exported_ids:
+                    self._superseded.add(response_id)
+                else:
+                    exported_ids.add(response_id)
+        
+        page_newest = max(page, key=lambda response: _parse_timestamp(response['lastSubmittedTime']))
+        page_newest_time = _parse_timestamp(page_newest['lastSubmittedTime'])
+        if self._newest_time is None or page_newest_time > self._newest_time:
+            self.newest, self._newest_time = page_newest['lastSubmittedTime'], page_newest_time
+        
+        self.written += len(page)
+        count('responses_exported_total', len(page))
+        logger.info("Exported %d responses...", self.written,
+                    extra={'responses': self.written, 'output_file': self.output_file})
+        return self.written
+    
+    def _drop_superseded(self, source: str, target: str):
+        """
+        Copy an export, keeping only the last row of every response written more than once.
+        
+        Args:
+            source (str): CSV file holding the earlier and the replacement rows
+            target (str): CSV file to write
+        """
+        id_slot = self._id_slot
+        superseded = self._superseded
+        
+        # First pass: find the line of each superseded response's last row
+        last_rows = {}
+        with open(source, 'r', newline='') as f:
+            for index, row in enumerate(csv.reader(f)):
+                if index and row[id_slot] in superseded:
+                    last_rows[row[id_slot]] = index
+        
+        with open(source, 'r', newline='') as f, open(target, 'w', newline='') as out:
+            writer = csv.writer(out)
+            writer.writerows(row for index, row in enumerate(csv.reader(f))
+                             if not index or row[id_slot] not in superseded or last_rows[row[id_slot]] == index)
+        
+        logger.info("Replaced the earlier rows of %d edited responses in %s", len(superseded), self.output_file,
+                    extra={'responses': len(superseded), 'output_file': self.output_file})
+    
+    def close(self, commit: bool = True):
+        """
+        Close the CSV file if it was opened.
+        
+        Args:
+            commit (bool): Move a rewritten export into place (False discards it)
+        """
+        if self._file is None:
+            return
+        
+        self._file.close()
+        self._file = None
+        if not commit:
+            if self.rewrite:
+                os.remove(self._temp_file)
+            return
+        
+        source = self._temp_file if self.rewrite else self.output_file
+        if self._superseded:
+            deduplicated = f"{self.output_file}.dedup.tmp"
+            self._drop_superseded(source, deduplicated)
+            if self.rewrite:
+                os.remove(self._temp_file)
+            source = deduplicated
+        if source != self.output_file:
+            os.replace(source, self.output_file)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, *exc_info):
+        # An export interrupted by an API error keeps the previous file and watermark
+        self.close(commit=exc_type is None)
+
+
+class FormResponseExporter:
+    def __init__(self, service, page_size: int = 5000, schema_cache_dir: str = "form_schema_cache"):
+        """
+        Initialize the response exporter.
+        
+        Args:
+            service: Google Forms API service (or any object with the same interface)
+            page_size (int): Number of responses requested per page
+            schema_cache_dir (str): Directory for cached form schemas (None disables the cache)
+        """
+        self.service = service
+        self.page_size = page_size
+        self.schema_cache = FormSchemaCache(schema_cache_dir) if schema_cache_dir else None
+    
+    def iter_response_pages(self, form_id: str, since: str = None) -> Iterator[List[Dict]]:
+        """
+        Yield pages of form responses, following ``nextPageToken`` until exhausted.
+        
+        Args:
+            form_id (str): Google Form ID
+            since (str): Optional RFC 3339 timestamp; only responses submitted after it are fetched
+            
+        Yields:
+            List[Dict]: Responses on one page
+        """
+        request = {'formId': form_id, 'pageSize': self.page_size}
+        if since:
+            request['filter'] = f"timestamp > {since}"
+        
+        while True:
+            with timer('api_call_seconds', call='forms.responses.list'):
+                result = self.service.forms().responses().list(**request).execute()
+            yield result.get('responses', [])
+            
+            page_token = result.get('nextPageToken')
+            if not page_token:
+                break
+            request['pageToken'] = page_token
+    
+    @staticmethod
+    def watermark_path(output_file: str) -> str:
+        """Return the path of the watermark file kept next to an export."""
+        return f"{output_file}.watermark.json"
+    
+    def load_watermark(self, form_id: str, output_file: str) -> Optional[str]:
+        """
+        Load the last exported submission time for a form and output file.
+        
+        Args:
+            form_id (str): Google Form ID
+            output_file (str): CSV file the responses are exported to
+            
+        Returns:
+            Optional[str]: Last exported ``lastSubmittedTime``, or None for a full export
+        """
+        watermark_file = self.watermark_path(output_file)
+        if not (os.path.exists(output_file) and os.path.exists(watermark_file)):
+            return None
+        
+        with open(watermark_file, 'r') as f:
+            watermark = json.load(f)
+        
+        if watermark.get('form_id') != form_id:
+            logger.warning("Watermark in %s belongs to another form; running a full export", watermark_file,
+                           extra={'form_id': form_id, 'watermark_form_id': watermark.get('form_id')})
+            return None
+        
+        return watermark.get('last_submitted_time')
+    
+    def save_watermark(self, form_id: str, output_file: str, last_submitted_time: str):
+        """Record the newest exported submission time next to the export."""
+        with open(self.watermark_path(output_file), 'w') as f:
+            json.dump({
+                'form_id': form_id,
+                'last_submitted_time': last_submitted_time,
+                'exported_at': datetime.now().isoformat()
+            }, f, indent=2)
+    
+    def export_to_csv(self, form_id: str, output_file: str, incremental: bool = False) -> int:
+        """
+        Stream form responses to a CSV file as pages arrive.
+        
+        In incremental mode, only responses submitted after the stored
+        watermark are fetched and appended to the existing CSV. A response
+        edited since the last export (or appended by a run that failed
+        before saving its watermark) replaces its earlier row.
+        
+        Args:
+            form_id (str): Google Form ID
+            output_file (str): Output CSV filename
+            incremental (bool): Append only responses newer than the last export
+            
+        Returns:
+            int: Number of responses written
+        """
+        since = self.load_watermark(form_id, output_file) if incremental else None
+        
+        if self.schema_cache:
+            form = self.schema_cache.get(self.service, form_id)
+        else:
+            with timer('api_call_seconds', call='forms.get'):
+                form = self.service.forms().get(formId=form_id).execute()
+        
+        with ResponseCsvWriter(output_file, form, since) as writer:
+            for page in self.iter_response_pages(form_id, since):
+                writer.write_page(page)
+        
+        if writer.written:
+            self.save_watermark(form_id, output_file, writer.newest)
+        
+        return writer.written
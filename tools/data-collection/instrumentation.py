@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Instrumentation
+
+This module records timers, counters and latency histograms around the registration and
+analysis hot paths (QR and barcode encoding, PDF builds, Google API calls, table reads and the
+analyses), exports them as JSON or Prometheus text, offers opt-in cProfile and sampling
+profiler hooks for a whole run, and configures structured, rate-limited logging for per-item
+progress messages.
+
+Recording a timing costs two ``perf_counter`` calls and a dict lookup, so the instruments stay
+on in bulk runs; set ``METRICS.enabled = False`` to turn them off.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Upper bounds in seconds of the latency histogram buckets (the last bucket is unbounded)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Prefix of the exported Prometheus metric names
+METRIC_PREFIX = 'exjam_'
+
+# File extensions written in the Prometheus text format; anything else is written as JSON
+PROMETHEUS_EXTENSIONS = ('.prom', '.txt')
+
+# Log records allowed per message in each rate-limit interval (seconds)
+LOG_BURST = 5
+LOG_INTERVAL = 10.0
+
+# Output formats accepted by configure_logging
+LOG_FORMATS = ('text', 'json')
+
+# Profilers accepted by profile
+PROFILERS = ('cprofile', 'sampling')
+
+# Seconds between stack samples of the sampling profiler
+SAMPLING_INTERVAL = 0.005
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Count observations per bucket and track their count, sum, minimum and maximum.
+        
+        Args:
+            buckets (Tuple[float, ...]): Sorted bucket upper bounds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+    
+    def observe(self, value: float):
+        """Add one observation."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None or value < self.min else self.min
+        self.max = value if self.max is None or value > self.max else self.max
+    
+    def merge(self, other: 'Histogram'):
+        """Fold another histogram with the same buckets into this one."""
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None or value < self.min else self.min
+                self.max = value if self.max is None or value > self.max else self.max
+    
+    def to_dict(self) -> Dict:
+        """Return the histogram as a JSON-serializable dict."""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else None,
+            'buckets': list(self.buckets),
+            'bucket_counts': list(self.counts)
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Histogram':
+        """Rebuild a histogram saved with ``to_dict``."""
+        histogram = cls(data['buckets'])
+        histogram.counts = list(data['bucket_counts'])
+        histogram.count = data['count']
+        histogram.total = data['sum']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
+
+
+class Metrics:
+    def __init__(self):
+        """Registry of counters and histograms keyed by metric name and labels."""
+        self.enabled = True
+        self.counters = {}
+        self.histograms = {}
+    
+    @staticmethod
+    def _key(name: str, labels: Dict) -> Tuple[str, Tuple]:
+        """Build the registry key for a metric name and its labels."""
+        return name, tuple(sorted(labels.items()))
+    
+    def count(self, name: str, value: float = 1, **labels):
+        """
+        Add to a counter.
+        
+        Args:
+            name (str): Counter name, conventionally ending in '_total'
+            value (float): Amount to add
+            **labels: Label values distinguishing series of the same counter
+        """
+        if self.enabled:
+            key = self._key(name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, **labels):
+        """
+        Record a value (usually seconds) in a histogram.
+        
+        Args:
+            name (str): Histogram name, conventionally ending in '_seconds'
+            value (float): Observed value
+            **labels: Label values distinguishing series of the same histogram
+        """
+        if self.enabled:
+            key = self._key(name, labels)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """
+        Time the enclosed block into a histogram; failures also count '<name>_errors_total'.
+        
+        Args:
+            name (str): Histogram name
+            **labels: Label values
+        """
+        if not self.enabled:
+            yield
+            return
+        
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.count(f"{name.rsplit('_seconds', 1)[0]}_errors_total", **labels)
+            raise
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def timed(self, name: str, **labels):
+        """
+        Decorator form of ``timer``.
+        
+        Args:
+            name (str): Histogram name
+            **labels: Label values
+        """
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **labels):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+    
+    def snapshot(self) -> Dict:
+        """
+        Return every metric as a JSON-serializable dict.
+        
+        Returns:
+            Dict: 'counters' and 'histograms' lists with name, labels and values
+        """
+        return {
+            'counters': [{'name': name, 'labels': dict(labels), 'value': value}
+                         for (name, labels), value in sorted(self.counters.items())],
+            'histograms': [{'name': name, 'labels': dict(labels), **histogram.to_dict()}
+                           for (name, labels), histogram in sorted(self.histograms.items())]
+        }
+    
+    def merge(self, snapshot: Dict):
+        """
+        Fold a snapshot (e.g. from a worker process) into this registry.
+        
+        Args:
+            snapshot (Dict): Result of ``snapshot``
+        """
+        for counter in snapshot.get('counters', []):
+            key = self._key(counter['name'], counter['labels'])
+            self.counters[key] = self.counters.get(key, 0) + counter['value']
+        for data in snapshot.get('histograms', []):
+            key = self._key(data['name'], data['labels'])
+            histogram = Histogram.from_dict(data)
+            if key in self.histograms:
+                self.histograms[key].merge(histogram)
+            else:
+                self.histograms[key] = histogram
+    
+    def reset(self):
+        """Remove every recorded metric."""
+        self.counters.clear()
+        self.histograms.clear()
+    
+    def summary(self, top: int = 10) -> List[Tuple[str, int, float, float]]:
+        """
+        List the timers with the most total time.
+        
+        Args:
+            top (int): Number of timers
+        
+        Returns:
+            List[Tuple[str, int, float, float]]: (name{labels}, calls, total seconds, mean seconds)
+        """
+        rows = []
+        for (name, labels), histogram in self.histograms.items():
+            label_text = ','.join(f"{key}={value}" for key, value in labels)
+            rows.append((f"{name}{{{label_text}}}" if label_text else name, histogram.count, histogram.total,
+                         histogram.total / histogram.count if histogram.count else 0.0))
+        return sorted(rows, key=lambda row: -row[2])[:top]
+    
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+        
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        typed = set()
+        
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = _metric_name(name)
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_label_text(labels)} {value}")
+        
+        for (name, labels), histogram in sorted(self.histograms.items()):
+            metric = _metric_name(name)
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            cumulative = 0
+            for bound, count in zip(list(histogram.buckets) + ['+Inf'], histogram.counts):
+                cumulative += count
+                lines.append(f"{metric}_bucket{_label_text(labels + (('le', str(bound)),))} {cumulative}")
+            lines.append(f"{metric}_sum{_label_text(labels)} {histogram.total}")
+            lines.append(f"{metric}_count{_label_text(labels)} {histogram.count}")
+        
+        return '\n'.join(lines) + '\n'
+    
+    def write(self, output_file: str) -> str:
+        """
+        Write every metric to a file, as Prometheus text for .prom/.txt files and JSON otherwise.
+        
+        Args:
+            output_file (str): Output path
+        
+        Returns:
+            str: Path to the written file
+        """
+        temp_file = f"{output_file}.tmp"
+        with open(temp_file, 'w') as f:
+            if output_file.lower().endswith(PROMETHEUS_EXTENSIONS):
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.snapshot(), f, indent=2)
+        os.replace(temp_file, output_file)
+        return output_file
+
+
+def _metric_name(name: str) -> str:
+    """Build a valid Prometheus metric name."""
+    cleaned = ''.join(char if char.isalnum() or char in '_:' else '_' for char in name)
+    return cleaned if cleaned.startswith(METRIC_PREFIX) else METRIC_PREFIX + cleaned
+
+
+def _label_text(labels: Tuple) -> str:
+    """Format labels as a Prometheus label set."""
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
+
+
+# Process-wide registry used by the instrumented modules
+METRICS = Metrics()
+timer = METRICS.timer
+timed = METRICS.timed
+count = METRICS.count
+
+
+class RateLimitFilter(logging.Filter):
+    def __init__(self, burst: int = LOG_BURST, interval: float = LOG_INTERVAL):
+        """
+        Let at most ``burst`` records per message through in each ``interval`` seconds.
+        
+        Records are grouped by their unformatted message, so per-item messages
+        such as "Participant badge created: %s" share one budget. The next
+        record let through after a quiet period carries the number of
+        suppressed ones in ``record.suppressed``. Warnings and errors are
+        never suppressed.
+        
+        The budget is per process: forked bulk-badge workers inherit a copy
+        of the filter and each may emit its own burst. Workers hand their
+        suppressed counts to the parent with ``drain`` and ``merge``, so
+        ``pending`` covers the whole run.
+        
+        Args:
+            burst (int): Records allowed per message and interval
+            interval (float): Interval length in seconds
+        """
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.windows = {}
+        self.merged = Counter()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record is emitted."""
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        now = time.monotonic()
+        window = self.windows.get(record.msg)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window else 0
+            self.windows[record.msg] = [now, 1, 0]
+            if suppressed:
+                record.suppressed = suppressed
+            return True
+        
+        if window[1] < self.burst:
+            window[1] += 1
+            return True
+        
+        window[2] += 1
+        return False
+    
+    def pending(self) -> Dict[str, int]:
+        """
+        Return the messages with records suppressed since they were last emitted.
+        
+        Records suppressed in other processes and merged with ``merge`` are included.
+        
+        Returns:
+            Dict[str, int]: Suppressed record count per unformatted message
+        """
+        pending = Counter(self.merged)
+        pending.update({str(message): window[2] for message, window in self.windows.items() if window[2]})
+        return dict(pending)
+    
+    def drain(self) -> Dict[str, int]:
+        """
+        Return the pending suppressed counts and clear them (e.g. in a worker, to hand them to the parent).
+        
+        Returns:
+            Dict[str, int]: Suppressed record count per unformatted message
+        """
+        pending = self.pending()
+        self.merged.clear()
+        for window in self.windows.values():
+            window[2] = 0
+        return pending
+    
+    def merge(self, suppressed: Dict[str, int]):
+        """
+        Add records suppressed in another process to those reported by ``pending``.
+        
+        Args:
+            suppressed (Dict[str, int]): Result of ``drain`` in the other process
+        """
+        self.merged.update(suppressed)
+
+
+def installed_rate_limit() -> Optional[RateLimitFilter]:
+    """Return the rate limit installed by configure_logging in this process (inherited by forked workers)."""
+    for handler in logging.getLogger().handlers:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, RateLimitFilter):
+                return log_filter
+    return None
+
+
+# Attributes every LogRecord has; anything else was passed as structured ``extra`` fields
+_RECORD_ATTRIBUTES = set(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'asctime',
+                                                                                     'suppressed'}
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict:
+    """Return the structured fields passed to a log call with ``extra``."""
+    return {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES}
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as text with its structured fields as key=value pairs."""
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            line += ' ' + ' '.join(f"{key}={value}" for key, value in fields.items())
+        if getattr(record, 'suppressed', 0):
+            line += f" (+{record.suppressed} similar suppressed)"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as one JSON object per line."""
+        entry = {
+            'time': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            **_extra_fields(record)
+        }
+        if getattr(record, 'suppressed', 0):
+            entry['suppressed'] = record.suppressed
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(level: str = 'INFO', log_format: str = 'text', burst: int = LOG_BURST,
+                      interval: float = LOG_INTERVAL, stream=None) -> RateLimitFilter:
+    """
+    Send log records to a stream through a rate limit.
+    
+    The instrumented modules only create loggers; until this is called
+    their per-item INFO messages are discarded, so library use stays quiet.
+    
+    Args:
+        level (str): Minimum level, e.g. 'INFO' or 'WARNING'
+        log_format (str): 'text' or 'json' (one object per line)
+        burst (int): Records allowed per message and interval
+        interval (float): Rate-limit interval in seconds
+        stream: Output stream (defaults to stderr)
+    
+    Returns:
+        RateLimitFilter: The installed filter, for reporting suppressed records
+    """
+    if log_format not in LOG_FORMATS:
+        raise ValueError(f"Unknown log format '{log_format}'. Choose from: {', '.join(LOG_FORMATS)}")
+    
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if log_format == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(TextFormatter('%(asctime)s %(levelname)s %(name)s: %(message)s', '%H:%M:%S'))
+    rate_limit = RateLimitFilter(burst, interval)
+    handler.addFilter(rate_limit)
+    
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level.upper())
+    return rate_limit
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = SAMPLING_INTERVAL, thread_id: int = None):
+        """
+        Sample the call stack of one thread from a background thread.
+        
+        Unlike cProfile it does not hook every call, so its overhead is small
+        and roughly constant; the result is a count of sampled stacks.
+        
+        Args:
+            interval (float): Seconds between samples
+            thread_id (int): Thread to sample (defaults to the thread that starts the profiler)
+        """
+        self.interval = interval
+        self.thread_id = thread_id
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Start sampling in a daemon thread."""
+        self.thread_id = self.thread_id or threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+    
+    def _run(self):
+        """Record the sampled thread's stack every interval."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+                self.samples += 1
+    
+    def top(self, limit: int = 15) -> List[Tuple[str, int]]:
+        """
+        List the functions present in the most samples (inclusive time).
+        
+        Args:
+            limit (int): Number of functions
+        
+        Returns:
+            List[Tuple[str, int]]: (function, samples) pairs
+        """
+        inclusive = Counter()
+        for stack, samples in self.stacks.items():
+            for function in set(stack.split(';')):
+                inclusive[function] += samples
+        return inclusive.most_common(limit)
+    
+    def write(self, output_file: str) -> str:
+        """
+        Write the samples in the collapsed-stack format read by flame graph tools.
+        
+        Args:
+            output_file (str): Output path
+        
+        Returns:
+            str: Path to the written file
+        """
+        with open(output_file, 'w') as f:
+            for stack, samples in self.stacks.most_common():
+                f.write(f"{stack} {samples}\n")
+        return output_file
+
+
+@contextmanager
+def profile(output_file: Optional[str], profiler: str = 'cprofile', top: int = 15) -> Iterator[None]:
+    """
+    Profile the enclosed block and save the profile; does nothing without an output file.
+    
+    'cprofile' writes pstats data (readable with ``python -m pstats`` or
+    snakeviz); 'sampling' writes collapsed stacks for flame graph tools. The
+    hottest functions are printed either way. Work done in worker processes
+    is not included.
+    
+    Args:
+        output_file (str): Profile output path, or None to disable profiling
+        profiler (str): 'cprofile' or 'sampling'
+        top (int): Functions printed in the summary
+    """
+    if not output_file:
+        yield
+        return
+    
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{profiler}'. Choose from: {', '.join(PROFILERS)}")
+    
+    if profiler == 'sampling':
+        sampler = SamplingProfiler()
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write(output_file)
+            print(f"\nSampling profile ({sampler.samples} samples) saved to {output_file}:")
+            for function, samples in sampler.top(top):
+                print(f"  {samples / max(1, sampler.samples):6.1%}  {function}")
+        return
+    
+    import cProfile
+    import pstats
+    
+    profiler_instance = cProfile.Profile()
+    profiler_instance.enable()
+    try:
+        yield
+    finally:
+        profiler_instance.disable()
+        profiler_instance.dump_stats(output_file)
+        print(f"\ncProfile saved to {output_file}; top functions by cumulative time:")
+        pstats.Stats(profiler_instance, stream=sys.stdout).sort_stats('cumulative').print_stats(top)
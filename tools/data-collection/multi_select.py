@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Multi-Select Answer Encoding
+
+Checkbox ("select all that apply") answers are exported as one string per registration with
+the chosen options joined by ANSWER_SEPARATOR. This module splits those strings back into
+options, encodes each registration's choices as a bitset (one bit per option, packed into
+uint64 words) or an exploded long table, and computes per-option counts and option
+co-occurrence matrices with vectorized numpy operations.
+
+Each distinct joined string is parsed once, so the Python work grows with the number of
+distinct answer combinations rather than the number of registrations.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from form_export import ANSWER_SEPARATOR
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Options of the checkbox questions on the registration forms, used when no form is given
+MULTI_SELECT_OPTIONS = {
+    'Which conference sessions are you most interested in? (Select all that apply)': [
+        'Leadership Development',
+        'Alumni Network Building',
+        'Career Advancement',
+        'Community Service Projects',
+        'Technology and Innovation',
+        'Business and Entrepreneurship',
+        'Education and Mentorship',
+        'All sessions'
+    ],
+    'Dietary Restrictions (for catering purposes)': [
+        'None',
+        'Vegetarian',
+        'Vegan',
+        'Halal',
+        'Kosher',
+        'Gluten-free',
+        'Dairy-free',
+        'Nut-free',
+        'Other (please specify)'
+    ]
+}
+
+# Bits per bitset word
+WORD_BITS = 64
+
+
+def checkbox_options(form: Dict) -> Dict[str, List[str]]:
+    """
+    List the options of every checkbox question in a form.
+    
+    Handles both the item layout used by the registration modules and the
+    Forms API layout, like ``form_export.build_question_map``.
+    
+    Args:
+        form (Dict): Form resource or registration form definition
+    
+    Returns:
+        Dict[str, List[str]]: Options keyed by question text, in form order
+    """
+    options = {}
+    
+    for item in form.get('items', []):
+        if 'questionItem' in item:
+            choice = item['questionItem']['question'].get('choiceQuestion', {})
+            title = item.get('title')
+        else:
+            choice = item.get('question', {}).get('choiceQuestion', {})
+            title = choice.get('question') or item.get('title')
+        if choice.get('type') == 'CHECKBOX' and title:
+            options[title] = [option['value'] for option in choice.get('options', []) if 'value' in option]
+    
+    return options
+
+
+class MultiSelectIndex:
+    def __init__(self, options: Iterable[str] = (), separator: str = ANSWER_SEPARATOR):
+        """
+        Initialize the index for one checkbox question.
+        
+        Answers that match no known option (such as free-text "Other"
+        answers) are added as new options the first time they are seen.
+        
+        Args:
+            options (Iterable[str]): Known options in display order
+            separator (str): Separator the export used to join the chosen options
+        """
+        self.options = []
+        self.positions = {}
+        self.separator = separator
+        self._max_tokens = 1
+        for option in options:
+            self._add_option(option)
+    
+    def _add_option(self, option: str) -> int:
+        """Register an option and return its bit position."""
+        if option not in self.positions:
+            self.positions[option] = len(self.options)
+            self.options.append(option)
+            self._max_tokens = max(self._max_tokens, option.count(self.separator) + 1)
+        return self.positions[option]
+    
+    @property
+    def words(self) -> int:
+        """Number of uint64 words per bitset."""
+        return max(1, -(-len(self.options) // WORD_BITS))
+    
+    def split(self, answer: str) -> List[str]:
+        """
+        Split a joined answer into its options.
+        
+        Known options that contain the separator are matched whole (longest
+        match first); consecutive unmatched pieces form one free-text option.
+        
+        Args:
+            answer (str): Joined checkbox answer
+        
+        Returns:
+            List[str]: Chosen options in answer order
+        """
+        if not isinstance(answer, str) or not answer.strip():
+            return []
+        
+        tokens = answer.split(self.separator)
+        chosen = []
+        unmatched = []
+        index = 0
+        while index < len(tokens):
+            for width in range(min(self._max_tokens, len(tokens) - index), 0, -1):
+                candidate = self.separator.join(tokens[index:index + width]).strip()
+                if candidate in self.positions:
+                    break
+            else:
+                unmatched.append(tokens[index])
+                index += 1
+                continue
+            
+            if unmatched:
+                chosen.append(self.separator.join(unmatched).strip())
+                unmatched = []
+            chosen.append(candidate)
+            index += width
+        
+        if unmatched:
+            chosen.append(self.separator.join(unmatched).strip())
+        return [option for option in chosen if option]
+    
+    def _category_bits(self, categories: Iterable[str]) -> np.ndarray:
+        """Return the bitset of each distinct joined answer, one row per category."""
+        import numpy as np
+        
+        # Masks are built as Python integers of any width, then cut into uint64 words
+        masks = []
+        for category in categories:
+            mask = 0
+            for option in self.split(category):
+                mask |= 1 << self._add_option(option)
+            masks.append(mask)
+        
+        word_mask = (1 << WORD_BITS) - 1
+        bits = np.empty((len(masks), self.words), dtype=np.uint64)
+        for word in range(self.words):
+            shift = word * WORD_BITS
+            bits[:, word] = [(mask >> shift) & word_mask for mask in masks]
+        return bits
+    
+    def encode(self, answers: pd.Series) -> np.ndarray:
+        """
+        Encode joined answers as bitsets.
+        
+        Args:
+            answers (pd.Series): Joined checkbox answers, one per registration
+        
+        Returns:
+            np.ndarray: uint64 array of shape (registrations, words); bit ``i`` is ``options[i]``
+        """
+        import numpy as np
+        import pandas as pd
+        
+        if not isinstance(answers.dtype, pd.CategoricalDtype):
+            answers = answers.astype('category')
+        
+        category_bits = self._category_bits(answers.cat.categories)
+        codes = answers.cat.codes.to_numpy()
+        # Missing answers map to an empty bitset in the extra last row
+        category_bits = np.vstack([category_bits, np.zeros((1, self.words), dtype=np.uint64)])
+        return category_bits[np.where(codes >= 0, codes, len(category_bits) - 1)]
+    
+    def _indicator(self, bits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the distinct bitsets as a 0/1 option matrix, with how often each occurs.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (distinct bitsets x options) matrix and counts
+        """
+        import numpy as np
+        
+        if len(bits) == 0:
+            return np.zeros((0, len(self.options)), dtype=np.int64), np.zeros(0, dtype=np.int64)
+        
+        if bits.shape[1] == 1:
+            # A flat unique is much faster than a row-wise one
+            distinct, counts = np.unique(bits[:, 0], return_counts=True)
+            distinct = distinct[:, None]
+        else:
+            distinct, counts = np.unique(bits, axis=0, return_counts=True)
+        # Unpack each little-endian word into its 64 bits, lowest bit first
+        as_bytes = distinct.astype('<u8').view(np.uint8).reshape(len(distinct), -1)
+        indicator = np.unpackbits(as_bytes, axis=1, bitorder='little')[:, :len(self.options)]
+        return indicator.astype(np.int64), counts.astype(np.int64)
+    
+    def option_counts(self, bits: np.ndarray) -> List[Tuple[str, int]]:
+        """
+        Count the registrations choosing each option, most common first.
+        
+        Args:
+            bits (np.ndarray): Bitsets from ``encode``
+        
+        Returns:
+            List[Tuple[str, int]]: (option, registrations) pairs for options chosen at least once
+        """
+        import numpy as np
+        
+        indicator, counts = self._indicator(bits)
+        totals = counts @ indicator
+        order = np.argsort(-totals, kind='stable')
+        return [(self.options[index], int(totals[index])) for index in order if totals[index]]
+    
+    def co_occurrence(self, bits: np.ndarray) -> pd.DataFrame:
+        """
+        Count how often each pair of options is chosen together.
+        
+        Args:
+            bits (np.ndarray): Bitsets from ``encode``
+        
+        Returns:
+            pd.DataFrame: Symmetric options x options matrix; the diagonal holds the option counts
+        """
+        import pandas as pd
+        
+        indicator, counts = self._indicator(bits)
+        # Float matrix products use BLAS and are exact for counts below 2**53
+        indicator = indicator.astype(float)
+        matrix = (indicator.T @ (indicator * counts[:, None])).round().astype('int64')
+        return pd.DataFrame(matrix, index=self.options, columns=self.options)
+    
+    def top_pairs(self, bits: np.ndarray, top: int = 10) -> List[Tuple[str, str, int]]:
+        """
+        Return the option pairs chosen together most often.
+        
+        Args:
+            bits (np.ndarray): Bitsets from ``encode``
+            top (int): Number of pairs
+        
+        Returns:
+            List[Tuple[str, str, int]]: (option, option, registrations) for pairs chosen at least once
+        """
+        import numpy as np
+        
+        matrix = self.co_occurrence(bits).to_numpy()
+        first, second = np.triu_indices(len(self.options), k=1)
+        pair_counts = matrix[first, second]
+        order = np.argsort(-pair_counts, kind='stable')[:top]
+        return [(self.options[first[index]], self.options[second[index]], int(pair_counts[index]))
+                for index in order if pair_counts[index]]
+    
+    def explode(self, answers: pd.Series) -> pd.DataFrame:
+        """
+        Convert joined answers to a long table with one row per chosen option.
+        
+        Args:
+            answers (pd.Series): Joined checkbox answers; the index identifies the registration
+        
+        Returns:
+            pd.DataFrame: Columns 'row' (index label of the answer) and 'option' (categorical)
+        """
+        import numpy as np
+        import pandas as pd
+        
+        bits = self.encode(answers)
+        as_bytes = bits.astype('<u8').view(np.uint8).reshape(len(bits), -1)
+        rows, positions = np.nonzero(np.unpackbits(as_bytes, axis=1, bitorder='little')[:, :len(self.options)])
+        return pd.DataFrame({
+            'row': answers.index.to_numpy()[rows],
+            'option': pd.Categorical.from_codes(positions, categories=self.options)
+        })
+
+
+def explode_answers(df: pd.DataFrame, options: Dict[str, List[str]] = None,
+                    id_column: str = 'response_id') -> pd.DataFrame:
+    """
+    Build the long table of checkbox answers for an export, one row per chosen option.
+    
+    The result is small and fully categorical, so it can be stored next to
+    the export with ``columnar_storage.write_table`` and counted or joined
+    without splitting strings again.
+    
+    Args:
+        df (pd.DataFrame): Exported responses
+        options (Dict[str, List[str]]): Known options per checkbox question (defaults to MULTI_SELECT_OPTIONS)
+        id_column (str): Column identifying each response (the row index is used if it is missing)
+    
+    Returns:
+        pd.DataFrame: Columns id_column, 'question' and 'option'
+    """
+    import pandas as pd
+    
+    options = MULTI_SELECT_OPTIONS if options is None else options
+    ids = df[id_column] if id_column in df.columns else pd.Series(df.index, index=df.index)
+    
+    tables = []
+    for question, question_options in options.items():
+        if question not in df.columns:
+            continue
+        long = MultiSelectIndex(question_options).explode(df[question])
+        tables.append(pd.DataFrame({
+            id_column: ids.loc[long['row']].to_numpy(),
+            'question': question,
+            'option': long['option'].astype(str)
+        }))
+    
+    if not tables:
+        return pd.DataFrame(columns=[id_column, 'question', 'option'])
+    
+    exploded = pd.concat(tables, ignore_index=True)
+    exploded['question'] = exploded['question'].astype('category')
+    exploded['option'] = exploded['option'].astype('category')
+    return exploded
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Compact Signed QR Payloads
+
+This module encodes a registration as a short base45 payload carrying the registration ID,
+a short event code and a truncated HMAC-SHA256 signature, so scanners can verify badges
+offline. Event metadata is looked up from the event code instead of being embedded.
+
+Payload layout before base45 encoding:
+    version (1 byte) | event code length (1 byte) | event code | registration ID | signature
+"""
+
+import hashlib
+import hmac
+import os
+import re
+import secrets
+from typing import Dict, Optional
+
+# Prefix marking a compact payload; only QR alphanumeric-mode characters are used
+PAYLOAD_PREFIX = 'EX1:'
+PAYLOAD_VERSION = 1
+
+# Bytes of HMAC-SHA256 kept as the signature
+SIGNATURE_BYTES = 8
+
+# Event metadata referenced by the short code in each payload; more events are added with
+# register_event. 'event', 'date' and 'venue' are required, the other fields are optional
+# (see event_details for their fallbacks)
+EVENT_CODES = {
+    'PGC25': {
+        'event': "ExJAM PG Conference - Maiden Flight",
+        'date': "Nov 28-30, 2025",
+        'venue': "NAF Conference Centre, FCT, ABUJA",
+        'short_name': "ExJAM PG Conference",
+        'name': "ExJAM President General's Conference",
+        'theme': "Maiden Flight",
+        'full_date': "November 28-30, 2025",
+        'event_id': "EXJAM-PG-2025",
+        'venue_code': "NAF-CC-ABUJA",
+        'date_code': "20251128-30"
+    }
+}
+DEFAULT_EVENT_CODE = 'PGC25'
+REQUIRED_EVENT_FIELDS = ('event', 'date', 'venue')
+
+# Event codes are short ASCII identifiers, also used in file and partition names
+EVENT_CODE_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,32}$')
+
+# RFC 9285 alphabet; every character is valid in QR alphanumeric mode
+BASE45_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:'
+_BASE45_VALUES = {char: value for value, char in enumerate(BASE45_ALPHABET)}
+
+
+class InvalidPayload(ValueError):
+    """Raised when a compact payload is malformed or its signature does not match."""
+
+
+def register_event(event_code: str, details: Dict) -> Dict:
+    """
+    Add (or replace) an event in EVENT_CODES.
+    
+    Args:
+        event_code (str): Short event code carried by compact payloads
+        details (Dict): Event metadata with at least 'event', 'date' and 'venue'
+    
+    Returns:
+        Dict: The registered metadata
+    """
+    if not EVENT_CODE_PATTERN.match(event_code or ''):
+        raise ValueError(f"Invalid event code '{event_code}': use up to 32 letters, digits, '-' or '_'")
+    missing = [field for field in REQUIRED_EVENT_FIELDS if not details.get(field)]
+    if missing:
+        raise ValueError(f"Event '{event_code}' is missing: {', '.join(missing)}")
+    
+    EVENT_CODES[event_code] = dict(details)
+    return EVENT_CODES[event_code]
+
+
+def event_details(event_code: str = DEFAULT_EVENT_CODE) -> Dict:
+    """
+    Return an event's metadata with every optional field filled in.
+    
+    ``short_name`` and ``name`` fall back to ``event``, ``full_date`` to
+    ``date``, ``event_id`` (the event barcode) to ``EXJAM-<code>``, and
+    ``theme``, ``venue_code`` and ``date_code`` to empty strings.
+    
+    Args:
+        event_code (str): Short event code (see EVENT_CODES)
+    
+    Returns:
+        Dict: Event metadata plus its 'code'
+    """
+    if event_code not in EVENT_CODES:
+        raise ValueError(f"Unknown event code '{event_code}'. Choose from: {', '.join(EVENT_CODES)}")
+    
+    details = EVENT_CODES[event_code]
+    return {
+        **details,
+        'code': event_code,
+        'short_name': details.get('short_name') or details['event'],
+        'name': details.get('name') or details['event'],
+        'theme': details.get('theme') or '',
+        'full_date': details.get('full_date') or details['date'],
+        'event_id': details.get('event_id') or f"EXJAM-{event_code}",
+        'venue_code': details.get('venue_code') or '',
+        'date_code': details.get('date_code') or ''
+    }
+
+
+def b45encode(data: bytes) -> str:
+    """
+    Encode bytes as base45 (RFC 9285).
+    
+    Args:
+        data (bytes): Data to encode
+    
+    Returns:
+        str: Base45 text
+    """
+    chars = []
+    for index in range(0, len(data) - 1, 2):
+        value = data[index] * 256 + data[index + 1]
+        value, c = divmod(value, 45)
+        e, d = divmod(value, 45)
+        chars += [BASE45_ALPHABET[c], BASE45_ALPHABET[d], BASE45_ALPHABET[e]]
+    if len(data) % 2:
+        d, c = divmod(data[-1], 45)
+        chars += [BASE45_ALPHABET[c], BASE45_ALPHABET[d]]
+    return ''.join(chars)
+
+
+def b45decode(text: str) -> bytes:
+    """
+    Decode base45 text (RFC 9285).
+    
+    Args:
+        text (str): Base45 text
+    
+    Returns:
+        bytes: Decoded data
+    """
+    try:
+        values = [_BASE45_VALUES[char] for char in text]
+    except KeyError as e:
+        raise InvalidPayload(f"Invalid base45 character {e}") from None
+    
+    data = bytearray()
+    for index in range(0, len(values), 3):
+        group = values[index:index + 3]
+        if len(group) == 3:
+            value = group[0] + group[1] * 45 + group[2] * 2025
+            if value > 0xFFFF:
+                raise InvalidPayload("Invalid base45 group")
+            data += bytes(divmod(value, 256))
+        elif len(group) == 2:
+            value = group[0] + group[1] * 45
+            if value > 0xFF:
+                raise InvalidPayload("Invalid base45 group")
+            data.append(value)
+        else:
+            raise InvalidPayload("Truncated base45 data")
+    return bytes(data)
+
+
+def load_key(key_file: str = "qr_payload.key") -> Optional[bytes]:
+    """
+    Load the payload signing key.
+    
+    The ``EXJAM_QR_KEY`` environment variable (hex) overrides the file.
+    
+    Args:
+        key_file (str): Path of the key file
+    
+    Returns:
+        Optional[bytes]: Signing key, or None if no key has been created
+    """
+    if os.environ.get('EXJAM_QR_KEY'):
+        return bytes.fromhex(os.environ['EXJAM_QR_KEY'])
+    
+    if os.path.exists(key_file):
+        with open(key_file, 'r') as f:
+            return bytes.fromhex(f.read().strip())
+    return None
+
+
+def load_or_create_key(key_file: str = "qr_payload.key") -> bytes:
+    """
+    Load the payload signing key, creating a random one on first use.
+    
+    The same key file must be given to the check-in service so it can
+    verify badges.
+    
+    Args:
+        key_file (str): Path of the key file
+    
+    Returns:
+        bytes: Signing key
+    """
+    key = load_key(key_file)
+    if key is not None:
+        return key
+    
+    key = secrets.token_bytes(32)
+    # Exclusive create, so two processes starting together cannot write different keys
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return load_or_create_key(key_file)
+    with os.fdopen(fd, 'w') as f:
+        f.write(key.hex())
+    return key
+
+
+def is_compact_payload(text: str) -> bool:
+    """Return True if scanned text is a compact registration payload."""
+    return text.startswith(PAYLOAD_PREFIX)
+
+
+class PayloadCodec:
+    def __init__(self, key: bytes):
+        """
+        Initialize the payload codec.
+        
+        Args:
+            key (bytes): HMAC signing key shared by badge generation and check-in
+        """
+        self.key = key
+    
+    def _sign(self, body: bytes) -> bytes:
+        """Return the truncated HMAC-SHA256 signature of a payload body."""
+        return hmac.new(self.key, body, hashlib.sha256).digest()[:SIGNATURE_BYTES]
+    
+    def encode(self, registration_id: str, event_code: str = DEFAULT_EVENT_CODE) -> str:
+        """
+        Build the compact signed payload for a registration.
+        
+        Args:
+            registration_id (str): Unique registration identifier
+            event_code (str): Short event code (see EVENT_CODES)
+        
+        Returns:
+            str: Payload text for the QR code
+        """
+        code = event_code.encode('ascii')
+        body = bytes([PAYLOAD_VERSION, len(code)]) + code + registration_id.encode('utf-8')
+        return PAYLOAD_PREFIX + b45encode(body + self._sign(body))
+    
+    def decode(self, payload: str, verify: bool = True) -> Dict:
+        """
+        Decode a compact payload and check its signature.
+        
+        Args:
+            payload (str): Scanned payload text
+            verify (bool): Reject the payload if the signature does not match
+        
+        Returns:
+            Dict: registration_id, event_code and the event metadata (if the code is known)
+        """
+        if not is_compact_payload(payload):
+            raise InvalidPayload("Not a compact registration payload")
+        
+        data = b45decode(payload[len(PAYLOAD_PREFIX):])
+        if len(data) < 2 + SIGNATURE_BYTES or data[0] != PAYLOAD_VERSION:
+            raise InvalidPayload("Unsupported payload version or truncated payload")
+        
+        body, signature = data[:-SIGNATURE_BYTES], data[-SIGNATURE_BYTES:]
+        if verify and not hmac.compare_digest(signature, self._sign(body)):
+            raise InvalidPayload("Payload signature does not match")
+        
+        code_end = 2 + body[1]
+        event_code = body[2:code_end].decode('ascii')
+        return {
+            'registration_id': body[code_end:].decode('utf-8'),
+            'event_code': event_code,
+            'event': EVENT_CODES.get(event_code)
+        }
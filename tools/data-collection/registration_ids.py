@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Registration ID Generator
+
+This module issues time-ordered, ULID-style registration IDs: a 48-bit millisecond timestamp
+and a 40-bit random part in Crockford base32, followed by an ISO 7064 MOD 37,36 check character
+so a scanned barcode can be validated before lookup. IDs are allocated in batches and recorded
+in a file-locked registry, which keeps them unique and increasing across processes and runs.
+
+ID layout: ``PREFIX-TTTTTTTTTTRRRRRRRRC`` (timestamp, random part, check character)
+"""
+
+import os
+import re
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Crockford base32 (no I, L, O or U), so IDs sort in time order as plain strings
+CROCKFORD_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_CROCKFORD_VALUES = {char: value for value, char in enumerate(CROCKFORD_ALPHABET)}
+
+# Characters used for the timestamp (48 bits) and random part (40 bits)
+TIMESTAMP_CHARS = 10
+RANDOM_CHARS = 8
+RANDOM_BITS = RANDOM_CHARS * 5
+
+# ISO 7064 MOD 37,36 works over digits and uppercase letters
+CHECK_ALPHABET = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_CHECK_VALUES = {char: value for value, char in enumerate(CHECK_ALPHABET)}
+
+ID_PATTERN = re.compile(r'^([A-Z0-9]+)-([0-9A-HJKMNP-TV-Z]{%d})([0-9A-Z])$' % (TIMESTAMP_CHARS + RANDOM_CHARS))
+
+# Registry bytes read back to find the last issued ID
+_REGISTRY_TAIL_BYTES = 256
+
+
+def _encode_base32(value: int, length: int) -> str:
+    """Encode an integer as fixed-width Crockford base32."""
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(CROCKFORD_ALPHABET[digit])
+    return ''.join(reversed(chars))
+
+
+def _decode_base32(text: str) -> int:
+    """Decode Crockford base32 text to an integer."""
+    value = 0
+    for char in text:
+        value = value * 32 + _CROCKFORD_VALUES[char]
+    return value
+
+
+def _check_product(text: str, product: int = 36) -> int:
+    """Run the ISO 7064 MOD 37,36 recursion over text, continuing from ``product``."""
+    for char in text:
+        if char == '-':
+            continue
+        total = (product + _CHECK_VALUES[char]) % 36 or 36
+        product = total * 2 % 37
+    return product
+
+
+def check_character(text: str) -> str:
+    """
+    Compute the ISO 7064 MOD 37,36 check character of an ID.
+    
+    Hyphens are ignored; the check catches any single wrong character
+    and any swap of two adjacent characters.
+    
+    Args:
+        text (str): ID without its check character
+    
+    Returns:
+        str: Check character (0-9 or A-Z)
+    """
+    return CHECK_ALPHABET[(37 - _check_product(text)) % 36]
+
+
+def is_generated_id(text: str) -> bool:
+    """Return True if text has the layout of a generated ID (the check character is not verified)."""
+    return ID_PATTERN.match(text) is not None
+
+
+def is_valid_id(registration_id: str) -> bool:
+    """
+    Check the layout and check character of a registration ID.
+    
+    Args:
+        registration_id (str): Scanned or typed ID
+    
+    Returns:
+        bool: True if the ID is well formed and its check character matches
+    """
+    registration_id = registration_id.strip().upper()
+    if not is_generated_id(registration_id):
+        return False
+    return check_character(registration_id[:-1]) == registration_id[-1]
+
+
+def id_timestamp(registration_id: str) -> Optional[datetime]:
+    """Return the UTC time a generated ID was issued, or None for other IDs."""
+    match = ID_PATTERN.match(registration_id)
+    if match is None:
+        return None
+    milliseconds = _decode_base32(match.group(2)[:TIMESTAMP_CHARS])
+    return datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc)
+
+
+def _lock(f):
+    """Take an exclusive lock on an open registry file, waiting if another process holds it."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(f):
+    """Release the registry file lock."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class IdGenerator:
+    def __init__(self, prefix: str = "EXJAM", registry_file: str = None):
+        """
+        Initialize the ID generator.
+        
+        IDs are strictly increasing: within one millisecond the random part
+        is incremented instead of redrawn. With a registry file, the last
+        issued ID is read under an exclusive lock before each batch and the
+        new IDs are appended, so concurrent processes and later runs continue
+        the same sequence.
+        
+        Args:
+            prefix (str): Uppercase alphanumeric prefix, e.g. 'EXJAM'
+            registry_file (str): Optional registry of issued IDs, one per line
+        """
+        if not re.fullmatch(r'[A-Z0-9]+', prefix):
+            raise ValueError(f"ID prefix must be uppercase letters and digits, got '{prefix}'")
+        
+        self.prefix = prefix
+        self.registry_file = registry_file
+        self._last = (0, 0)
+    
+    def new_id(self) -> str:
+        """Return one new registration ID."""
+        return self.allocate(1)[0]
+    
+    def allocate(self, count: int) -> List[str]:
+        """
+        Allocate a batch of consecutive registration IDs.
+        
+        Args:
+            count (int): Number of IDs
+        
+        Returns:
+            List[str]: IDs in increasing order
+        """
+        if count <= 0:
+            return []
+        if not self.registry_file:
+            return self._issue(count)
+        
+        directory = os.path.dirname(self.registry_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(self.registry_file, 'a+b') as f:
+            _lock(f)
+            try:
+                last, torn = self._read_last(f)
+                if last is not None:
+                    self._last = max(self._last, last)
+                ids = self._issue(count)
+                # Terminate a torn last line so the batch starts on its own line
+                f.write((b'\n' if torn else b'') + ('\n'.join(ids) + '\n').encode('ascii'))
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                _unlock(f)
+        return ids
+    
+    def _issue(self, count: int) -> List[str]:
+        """Build ``count`` IDs following the last issued one and remember the new last ID."""
+        milliseconds, random_part = self._next_start(count)
+        timestamp = f"{self.prefix}-{_encode_base32(milliseconds, TIMESTAMP_CHARS)}"
+        # The prefix and timestamp are shared by the batch, so their check state is computed once
+        timestamp_product = _check_product(timestamp)
+        
+        ids = []
+        for offset in range(count):
+            random_text = _encode_base32(random_part + offset, RANDOM_CHARS)
+            check = CHECK_ALPHABET[(37 - _check_product(random_text, timestamp_product)) % 36]
+            ids.append(timestamp + random_text + check)
+        
+        self._last = (milliseconds, random_part + count - 1)
+        return ids
+    
+    def _next_start(self, count: int) -> Tuple[int, int]:
+        """Return the (timestamp, random part) of the first ID of a batch."""
+        now = time.time_ns() // 1_000_000
+        last_milliseconds, last_random = self._last
+        
+        if now > last_milliseconds:
+            # New random parts start in the lower half, leaving room to increment
+            return now, secrets.randbits(RANDOM_BITS - 1)
+        if last_random + count < 1 << RANDOM_BITS:
+            return last_milliseconds, last_random + 1
+        # Random part exhausted within this millisecond; borrow the next one
+        return last_milliseconds + 1, secrets.randbits(RANDOM_BITS - 1)
+    
+    @staticmethod
+    def _read_last(f) -> Tuple[Optional[Tuple[int, int]], bool]:
+        """
+        Read the end of the registry.
+        
+        Returns:
+            Tuple: (timestamp, random part) of the last issued ID or None, and
+                whether the file ends in a torn line
+        """
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return None, False
+        
+        f.seek(max(0, size - _REGISTRY_TAIL_BYTES))
+        tail = f.read()
+        for line in reversed(tail.decode('ascii', errors='replace').splitlines()):
+            match = ID_PATTERN.match(line.strip())
+            if match:
+                body = match.group(2)
+                last = _decode_base32(body[:TIMESTAMP_CHARS]), _decode_base32(body[TIMESTAMP_CHARS:])
+                return last, not tail.endswith(b'\n')
+        return None, not tail.endswith(b'\n')
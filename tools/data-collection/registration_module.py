@@ -10,6 +10,7 @@ import qrcode
 import requests
 import json
 import csv
+import logging
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -21,6 +22,12 @@ from googleapiclient.discovery import build
 import pickle
 import base64
 from io import BytesIO
+from form_export import FormResponseExporter
+from instrumentation import timer
+from registration_report import REGISTRATION_REPORT_TEMPLATE, generate_registration_report
+
+logger = logging.getLogger(__name__)
+
 
 class ExjamRegistrationModule:
     def __init__(self, credentials_file: str = None):
@@ -356,7 +363,8 @@ class ExjamRegistrationModule:
         
         # Create the form
         try:
-            created_form = self.service.forms().create(body=form).execute()
+            with timer('api_call_seconds', call='forms.create'):
+                created_form = self.service.forms().create(body=form).execute()
             self.form_id = created_form['formId']
             form_url = f"https://docs.google.com/forms/d/{self.form_id}/viewform"
             
@@ -381,18 +389,19 @@ class ExjamRegistrationModule:
         Returns:
             str: Path to the generated QR code image
         """
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
+        with timer('qr_encode_seconds', format='png'):
+            # Create QR code
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
+            )
+            qr.add_data(data)
+            qr.make(fit=True)
+            
+            # Create image
+            img = qr.make_image(fill_color="black", back_color="white")
         
         # Generate filename if not provided
         if not filename:
@@ -403,7 +412,7 @@ class ExjamRegistrationModule:
         filepath = os.path.join(self.qr_codes_dir, filename)
         img.save(filepath)
         
-        print(f"QR code generated: {filepath}")
+        logger.info("QR code generated: %s", filepath, extra={'path': filepath})
         return filepath
     
     def generate_registration_qr_codes(self, form_id: str = None) -> Dict[str, str]:
@@ -452,13 +461,21 @@ class ExjamRegistrationModule:
         
         return qr_codes
     
-    def export_responses_to_csv(self, form_id: str = None, output_file: str = "registration_responses.csv") -> str:
+    def export_responses_to_csv(self, form_id: str = None, output_file: str = "registration_responses.csv",
+                                incremental: bool = False, page_size: int = 5000) -> str:
         """
         Export form responses to CSV file.
         
+        Responses are fetched page by page and streamed to the CSV as they
+        arrive. With ``incremental=True`` only responses submitted since the
+        previous export (tracked in a watermark file next to the CSV) are
+        fetched and appended.
+        
         Args:
             form_id (str): Google Form ID
             output_file (str): Output CSV filename
+            incremental (bool): Append only responses newer than the last export
+            page_size (int): Number of responses requested per page
             
         Returns:
             str: Path to the exported CSV file
@@ -475,52 +492,18 @@ class ExjamRegistrationModule:
             return None
         
         try:
-            # Get form responses
-            responses = self.service.forms().responses().list(formId=form_id).execute()
+            exporter = FormResponseExporter(self.service, page_size)
+            total = exporter.export_to_csv(form_id, output_file, incremental)
             
-            if not responses.get('responses'):
+            if not total:
+                if incremental and os.path.exists(output_file):
+                    print("No new responses since the last export.")
+                    return output_file
                 print("No responses found for this form.")
                 return None
             
-            # Get form structure to map question IDs to questions
-            form = self.service.forms().get(formId=form_id).execute()
-            question_map = {}
-            
-            for item in form.get('items', []):
-                if 'question' in item:
-                    question_id = item['itemId']
-                    question_text = item['question'].get('textQuestion', {}).get('question', '')
-                    question_map[question_id] = question_text
-            
-            # Process responses
-            processed_responses = []
-            
-            for response in responses['responses']:
-                response_data = {
-                    'response_id': response['responseId'],
-                    'created_time': response['createdTime'],
-                    'last_submitted_time': response['lastSubmittedTime']
-                }
-                
-                # Extract answers
-                for answer in response.get('answers', {}).values():
-                    question_id = answer['questionId']
-                    question_text = question_map.get(question_id, question_id)
-                    
-                    if 'textAnswers' in answer:
-                        response_data[question_text] = answer['textAnswers']['answers'][0]['value']
-                    elif 'choiceAnswers' in answer:
-                        choices = [choice['value'] for choice in answer['choiceAnswers']['answers']]
-                        response_data[question_text] = ', '.join(choices)
-                
-                processed_responses.append(response_data)
-            
-            # Convert to DataFrame and save
-            df = pd.DataFrame(processed_responses)
-            df.to_csv(output_file, index=False)
-            
             print(f"Responses exported to: {output_file}")
-            print(f"Total responses: {len(processed_responses)}")
+            print(f"Total responses: {total}")
             
             return output_file
             
@@ -533,67 +516,14 @@ class ExjamRegistrationModule:
         Generate a comprehensive registration report.
         
         Args:
-            csv_file (str): Path to CSV file with registration data
+            csv_file (str): Path to registration data (CSV, Parquet or Feather)
             output_file (str): Output report filename
             
         Returns:
             str: Path to the generated report
         """
         try:
-            df = pd.read_csv(csv_file)
-            
-            report = f"""# ExJAM PG Conference Registration Report
-
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Executive Summary
-- **Total Registrations**: {len(df)}
-- **Registration Period**: {df['created_time'].min()} to {df['created_time'].max()}
-
-## Registration Statistics
-
-### Graduation Year Distribution
-{df['Graduation Year from Air Force Military School Jos'].value_counts().to_markdown()}
-
-### Geographic Distribution
-{df['Current Location (City, State/Province, Country)'].value_counts().head(10).to_markdown()}
-
-### Professional Distribution
-{df['Current Occupation/Profession'].value_counts().head(10).to_markdown()}
-
-### Accommodation Needs
-{df['Do you need accommodation assistance?'].value_counts().to_markdown()}
-
-### Transportation Needs
-{df['Do you need transportation assistance from the airport?'].value_counts().to_markdown()}
-
-### Session Interests
-{df['Which conference sessions are you most interested in? (Select all that apply)'].value_counts().to_markdown()}
-
-### Speaking Interest
-{df['Would you be interested in speaking at the conference?'].value_counts().to_markdown()}
-
-## Dietary Requirements
-{df['Dietary Restrictions (for catering purposes)'].value_counts().to_markdown()}
-
-## Special Needs
-Special needs and accessibility requirements:
-{df['Special Needs or Accessibility Requirements'].dropna().to_list()}
-
-## Recommendations
-Based on the registration data:
-
-1. **Catering**: Plan for {df['Dietary Restrictions (for catering purposes)'].value_counts().get('None', 0)} standard meals and accommodate special dietary requirements
-2. **Accommodation**: {df['Do you need accommodation assistance?'].value_counts().get('Yes, I need accommodation', 0)} participants need accommodation assistance
-3. **Transportation**: {df['Do you need transportation assistance from the airport?'].value_counts().get('Yes, I need airport pickup', 0)} participants need airport pickup
-4. **Sessions**: Focus on the most popular session topics based on participant interests
-
----
-*Report generated automatically from registration data*
-"""
-            
-            with open(output_file, 'w') as f:
-                f.write(report)
+            generate_registration_report(csv_file, output_file, REGISTRATION_REPORT_TEMPLATE)
             
             print(f"Registration report generated: {output_file}")
             return output_file
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Registration Report Engine
+
+This module computes every aggregate used by the registration reports in one pass over the
+categorical columns of an export, then renders a Markdown template line by line straight to
+disk. Tables are streamed as they are rendered instead of being built as one large string.
+
+Template placeholders use ``string.Template`` syntax: ``$name`` inside a line is replaced with
+a value, and a placeholder alone on a line is replaced with the lines of a table or list.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from string import Template
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple
+
+from columnar_storage import REGISTRATION_CATEGORICAL_COLUMNS, REGISTRATION_REPORT_COLUMNS, read_table
+from multi_select import MULTI_SELECT_OPTIONS, MultiSelectIndex
+from qr_payload import DEFAULT_EVENT_CODE, event_details
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Counted report columns, keyed by the name used in the templates
+COUNTED_COLUMNS = {
+    'graduation_years': 'Graduation Year from Air Force Military School Jos',
+    'locations': 'Current Location (City, State/Province, Country)',
+    'professions': 'Current Occupation/Profession',
+    'accommodation': 'Do you need accommodation assistance?',
+    'transportation': 'Do you need transportation assistance from the airport?',
+    'sessions': 'Which conference sessions are you most interested in? (Select all that apply)',
+    'speaking': 'Would you be interested in speaking at the conference?',
+    'dietary': 'Dietary Restrictions (for catering purposes)',
+    'special_needs': 'Special Needs or Accessibility Requirements'
+}
+
+# Rows shown for tables limited to the most common answers
+TOP_ROWS = {
+    'locations': 10,
+    'professions': 10
+}
+
+# Option pairs listed for checkbox questions
+TOP_PAIRS = 10
+
+# Distinct special needs listed before the rest are summarized
+SPECIAL_NEEDS_LIMIT = 50
+
+# Answers counted for the logistics recommendations; registrations without a dietary answer
+# also get a standard meal (CSV parsing reads a literal 'None' answer as missing)
+STANDARD_MEAL_ANSWER = 'None'
+ACCOMMODATION_ANSWER = 'Yes, I need accommodation'
+AIRPORT_PICKUP_ANSWER = 'Yes, I need airport pickup'
+
+REGISTRATION_REPORT_TEMPLATE = """# $event_short_name Registration Report
+
+Generated on: $generated_on
+
+## Executive Summary
+- **Total Registrations**: $total
+- **Registration Period**: $first_registration to $last_registration
+
+## Registration Statistics
+
+### Graduation Year Distribution
+$graduation_years
+
+### Geographic Distribution
+$locations
+
+### Professional Distribution
+$professions
+
+### Accommodation Needs
+$accommodation
+
+### Transportation Needs
+$transportation
+
+### Session Interests
+$sessions
+
+### Sessions Chosen Together
+$sessions_pairs
+
+### Speaking Interest
+$speaking
+
+## Dietary Requirements
+$dietary
+
+## Special Needs
+Special needs and accessibility requirements:
+$special_needs
+
+## Recommendations
+Based on the registration data:
+
+1. **Catering**: Plan for $standard_meals standard meals and accommodate special dietary requirements
+2. **Accommodation**: $accommodation_requests participants need accommodation assistance
+3. **Transportation**: $airport_pickups participants need airport pickup
+4. **Sessions**: Focus on the most popular session topics based on participant interests
+
+---
+*Report generated automatically from registration data*
+"""
+
+COMPREHENSIVE_REPORT_TEMPLATE = """# $event_short_name Comprehensive Registration Report
+
+Generated on: $generated_on
+
+## Executive Summary
+- **Total Registrations**: $total
+- **Registration Period**: $first_registration to $last_registration
+- **Event**: $event_name
+- **Date**: $event_date
+- **Venue**: $event_venue
+
+## Registration Statistics
+
+### Graduation Year Distribution
+$graduation_years
+
+### Geographic Distribution
+$locations
+
+### Professional Distribution
+$professions
+
+### Accommodation Needs
+$accommodation
+
+### Transportation Needs
+$transportation
+
+### Session Interests
+$sessions
+
+### Sessions Chosen Together
+$sessions_pairs
+
+### Speaking Interest
+$speaking
+
+## Dietary Requirements
+$dietary
+
+## Special Needs
+Special needs and accessibility requirements:
+$special_needs
+
+## QR Codes and Barcodes Generated
+- Registration QR codes: $total individual codes
+- Event information QR codes: 4 types
+- Barcodes: $event_barcodes
+- Participant badges: $total badges
+
+## Event Logistics Recommendations
+Based on the registration data:
+
+1. **Catering**: Plan for $standard_meals standard meals and accommodate special dietary requirements
+2. **Accommodation**: $accommodation_requests participants need accommodation assistance
+3. **Transportation**: $airport_pickups participants need airport pickup
+4. **Sessions**: Focus on the most popular session topics based on participant interests
+5. **Badges**: $total participant badges need to be printed with QR codes and barcodes
+
+## Technical Implementation
+- Google Forms integration for registration
+- QR code generation for each participant
+- Barcode generation for event tracking
+- PDF badge generation with participant information
+- Automated report generation
+
+---
+*Report generated automatically from registration data*
+"""
+
+
+def category_counts(series: pd.Series) -> List[Tuple[object, int]]:
+    """
+    Count the answers in a column, most common first, like ``value_counts()``.
+    
+    The column is counted through its categorical codes with one
+    ``bincount``, so repeated text is never compared or hashed.
+    
+    Args:
+        series (pd.Series): Column to count (converted to categorical if needed)
+    
+    Returns:
+        List[Tuple[object, int]]: (answer, count) pairs, missing answers excluded
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+    
+    categories = series.cat.categories
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    order = np.argsort(-counts, kind='stable')
+    return [(categories[index], int(counts[index])) for index in order if counts[index]]
+
+
+def compute_aggregates(df: pd.DataFrame) -> Dict:
+    """
+    Compute every aggregate the report templates use, once.
+    
+    Args:
+        df (pd.DataFrame): Registration export with the REGISTRATION_REPORT_COLUMNS present
+    
+    Checkbox questions (MULTI_SELECT_OPTIONS) are counted per option from
+    their bitset encoding, with the most common option pairs under
+    ``<key>_pairs``.
+    
+    Returns:
+        Dict: Totals, registration period, the answer counts per COUNTED_COLUMNS key and
+            the number of registrations answering each question under 'answered'
+    """
+    aggregates = {'total': len(df), 'answered': {}}
+    
+    if 'created_time' in df.columns and df['created_time'].notna().any():
+        aggregates['first_registration'] = df['created_time'].min()
+        aggregates['last_registration'] = df['created_time'].max()
+    else:
+        aggregates['first_registration'] = aggregates['last_registration'] = 'N/A'
+    
+    for key, column in COUNTED_COLUMNS.items():
+        if column not in df.columns:
+            aggregates[key] = []
+            aggregates['answered'][key] = 0
+        elif column in MULTI_SELECT_OPTIONS:
+            index = MultiSelectIndex(MULTI_SELECT_OPTIONS[column])
+            bits = index.encode(df[column])
+            aggregates[key] = index.option_counts(bits)
+            aggregates[f"{key}_pairs"] = index.top_pairs(bits, TOP_PAIRS)
+            aggregates['answered'][key] = int(bits.any(axis=1).sum())
+        else:
+            aggregates[key] = category_counts(df[column])
+            aggregates['answered'][key] = sum(count for _, count in aggregates[key])
+    
+    return aggregates
+
+
+def _cell(value) -> str:
+    """Format a value for a Markdown table cell."""
+    return str(value).replace('|', '\\|').replace('\n', ' ')
+
+
+def markdown_table(header: str, counts: Iterable[Tuple[object, int]]) -> Iterator[str]:
+    """
+    Yield the lines of a two-column Markdown table of answer counts.
+    
+    Args:
+        header (str): Heading of the answer column
+        counts (Iterable[Tuple[object, int]]): (answer, count) pairs
+    
+    Yields:
+        str: Table lines
+    """
+    yield f"| {_cell(header)} | count |"
+    yield "|:--|--:|"
+    for value, count in counts:
+        yield f"| {_cell(value)} | {count} |"
+
+
+def bullet_list(counts: List[Tuple[object, int]], limit: int = SPECIAL_NEEDS_LIMIT) -> Iterator[str]:
+    """
+    Yield free-text answers as a Markdown list with their counts.
+    
+    Args:
+        counts (List[Tuple[object, int]]): (answer, count) pairs, most common first
+        limit (int): Maximum answers listed
+    
+    Yields:
+        str: List lines
+    """
+    if not counts:
+        yield "- None reported"
+        return
+    
+    for value, count in counts[:limit]:
+        yield f"- {_cell(value)}" + (f" ({count})" if count > 1 else "")
+    if len(counts) > limit:
+        remaining = sum(count for _, count in counts[limit:])
+        yield f"- ...and {len(counts) - limit} more ({remaining} registrations); see the registration export"
+
+
+def render_report(template: str, fields: Dict, blocks: Dict[str, Iterable[str]], output_file: str) -> str:
+    """
+    Render a report template line by line, writing each line as it is produced.
+    
+    Args:
+        template (str): Markdown template
+        fields (Dict): Values substituted for ``$name`` inside lines
+        blocks (Dict[str, Iterable[str]]): Lines written in place of a placeholder alone on its line
+        output_file (str): Output Markdown file
+    
+    Returns:
+        str: Path to the written report
+    """
+    with open(output_file, 'w') as f:
+        for line in template.splitlines(keepends=True):
+            placeholder = line.strip()
+            if placeholder.startswith('$') and placeholder[1:] in blocks:
+                for block_line in blocks[placeholder[1:]]:
+                    f.write(block_line + '\n')
+            else:
+                f.write(Template(line).safe_substitute(fields))
+    return output_file
+
+
+def event_barcode_summary(event: Dict) -> str:
+    """Describe the event barcodes generated for an event, e.g. '3 types (Event ID, Venue, Date)'."""
+    types = ['Event ID'] + [name for name, field in (('Venue', 'venue_code'), ('Date', 'date_code')) if event[field]]
+    return f"{len(types)} type{'s' if len(types) > 1 else ''} ({', '.join(types)})"
+
+
+def write_registration_report(aggregates: Dict, output_file: str, template: str = REGISTRATION_REPORT_TEMPLATE,
+                              event_code: str = DEFAULT_EVENT_CODE) -> str:
+    """
+    Render precomputed aggregates into a Markdown report.
+    
+    Args:
+        aggregates (Dict): Result of compute_aggregates
+        output_file (str): Output Markdown file
+        template (str): Report template
+        event_code (str): Event whose details head the report (see EVENT_CODES)
+    
+    Returns:
+        str: Path to the written report
+    """
+    event = event_details(event_code)
+    lookups = {key: dict(aggregates[key]) for key in ('dietary', 'accommodation', 'transportation')}
+    unanswered_dietary = aggregates['total'] - aggregates['answered']['dietary'] if aggregates['dietary'] else 0
+    fields = {
+        'generated_on': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'total': aggregates['total'],
+        'first_registration': aggregates['first_registration'],
+        'last_registration': aggregates['last_registration'],
+        'standard_meals': lookups['dietary'].get(STANDARD_MEAL_ANSWER, 0) + unanswered_dietary,
+        'accommodation_requests': lookups['accommodation'].get(ACCOMMODATION_ANSWER, 0),
+        'airport_pickups': lookups['transportation'].get(AIRPORT_PICKUP_ANSWER, 0),
+        'event_short_name': event['short_name'],
+        'event_name': f"{event['name']} - {event['theme']}" if event['theme'] else event['name'],
+        'event_date': event['full_date'],
+        'event_venue': event['venue'],
+        'event_barcodes': event_barcode_summary(event)
+    }
+    
+    blocks = {}
+    for key, column in COUNTED_COLUMNS.items():
+        if key == 'special_needs':
+            blocks[key] = bullet_list(aggregates[key])
+        else:
+            blocks[key] = markdown_table(column, aggregates[key][:TOP_ROWS.get(key)])
+    blocks['sessions_pairs'] = markdown_table('Sessions', [(f"{first} + {second}", count) for first, second, count
+                                                           in aggregates.get('sessions_pairs', [])])
+    
+    return render_report(template, fields, blocks, output_file)
+
+
+def generate_registration_report(data_file: str, output_file: str, template: str = REGISTRATION_REPORT_TEMPLATE,
+                                 event_code: str = DEFAULT_EVENT_CODE) -> str:
+    """
+    Load a registration export and write its report.
+    
+    Args:
+        data_file (str): Registration data (CSV, Parquet or Feather), or a dataset directory
+            partitioned by event, of which only the event's partition is read
+        output_file (str): Output Markdown file
+        template (str): Report template
+        event_code (str): Event reported on (see EVENT_CODES)
+    
+    Returns:
+        str: Path to the written report
+    """
+    df = read_table(data_file, REGISTRATION_REPORT_COLUMNS, REGISTRATION_CATEGORICAL_COLUMNS, partitions=[event_code])
+    return write_registration_report(compute_aggregates(df), output_file, template, event_code)